@@ -0,0 +1,160 @@
+import random
+import time
+from functools import lru_cache
+import matplotlib.pyplot as plt
+from lru_cache import LRUCache
+from lfu_cache import LFUCache
+
+KEYS = 100000
+OPS = 200000
+MISS = object()
+
+
+def zipf_trace(n_keys, ops, s, seed=0):
+    # key k (1-based) is requested with probability proportional to 1/k^s
+    rng = random.Random(seed)
+    cum_weights = []
+    total = 0.0
+    for k in range(1, n_keys + 1):
+        total += 1.0 / k ** s
+        cum_weights.append(total)
+    keys = rng.choices(range(n_keys), cum_weights=cum_weights, k=ops)
+    # shuffle the ranks so popular keys aren't simply the small integers
+    perm = list(range(n_keys))
+    rng.shuffle(perm)
+    return [perm[k] for k in keys]
+
+
+def replay(cache, trace):
+    # read-through: a miss loads the key into the cache
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key, MISS) is MISS:
+            cache.put(key, key)
+    elapsed = time.perf_counter() - start
+    return len(trace) / elapsed, cache.hit_rate()
+
+
+def replay_functools(capacity, trace):
+    # baseline: the C-implemented functools.lru_cache around an identity load
+    @lru_cache(maxsize=capacity)
+    def load(key):
+        return key
+
+    start = time.perf_counter()
+    for key in trace:
+        load(key)
+    elapsed = time.perf_counter() - start
+    info = load.cache_info()
+    return len(trace) / elapsed, info.hits / (info.hits + info.misses)
+
+
+POLICIES = [
+    ('LRUCache', lambda capacity, trace: replay(LRUCache(capacity), trace)),
+    ('LFUCache', lambda capacity, trace: replay(LFUCache(capacity), trace)),
+    ('functools.lru_cache', replay_functools),
+]
+
+
+def benchmark_capacity():
+    print("Benchmarking cache capacity (Zipf s=1.0)...")
+    capacities = [100, 500, 1000, 5000, 10000, 50000]
+    trace = zipf_trace(KEYS, OPS, 1.0)
+    results = {}
+
+    for name, run in POLICIES:
+        ops_per_sec, hit_rates = [], []
+        for capacity in capacities:
+            ops, hit_rate = run(capacity, trace)
+            ops_per_sec.append(ops / 1000)
+            hit_rates.append(hit_rate * 100)
+            print(f"  {name}, capacity {capacity}: {ops / 1000:.0f}K ops/sec, {hit_rate * 100:.1f}% hit rate")
+        results[name] = (ops_per_sec, hit_rates)
+
+    return capacities, results
+
+
+def benchmark_skew():
+    print("\nBenchmarking key skew (capacity 1000)...")
+    skews = [0.6, 0.8, 1.0, 1.2, 1.4]
+    capacity = 1000
+    results = {}
+
+    traces = [zipf_trace(KEYS, OPS, s) for s in skews]
+    for name, run in POLICIES:
+        ops_per_sec, hit_rates = [], []
+        for s, trace in zip(skews, traces):
+            ops, hit_rate = run(capacity, trace)
+            ops_per_sec.append(ops / 1000)
+            hit_rates.append(hit_rate * 100)
+            print(f"  {name}, s={s}: {ops / 1000:.0f}K ops/sec, {hit_rate * 100:.1f}% hit rate")
+        results[name] = (ops_per_sec, hit_rates)
+
+    return skews, results
+
+
+def benchmark_shifting_hot_set():
+    print("\nBenchmarking shifting hot set (capacity 1000)...")
+    # the popular keys change halfway through, LFU keeps the stale ones
+    first = zipf_trace(KEYS, OPS // 2, 1.0, seed=1)
+    second = zipf_trace(KEYS, OPS // 2, 1.0, seed=2)
+    trace = first + second
+    results = {}
+
+    for name, run in POLICIES:
+        ops, hit_rate = run(1000, trace)
+        results[name] = hit_rate * 100
+        print(f"  {name}: {ops / 1000:.0f}K ops/sec, {hit_rate * 100:.1f}% hit rate")
+
+    return results
+
+
+def plot_results():
+    fig, ((ax1, ax2), (ax3, ax4), (ax5, _)) = plt.subplots(3, 2, figsize=(14, 12))
+
+    # Capacity - hit rate grows with capacity, cost per op should stay flat
+    capacities, results = benchmark_capacity()
+    for name, (ops_per_sec, hit_rates) in results.items():
+        ax1.plot(capacities, ops_per_sec, marker='o', label=name)
+        ax2.plot(capacities, hit_rates, marker='o', label=name)
+    ax1.set_title('Throughput vs Capacity (Should be flat, O(1) per op)')
+    ax1.set_xlabel('Capacity')
+    ax1.set_ylabel('K ops/sec')
+    ax1.set_xscale('log')
+    ax2.set_title('Hit Rate vs Capacity (Zipf s=1.0)')
+    ax2.set_xlabel('Capacity')
+    ax2.set_ylabel('Hit rate (%)')
+    ax2.set_xscale('log')
+
+    # Skew - more skewed traces are easier to cache
+    skews, results = benchmark_skew()
+    for name, (ops_per_sec, hit_rates) in results.items():
+        ax3.plot(skews, ops_per_sec, marker='o', label=name)
+        ax4.plot(skews, hit_rates, marker='o', label=name)
+    ax3.set_title('Throughput vs Zipf Skew (capacity 1000)')
+    ax3.set_xlabel('Zipf s')
+    ax3.set_ylabel('K ops/sec')
+    ax4.set_title('Hit Rate vs Zipf Skew (capacity 1000)')
+    ax4.set_xlabel('Zipf s')
+    ax4.set_ylabel('Hit rate (%)')
+
+    # Shifting hot set
+    results = benchmark_shifting_hot_set()
+    ax5.bar(range(len(results)), list(results.values()), color=['b', 'r', 'g'])
+    ax5.set_xticks(range(len(results)))
+    ax5.set_xticklabels(list(results))
+    ax5.set_title('Hit Rate with a Shifting Hot Set')
+    ax5.set_ylabel('Hit rate (%)')
+
+    for ax in (ax1, ax2, ax3, ax4):
+        ax.legend()
+        ax.grid(True)
+    ax5.grid(True, axis='y')
+
+    plt.tight_layout()
+    plt.savefig('cache_benchmarks.png', dpi=150, bbox_inches='tight')
+    print("\nBenchmark plot saved as 'cache_benchmarks.png'")
+
+
+if __name__ == "__main__":
+    plot_results()
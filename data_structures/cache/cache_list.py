@@ -0,0 +1,65 @@
+class CacheNode:
+    __slots__ = ('key', 'val', 'freq', 'prev', 'next')
+
+    def __init__(self, key=None, val=None):
+        self.key = key
+        self.val = val
+        self.freq = 1
+        self.prev = None
+        self.next = None
+
+
+class CacheList:
+    def __init__(self):
+        # circular doubly linked list around one sentinel, the same layout
+        # as DoublyLinkedList; the caches keep the nodes in a dict so any
+        # node can be unlinked in O(1)
+        self.head = CacheNode()
+        self.head.prev = self.head
+        self.head.next = self.head
+        self._size = 0
+
+    def push_front(self, node):
+        """Link node in as the most recently used entry"""
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+        self._size += 1
+
+    def remove(self, node):
+        """Unlink node from the list"""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self._size -= 1
+
+    def move_to_front(self, node):
+        """Make node the most recently used entry"""
+        if self.head.next is not node:
+            self.remove(node)
+            self.push_front(node)
+
+    def pop_back(self):
+        """Unlink and return the least recently used node. Raise exception if empty."""
+        if self._size == 0:
+            raise IndexError
+        node = self.head.prev
+        self.remove(node)
+        return node
+
+    def size(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        # nodes from most to least recently used
+        node = self.head.next
+        while node is not self.head:
+            yield node
+            node = node.next
@@ -0,0 +1,83 @@
+from cache_list import CacheList, CacheNode
+
+
+class LFUCache:
+    def __init__(self, capacity):
+        # one recency list per use count plus the smallest count in use,
+        # so get/put/evict are all O(1); ties within the least frequently
+        # used bucket are broken by evicting the least recently used
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._nodes = {}
+        self._buckets = {}
+        self._min_freq = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value and count the use, or default"""
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.val
+
+    def put(self, key, val):
+        """Insert or update key, evicting the least frequently used entry if full"""
+        node = self._nodes.get(key)
+        if node is not None:
+            node.val = val
+            self._touch(node)
+            return
+
+        if len(self._nodes) >= self.capacity:
+            bucket = self._buckets[self._min_freq]
+            evicted = bucket.pop_back()
+            if bucket.is_empty():
+                del self._buckets[self._min_freq]
+            del self._nodes[evicted.key]
+            self.evictions += 1
+
+        node = CacheNode(key, val)
+        self._nodes[key] = node
+        self._bucket(1).push_front(node)
+        self._min_freq = 1
+
+    def frequency(self, key):
+        """Use count of a cached key. Raise exception if not cached."""
+        return self._nodes[key].freq
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def size(self):
+        return len(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        # a membership check doesn't count as a use
+        return key in self._nodes
+
+    def _touch(self, node):
+        # move node up to the next use count's bucket
+        bucket = self._buckets[node.freq]
+        bucket.remove(node)
+        if bucket.is_empty():
+            del self._buckets[node.freq]
+            if self._min_freq == node.freq:
+                self._min_freq += 1
+        node.freq += 1
+        self._bucket(node.freq).push_front(node)
+
+    def _bucket(self, freq):
+        bucket = self._buckets.get(freq)
+        if bucket is None:
+            bucket = self._buckets[freq] = CacheList()
+        return bucket
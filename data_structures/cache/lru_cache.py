@@ -0,0 +1,59 @@
+from cache_list import CacheList, CacheNode
+
+
+class LRUCache:
+    def __init__(self, capacity):
+        # dict for O(1) lookup, recency list for O(1) reorder and eviction
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._nodes = {}
+        self._order = CacheList()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value and mark it most recently used, or default"""
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.val
+
+    def put(self, key, val):
+        """Insert or update key, evicting the least recently used entry if full"""
+        node = self._nodes.get(key)
+        if node is not None:
+            node.val = val
+            self._order.move_to_front(node)
+            return
+
+        if len(self._nodes) >= self.capacity:
+            evicted = self._order.pop_back()
+            del self._nodes[evicted.key]
+            self.evictions += 1
+
+        node = CacheNode(key, val)
+        self._nodes[key] = node
+        self._order.push_front(node)
+
+    def keys(self):
+        """Keys from most to least recently used"""
+        return [node.key for node in self._order]
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def size(self):
+        return len(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        # a membership check doesn't count as a use
+        return key in self._nodes
@@ -0,0 +1,129 @@
+from lfu_cache import LFUCache
+
+
+def test_get_and_put():
+    """Test basic get/put and miss defaults"""
+    cache = LFUCache(2)
+    assert cache.get('a') is None
+    assert cache.get('a', -1) == -1
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    assert cache.get('b') == 2
+    assert len(cache) == 2
+    assert 'a' in cache and 'c' not in cache
+
+    cache.put('a', 10)
+    assert cache.get('a') == 10
+    assert cache.size() == 2
+
+
+def test_frequency_tracking():
+    """Test get and put both count as a use"""
+    cache = LFUCache(3)
+    cache.put('a', 1)
+    assert cache.frequency('a') == 1
+    cache.get('a')
+    cache.put('a', 2)
+    assert cache.frequency('a') == 3
+
+    # membership checks and misses don't count
+    'a' in cache
+    cache.get('zzz')
+    assert cache.frequency('a') == 3
+
+    try:
+        cache.frequency('zzz')
+        assert False, "Should raise KeyError"
+    except KeyError:
+        pass
+
+
+def test_eviction_order():
+    """Test the least frequently used entry is evicted, oldest first on ties"""
+    cache = LFUCache(3)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    # c has the lowest count
+    cache.put('d', 4)
+    assert 'c' not in cache
+
+    # d (count 1) goes next, even though it's the newest
+    cache.put('e', 5)
+    assert 'd' not in cache
+    assert 'a' in cache and 'b' in cache
+
+    # b and e tie at count 2 after this, b was used longer ago
+    cache.get('e')
+    cache.put('f', 6)
+    assert 'b' not in cache
+    assert sorted(cache._nodes) == ['a', 'e', 'f']
+
+
+def test_counters():
+    """Test hit/miss/eviction counters and hit rate"""
+    cache = LFUCache(1)
+    assert cache.hit_rate() == 0.0
+    cache.put(1, 1)
+    cache.get(1)     # hit
+    cache.get(2)     # miss
+    cache.put(2, 2)  # evicts 1
+    cache.get(1)     # miss
+    cache.get(2)     # hit
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert cache.evictions == 1
+    assert cache.hit_rate() == 0.5
+
+    for capacity in [0, -3]:
+        try:
+            LFUCache(capacity)
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+
+def test_against_reference():
+    """Test a random trace against a brute-force LFU"""
+    import random
+
+    rng = random.Random(29)
+    cache = LFUCache(8)
+    # key -> [value, count, last use]
+    reference = {}
+    for step in range(5000):
+        key = rng.randrange(20)
+        if rng.random() < 0.5:
+            if key in reference:
+                reference[key][1] += 1
+                reference[key][2] = step
+                assert cache.get(key) == reference[key][0]
+            else:
+                assert cache.get(key) is None
+        else:
+            if key in reference:
+                reference[key][0] = step
+                reference[key][1] += 1
+                reference[key][2] = step
+            else:
+                if len(reference) >= 8:
+                    victim = min(reference, key=lambda k: (reference[k][1], reference[k][2]))
+                    del reference[victim]
+                reference[key] = [step, 1, step]
+            cache.put(key, step)
+        assert sorted(cache._nodes) == sorted(reference)
+
+
+if __name__ == "__main__":
+    test_get_and_put()
+    test_frequency_tracking()
+    test_eviction_order()
+    test_counters()
+    test_against_reference()
+    print("All tests passed!")
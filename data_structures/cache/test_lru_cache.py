@@ -0,0 +1,118 @@
+from lru_cache import LRUCache
+
+
+def test_get_and_put():
+    """Test basic get/put and miss defaults"""
+    cache = LRUCache(2)
+    assert cache.get('a') is None
+    assert cache.get('a', -1) == -1
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    assert cache.get('b') == 2
+    assert len(cache) == 2
+    assert 'a' in cache and 'c' not in cache
+
+    # Updating a key keeps the size
+    cache.put('a', 10)
+    assert cache.get('a') == 10
+    assert cache.size() == 2
+
+    # A cached None is a hit, not a miss
+    cache.put('b', None)
+    hits = cache.hits
+    assert cache.get('b', -1) is None
+    assert cache.hits == hits + 1
+
+
+def test_eviction_order():
+    """Test the least recently used entry is evicted"""
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache.put(key, key.upper())
+    assert cache.keys() == ['c', 'b', 'a']
+
+    # get and put both count as a use
+    cache.get('a')
+    cache.put('b', 'B2')
+    assert cache.keys() == ['b', 'a', 'c']
+
+    cache.put('d', 'D')
+    assert 'c' not in cache
+    assert cache.keys() == ['d', 'b', 'a']
+
+    # membership checks don't change the order
+    assert 'a' in cache
+    cache.put('e', 'E')
+    assert 'a' not in cache
+    assert cache.keys() == ['e', 'd', 'b']
+
+
+def test_counters():
+    """Test hit/miss/eviction counters and hit rate"""
+    cache = LRUCache(2)
+    assert cache.hit_rate() == 0.0
+
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.get(1)     # hit
+    cache.get(3)     # miss
+    cache.put(3, 3)  # evicts 2
+    cache.get(2)     # miss
+    cache.put(2, 2)  # evicts 1
+    cache.get(3)     # hit
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert cache.evictions == 2
+    assert cache.hit_rate() == 0.5
+
+
+def test_single_slot_and_bad_capacity():
+    """Test capacity 1 and non-positive capacities"""
+    cache = LRUCache(1)
+    for i in range(10):
+        cache.put(i, i)
+        assert cache.get(i) == i
+        assert len(cache) == 1
+    assert cache.evictions == 9
+
+    for capacity in [0, -1]:
+        try:
+            LRUCache(capacity)
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+
+def test_against_reference():
+    """Test a random trace against an OrderedDict-based reference"""
+    import random
+    from collections import OrderedDict
+
+    rng = random.Random(19)
+    cache = LRUCache(16)
+    reference = OrderedDict()
+    for step in range(5000):
+        key = rng.randrange(40)
+        if rng.random() < 0.5:
+            expected = reference.get(key)
+            if key in reference:
+                reference.move_to_end(key)
+            assert cache.get(key) == expected
+        else:
+            reference[key] = step
+            reference.move_to_end(key)
+            if len(reference) > 16:
+                reference.popitem(last=False)
+            cache.put(key, step)
+    assert cache.keys() == list(reversed(reference))
+
+
+if __name__ == "__main__":
+    test_get_and_put()
+    test_eviction_order()
+    test_counters()
+    test_single_slot_and_bad_capacity()
+    test_against_reference()
+    print("All tests passed!")
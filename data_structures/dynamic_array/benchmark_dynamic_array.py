@@ -1,6 +1,16 @@
+import multiprocessing
+import os
+import resource
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
-from dynamic_array import DynamicArray
+import psutil
+from dynamic_array import (DynamicArray, grow_double, grow_one_and_half,
+                           grow_cpython, grow_fixed_chunk)
+from gap_buffer import GapBuffer
+from tiered_array import TieredArray
+from numpy_dynamic_array import NumpyDynamicArray, np
 
 
 def time_operation(func, *args):
@@ -56,44 +66,364 @@ def benchmark_get():
     return sizes, times
 
 
+def loop_insert(arr, index, item):
+    """Reference per-element shift, the way insert worked before memmove"""
+    if arr._size + 1 > arr._capacity:
+        arr._resize(2 * arr._capacity)
+    for i in range(arr._size - 1, index - 1, -1):
+        arr._data[i + 1] = arr._data[i]
+    arr._size += 1
+    arr._data[index] = item
+
+
+def loop_delete(arr, index):
+    """Reference per-element shift, the way delete worked before memmove"""
+    for i in range(index, arr._size - 1):
+        arr._data[i] = arr._data[i + 1]
+    arr._size -= 1
+
+
+def filled_array(size):
+    arr = DynamicArray()
+    for i in range(size):
+        arr.append(i)
+    return arr
+
+
+BATCH = 100
+
+
 def benchmark_insert():
     print("\nBenchmarking insert at beginning...")
-    sizes = [1000, 2000, 3000, 4000, 5000]
-    times = []
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    results = {'loop': [], 'memmove': [], f'{BATCH}x insert': [], 'insert_many': []}
 
     for size in sizes:
-        arr = DynamicArray()
-        for i in range(size):
-            arr.append(i)
-
         # Insert at beginning (worst case)
-        elapsed, _ = time_operation(arr.insert, 0, 999)
-        times.append(elapsed * 1000000)
-        print(f"Size {size}: {elapsed * 1000000:.2f} μs to insert at beginning")
+        elapsed, _ = time_operation(loop_insert, filled_array(size), 0, 999)
+        results['loop'].append(elapsed * 1000000)
 
-    return sizes, times
+        elapsed, _ = time_operation(filled_array(size).insert, 0, 999)
+        results['memmove'].append(elapsed * 1000000)
+
+        # A batch either shifts the tail once per item or once in total
+        arr = filled_array(size)
+        start = time.perf_counter()
+        for i in range(BATCH):
+            arr.insert(0, i)
+        results[f'{BATCH}x insert'].append((time.perf_counter() - start) * 1000000)
+
+        elapsed, _ = time_operation(filled_array(size).insert_many, 0, range(BATCH))
+        results['insert_many'].append(elapsed * 1000000)
+
+        print(f"Size {size}: " + ", ".join(f"{name} {times[-1]:.2f} μs" for name, times in results.items()))
+
+    return sizes, results
 
 
 def benchmark_delete():
     print("\nBenchmarking delete from beginning...")
-    sizes = [1000, 2000, 3000, 4000, 5000]
-    times = []
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    results = {'loop': [], 'memmove': [], f'{BATCH}x delete': [], 'delete_range': []}
 
     for size in sizes:
+        # Delete from beginning (worst case)
+        elapsed, _ = time_operation(loop_delete, filled_array(size), 0)
+        results['loop'].append(elapsed * 1000000)
+
+        elapsed, _ = time_operation(filled_array(size).delete, 0)
+        results['memmove'].append(elapsed * 1000000)
+
+        arr = filled_array(size)
+        start = time.perf_counter()
+        for i in range(BATCH):
+            arr.delete(0)
+        results[f'{BATCH}x delete'].append((time.perf_counter() - start) * 1000000)
+
+        elapsed, _ = time_operation(filled_array(size).delete_range, 0, BATCH)
+        results['delete_range'].append(elapsed * 1000000)
+
+        print(f"Size {size}: " + ", ".join(f"{name} {times[-1]:.2f} μs" for name, times in results.items()))
+
+    return sizes, results
+
+
+def benchmark_bulk_construction():
+    print("\nBenchmarking bulk construction...")
+    sizes = [10000, 50000, 100000, 500000, 1000000]
+    results = {'append loop': [], 'extend': [], 'from_iterable': [], 'from_iterable (generator)': []}
+
+    def append_loop(values):
         arr = DynamicArray()
-        for i in range(size):
-            arr.append(i)
+        for v in values:
+            arr.append(v)
+        return arr
 
-        # Delete from beginning (worst case)
-        elapsed, _ = time_operation(arr.delete, 0)
-        times.append(elapsed * 1000000)
-        print(f"Size {size}: {elapsed * 1000000:.2f} μs to delete from beginning")
+    def extend(values):
+        arr = DynamicArray()
+        arr.extend(values)
+        return arr
+
+    for size in sizes:
+        values = list(range(size))
+
+        elapsed, _ = time_operation(append_loop, values)
+        results['append loop'].append(elapsed / size * 1000000)
+
+        elapsed, _ = time_operation(extend, values)
+        results['extend'].append(elapsed / size * 1000000)
+
+        elapsed, _ = time_operation(DynamicArray.from_iterable, values)
+        results['from_iterable'].append(elapsed / size * 1000000)
+
+        elapsed, _ = time_operation(DynamicArray.from_iterable, (v for v in values))
+        results['from_iterable (generator)'].append(elapsed / size * 1000000)
+
+        print(f"Size {size}: " + ", ".join(f"{name} {times[-1]:.3f} μs" for name, times in results.items()) + " per element")
+
+    return sizes, results
 
-    return sizes, times
+
+def edit_positions(size, num_edits, pattern):
+    """Yield (index, is_insert) edits; local edits wander around one cursor"""
+    import random
+    cursor = size // 2
+    for i in range(num_edits):
+        if pattern == 'local':
+            cursor = min(max(cursor + random.randint(-8, 8), 0), size)
+        else:
+            cursor = random.randint(0, size)
+        # alternate so the size stays around the starting size
+        is_insert = i % 2 == 0
+        yield (cursor if is_insert else min(cursor, size - 1)), is_insert
+        size += 1 if is_insert else -1
+
+
+def benchmark_edit_patterns():
+    print("\nBenchmarking cursor-local vs random edits...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    num_edits = 2000
+    results = {}
+
+    for name, cls in [('DynamicArray', DynamicArray), ('GapBuffer', GapBuffer)]:
+        for pattern in ['local', 'random']:
+            times = results[f'{name} ({pattern})'] = []
+            for size in sizes:
+                arr = cls()
+                for i in range(size):
+                    arr.append(i)
+                edits = list(edit_positions(size, num_edits, pattern))
+
+                start = time.perf_counter()
+                for index, is_insert in edits:
+                    if is_insert:
+                        arr.insert(index, 0)
+                    else:
+                        arr.delete(index)
+                avg_time = (time.perf_counter() - start) / num_edits
+                times.append(avg_time * 1000000)
+                print(f"Size {size}: {avg_time * 1000000:.2f} μs per edit ({name}, {pattern})")
+
+    return sizes, results
+
+
+def benchmark_random_insert_crossover():
+    print("\nBenchmarking random inserts: flat vs tiered...")
+    import random
+    sizes = [1000, 10000, 100000, 1000000, 10000000]
+    num_inserts = 1000
+    results = {'DynamicArray': [], 'TieredArray': []}
+
+    for size in sizes:
+        positions = [random.randint(0, size + i) for i in range(num_inserts)]
+        for name, cls in [('DynamicArray', DynamicArray), ('TieredArray', TieredArray)]:
+            arr = cls.from_iterable(range(size))
+
+            start = time.perf_counter()
+            for index in positions:
+                arr.insert(index, 0)
+            avg_time = (time.perf_counter() - start) / num_inserts
+            results[name].append(avg_time * 1000000)
+            print(f"Size {size:,}: {avg_time * 1000000:.2f} μs per random insert ({name})")
+            del arr
+
+    return sizes, results
+
+
+def benchmark_reductions():
+    print("\nBenchmarking sum/min/max/cumsum...")
+    sizes = [10000, 100000, 1000000]
+    modes = [('get(i) loop', lambda: DynamicArray()),
+             ('list', lambda: DynamicArray()),
+             ('typed', lambda: DynamicArray('q'))]
+    if np is not None:
+        modes.append(('numpy', lambda: NumpyDynamicArray('q')))
+    else:
+        print("NumPy not installed, skipping the vectorized mode")
+
+    def get_loop(arr):
+        total = 0
+        lo = hi = arr.get(0)
+        prefix = []
+        for i in range(arr.size()):
+            x = arr.get(i)
+            total += x
+            lo = min(lo, x)
+            hi = max(hi, x)
+            prefix.append(total)
+        return total, lo, hi, prefix
+
+    def reductions(arr):
+        return arr.sum(), arr.min(), arr.max(), arr.cumsum()
+
+    results = {name: [] for name, _ in modes}
+    for size in sizes:
+        for name, factory in modes:
+            arr = factory()
+            arr.extend(range(size))
+            func = get_loop if name == 'get(i) loop' else reductions
+            elapsed, _ = time_operation(func, arr)
+            results[name].append(elapsed / size * 1000000000)
+            print(f"Size {size}: {elapsed / size * 1000000000:.1f} ns per element ({name})")
+
+    return sizes, results
+
+
+def get_size(arr):
+    """Approximate bytes held by the array: backing store plus boxed elements"""
+    size = sys.getsizeof(arr) + sys.getsizeof(arr._data)
+    if isinstance(arr._data, list):
+        # a list only stores pointers, every element is a separate object
+        for i in range(arr.size()):
+            size += sys.getsizeof(arr._data[i])
+    return size
+
+
+def benchmark_memory():
+    print("\nBenchmarking memory per element...")
+    sizes = [10000, 50000, 100000, 500000, 1000000]
+    modes = [('list', None), ('int64', 'q'), ('float64', 'd')]
+    results = {name: [] for name, _ in modes}
+
+    for size in sizes:
+        for name, typecode in modes:
+            arr = DynamicArray(typecode)
+            # avoid small int caching so list mode pays for real int objects
+            for i in range(size):
+                arr.append(float(i + 1000) if typecode == 'd' else i + 1000)
+
+            per_element = get_size(arr) / size
+            results[name].append(per_element)
+            print(f"Size {size}: {per_element:.2f} bytes/element ({name})")
+
+    return sizes, results
+
+
+def get_memory_usage():
+    """Get current memory usage in MB"""
+    process = psutil.Process(os.getpid())
+    return process.memory_info().rss / 1024 / 1024
+
+
+POLICIES = [
+    ('double', grow_double),
+    ('1.5x', grow_one_and_half),
+    ('cpython', grow_cpython),
+    ('chunk 64K', grow_fixed_chunk(65536)),
+]
+
+
+def reset_peak_memory_usage():
+    """Reset the peak RSS high-water mark (Linux only)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def get_peak_memory_usage():
+    """Get peak memory usage of this process in MB since the last reset"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # no /proc: fall back to the lifetime peak (ru_maxrss is KB on Linux)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def in_fresh_process(func, *args):
+    """Run func in a new interpreter so earlier runs can't skew its RSS"""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(func, *args).result()
+
+
+def measure_growth(policy_index, size):
+    _, growth = POLICIES[policy_index]
+    # imports peak higher than the array itself, so start a fresh mark
+    reset_peak_memory_usage()
+    baseline = get_memory_usage()
+
+    arr = DynamicArray('q', growth=growth)
+    start = time.perf_counter()
+    for i in range(size):
+        arr.append(i)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'peak_mb': get_peak_memory_usage() - baseline,
+        'resizes': arr._resize_count,
+        'slack': arr._capacity / size,
+        'append_us': elapsed / size * 1000000,
+    }
+
+
+def benchmark_growth_policies():
+    print("\nBenchmarking growth policies...")
+    size = 2000000
+    results = {}
+
+    for i, (name, _) in enumerate(POLICIES):
+        r = in_fresh_process(measure_growth, i, size)
+        results[name] = r
+        print(f"  {name:10}: peak {r['peak_mb']:.1f} MB, {r['resizes']} resizes (copies), "
+              f"capacity {r['slack']:.2f}x size, {r['append_us']:.3f} μs per append")
+
+    return results
+
+
+def measure_spike_and_drain(shrink, size):
+    baseline = get_memory_usage()
+
+    arr = DynamicArray('q', shrink=shrink)
+    for i in range(size):
+        arr.append(i)
+    spiked = get_memory_usage() - baseline
+
+    # drain from the back in batches, leaving 1% behind
+    while arr.size() > size // 100:
+        arr.delete_range(max(arr.size() - 10000, size // 100), arr.size())
+    drained = get_memory_usage() - baseline
+
+    return spiked, drained, arr._capacity, arr.size()
+
+
+def benchmark_spike_and_drain():
+    print("\nBenchmarking spike and drain...")
+    size = 2000000
+
+    for shrink in [False, True]:
+        spiked, drained, capacity, remaining = in_fresh_process(measure_spike_and_drain, shrink, size)
+        print(f"  shrink={shrink}: {spiked:.1f} MB after spike, {drained:.1f} MB after drain, "
+              f"capacity {capacity:,} for {remaining:,} elements")
 
 
 def plot_results():
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    fig, ((ax1, ax2), (ax3, ax4), (ax5, ax6), (ax7, ax8), (ax9, ax10)) = plt.subplots(5, 2, figsize=(12, 22))
 
     # Append
     sizes, times = benchmark_append()
@@ -112,21 +442,97 @@ def plot_results():
     ax2.grid(True)
 
     # Insert
-    sizes, times = benchmark_insert()
-    ax3.plot(sizes, times, 'r-o')
+    sizes, results = benchmark_insert()
+    for (name, times), style in zip(results.items(), ['r-o', 'b-s', 'm-^', 'g-d']):
+        ax3.plot(sizes, times, style, label=name)
     ax3.set_title('Insert at Beginning (Should be O(n))')
     ax3.set_xlabel('Array Size')
     ax3.set_ylabel('Time to insert (μs)')
+    ax3.set_yscale('log')
+    ax3.legend()
     ax3.grid(True)
 
     # Delete
-    sizes, times = benchmark_delete()
-    ax4.plot(sizes, times, 'm-o')
+    sizes, results = benchmark_delete()
+    for (name, times), style in zip(results.items(), ['r-o', 'b-s', 'm-^', 'g-d']):
+        ax4.plot(sizes, times, style, label=name)
     ax4.set_title('Delete from Beginning (Should be O(n))')
     ax4.set_xlabel('Array Size')
     ax4.set_ylabel('Time to delete (μs)')
+    ax4.set_yscale('log')
+    ax4.legend()
     ax4.grid(True)
 
+    # Memory
+    sizes, results = benchmark_memory()
+    for (name, per_element), style in zip(results.items(), ['b-o', 'r-s', 'g-^']):
+        ax5.plot(sizes, per_element, style, label=name)
+    ax5.set_title('Memory per Element (list vs typed storage)')
+    ax5.set_xlabel('Array Size')
+    ax5.set_ylabel('Bytes per element')
+    ax5.set_xscale('log')
+    ax5.legend()
+    ax5.grid(True)
+
+    # Growth policies
+    results = benchmark_growth_policies()
+    names = list(results.keys())
+    ax6.bar(names, [r['peak_mb'] for r in results.values()], color=['blue', 'red', 'green', 'magenta'], alpha=0.7)
+    for i, r in enumerate(results.values()):
+        ax6.text(i, r['peak_mb'], f"{r['resizes']} copies", ha='center', va='bottom')
+    ax6.set_title('Peak RSS Growing to 2M int64 by Policy')
+    ax6.set_ylabel('Peak RSS (MB)')
+    ax6.grid(True, alpha=0.3)
+
+    benchmark_spike_and_drain()
+
+    # Bulk construction
+    sizes, results = benchmark_bulk_construction()
+    for (name, times), style in zip(results.items(), ['r-o', 'b-s', 'g-^', 'm-d']):
+        ax7.plot(sizes, times, style, label=name)
+    ax7.set_title('Building from an Iterable')
+    ax7.set_xlabel('Array Size')
+    ax7.set_ylabel('Time per element (μs)')
+    ax7.set_xscale('log')
+    ax7.set_yscale('log')
+    ax7.legend()
+    ax7.grid(True)
+
+    # Gap buffer
+    sizes, results = benchmark_edit_patterns()
+    for (name, times), style in zip(results.items(), ['r-o', 'r--s', 'b-o', 'b--s']):
+        ax8.plot(sizes, times, style, label=name)
+    ax8.set_title('Edits: Cursor-Local vs Random Positions')
+    ax8.set_xlabel('Array Size')
+    ax8.set_ylabel('Time per edit (μs)')
+    ax8.set_yscale('log')
+    ax8.legend()
+    ax8.grid(True)
+
+    # Tiered array
+    sizes, results = benchmark_random_insert_crossover()
+    for (name, times), style in zip(results.items(), ['r-o', 'b-s']):
+        ax9.plot(sizes, times, style, label=name)
+    ax9.set_title('Random-Position Insert: Flat vs Tiered')
+    ax9.set_xlabel('Array Size')
+    ax9.set_ylabel('Time per insert (μs)')
+    ax9.set_xscale('log')
+    ax9.set_yscale('log')
+    ax9.legend()
+    ax9.grid(True)
+
+    # Reductions
+    sizes, results = benchmark_reductions()
+    for (name, times), style in zip(results.items(), ['r-o', 'm-s', 'b-^', 'g-d']):
+        ax10.plot(sizes, times, style, label=name)
+    ax10.set_title('sum + min + max + cumsum')
+    ax10.set_xlabel('Array Size')
+    ax10.set_ylabel('Time per element (ns)')
+    ax10.set_xscale('log')
+    ax10.set_yscale('log')
+    ax10.legend()
+    ax10.grid(True)
+
     plt.tight_layout()
     plt.savefig('dynamic_array_benchmarks.png', dpi=150, bbox_inches='tight')
     print("\nBenchmark plot saved as 'dynamic_array_benchmarks.png'")
@@ -1,19 +1,75 @@
+import operator
+from array import array
+from itertools import accumulate, islice
+
+
+# Growth policies map (current capacity, required size) to a new capacity
+
+def grow_double(capacity, needed):
+    while capacity < needed:
+        capacity *= 2
+    return capacity
+
+
+def grow_one_and_half(capacity, needed):
+    while capacity < needed:
+        capacity += capacity // 2 + 1
+    return capacity
+
+
+def grow_cpython(capacity, needed):
+    # same over-allocation as CPython's list_resize: ~12.5% plus a little
+    return (needed + (needed >> 3) + 6) & ~3
+
+
+def grow_fixed_chunk(chunk):
+    def grow(capacity, needed):
+        return -(-needed // chunk) * chunk
+    return grow
+
+
 class DynamicArray:
-    def __init__(self):
-        self._capacity = 4
+    def __init__(self, typecode=None, growth=grow_double, shrink=False, capacity_hint=0):
+        # typecode=None stores boxed objects in a list, otherwise
+        # elements are packed unboxed into an array.array (e.g. 'q', 'd')
+        self._typecode = typecode
+        self._growth = growth
+        self._shrink = shrink
+        self._capacity = max(4, capacity_hint)
         self._size = 0
-        self._data = [None] * self._capacity
+        self._data = self._alloc(self._capacity)
+        # value used to pad storage back up to capacity
+        self._fill = self._alloc(1)[0]
+        self._resize_count = 0
 
     def append(self, item):
         # check if resized needed
         if self._size + 1 > self._capacity:
-            self._resize(2 * self._capacity)
+            self._grow(self._size + 1)
 
         # put item at next free index
         self._data[self._size] = item
         # and increment array size
         self._size += 1
 
+    @classmethod
+    def from_iterable(cls, iterable, typecode=None, **kwargs):
+        # presize from len() / __length_hint__ so extend never resizes
+        arr = cls(typecode, capacity_hint=operator.length_hint(iterable), **kwargs)
+        arr.extend(iterable)
+        return arr
+
+    def extend(self, iterable):
+        items = self._coerce(iterable)
+        n = len(items)
+
+        if self._size + n > self._capacity:
+            self._grow(self._size + n)
+
+        # one slice write instead of n appends
+        self._data[self._size:self._size + n] = items
+        self._size += n
+
     def get(self, index):
         if index >= self._size:
             raise IndexError
@@ -25,36 +81,205 @@ class DynamicArray:
         self._data[index] = item
 
     def insert(self, index, item):
+        if not 0 <= index <= self._size:
+            raise IndexError
+
         if self._size + 1 > self._capacity:
-            self._resize(2 * self._capacity)
+            self._grow(self._size + 1)
 
-        # shift elements at index to the right
-        # going right-to-left
-        for i in range(self._size - 1, index - 1, -1):
-            self._data[i+1] = self._data[i]
+        # the built-in insert shifts the tail with one memmove in C,
+        # popping the unused last slot keeps len(_data) == capacity
+        self._data.insert(index, item)
+        self._data.pop()
 
-        # allocate the next element
         self._size += 1
 
-        self._data[index] = item
+    def insert_many(self, index, iterable):
+        if not 0 <= index <= self._size:
+            raise IndexError
+
+        items = self._coerce(iterable)
+        n = len(items)
+
+        if self._size + n > self._capacity:
+            self._grow(self._size + n)
+
+        # move the tail once for the whole batch, then trim the
+        # n unused slots that got pushed past capacity
+        self._data[index:index] = items
+        del self._data[self._capacity:]
+        self._size += n
 
     def delete(self, index):
-        if index >= self._size:
+        if not 0 <= index < self._size:
             raise IndexError
 
-        # delete at index by left shifting everything to its right
-        for i in range(index, self._size - 1):
-            self._data[i] = self._data[i + 1]
+        # delete at index by left shifting everything to its right,
+        # then top the storage back up to capacity
+        del self._data[index]
+        self._data.append(self._fill)
 
         self._size -= 1
+        self._maybe_shrink()
+
+    def delete_range(self, start, stop):
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError
+
+        n = stop - start
+        del self._data[start:stop]
+        self._data.extend(self._alloc(n))
+        self._size -= n
+        self._maybe_shrink()
 
     def size(self):
         return self._size
 
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        # islice walks the backing store in C, no per-element bounds checks
+        return islice(self._data, self._size)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DynamicArrayView(self, range(self._size)[index])
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError
+        return self._data[index]
+
+    def __buffer__(self, flags):
+        # while a memoryview is alive the array.array can't change length,
+        # so insert/delete/resize raise BufferError until it is released
+        if self._typecode is None:
+            raise TypeError("only typed DynamicArrays export a buffer")
+        return memoryview(self._data)[:self._size]
+
+    # Reductions. These loop in pure Python over the storage;
+    # NumpyDynamicArray overrides them with vectorized versions.
+
+    def sum(self):
+        return sum(self)
+
+    def min(self):
+        return min(self)
+
+    def max(self):
+        return max(self)
+
+    def cumsum(self):
+        # widen so small integer typecodes can't overflow, keeping
+        # unsigned sums unsigned so they don't overflow a signed 'q'
+        typecode = None
+        if self._typecode is not None:
+            if self._typecode in 'fd':
+                typecode = 'd'
+            elif self._typecode in 'BHILQ':
+                typecode = 'Q'
+            else:
+                typecode = 'q'
+        return DynamicArray.from_iterable(accumulate(self), typecode=typecode)
+
+    def argsort(self):
+        order = sorted(range(self._size), key=self._data.__getitem__)
+        return DynamicArray.from_iterable(order, typecode=None if self._typecode is None else 'q')
+
+    def as_numpy(self):
+        # zero-copy over the array.array, which pins it like a memoryview;
+        # NumPy is imported here so plain DynamicArray users never load it
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("as_numpy() requires NumPy") from None
+        if self._typecode is None:
+            raise TypeError("only typed DynamicArrays can be viewed as NumPy arrays")
+        return np.frombuffer(self._data, dtype=self._typecode, count=self._size)
+
+    def _alloc(self, n):
+        if self._typecode is None:
+            return [None] * n
+        # zero-filled without building n temporary int objects
+        return array(self._typecode, bytes(n * array(self._typecode).itemsize))
+
+    def _coerce(self, iterable):
+        # materialize once so we know the length; sequences that can be
+        # slice-assigned as they are skip the copy
+        if self._typecode is None:
+            if isinstance(iterable, (list, tuple)):
+                return iterable
+            return list(iterable)
+        # slice assignment into an array.array needs an array of the same type
+        if isinstance(iterable, array) and iterable.typecode == self._typecode:
+            return iterable
+        return array(self._typecode, iterable)
+
+    def _grow(self, needed):
+        self._resize(max(self._growth(self._capacity, needed), needed))
+
+    def _maybe_shrink(self):
+        # halve once only a quarter is used, the gap between the two
+        # thresholds stops an array hovering at a boundary from thrashing
+        if not self._shrink:
+            return
+        new_capacity = self._capacity
+        while new_capacity > 4 and self._size <= new_capacity // 4:
+            new_capacity //= 2
+        if new_capacity < self._capacity:
+            self._resize(new_capacity)
+
     def _resize(self, new_capacity):
-        assert new_capacity > self._capacity
-        self._data = self._data[:] + [None] * (new_capacity - self._size)
+        assert new_capacity >= self._size
+        if new_capacity > self._capacity:
+            # grow in place: the allocator can often extend the block
+            # without moving it, and we never build an intermediate copy
+            self._data.extend(self._alloc(new_capacity - self._capacity))
+        else:
+            # list/array only realloc below half their allocation, so a
+            # trim would keep the memory; copy the survivors out instead
+            self._data = self._data[:new_capacity]
         self._capacity = new_capacity
+        self._resize_count += 1
+
+
+class DynamicArrayView:
+    """Slice of a DynamicArray that reads through to its storage without copying"""
+
+    def __init__(self, arr, positions):
+        # a range already is offset + length + stride, and slicing it
+        # again composes them for us
+        self._arr = arr
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __iter__(self):
+        positions = self._positions
+        if positions.step > 0:
+            return islice(self._arr._data, positions.start, positions.stop, positions.step)
+        return map(self._arr._data.__getitem__, positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DynamicArrayView(self._arr, self._positions[index])
+        return self._arr._data[self._positions[index]]
+
+    def __buffer__(self, flags):
+        positions = self._positions
+        # an empty range can still start at -1, which memoryview would
+        # read as "the last element"
+        if not positions:
+            return memoryview(self._arr)[0:0]
+        # a negative stride that runs down to index 0 ends at -1, which
+        # memoryview would read as "the last element"
+        stop = positions.stop if positions.stop >= 0 else None
+        return memoryview(self._arr)[positions.start:stop:positions.step]
+
+    def to_list(self):
+        return list(self)
 
 
 def test_dynamic_array():
@@ -118,6 +343,195 @@ def test_dynamic_array():
     except IndexError:
         pass
 
+    # Bulk insert and delete move the tail once
+    arr = DynamicArray()
+    for i in range(5):
+        arr.append(i)
+    arr.insert_many(2, [10, 11, 12, 13, 14, 15])
+    assert [arr.get(i) for i in range(arr.size())] == [0, 1, 10, 11, 12, 13, 14, 15, 2, 3, 4]
+    arr.insert_many(arr.size(), iter([7, 8]))
+    assert arr.get(arr.size() - 1) == 8
+    arr.delete_range(2, 8)
+    assert [arr.get(i) for i in range(arr.size())] == [0, 1, 2, 3, 4, 7, 8]
+    arr.delete_range(0, 0)
+    assert arr.size() == 7
+    arr.delete_range(0, arr.size())
+    assert arr.size() == 0
+
+    try:
+        arr.delete_range(0, 1)
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+    try:
+        arr.insert(1, 5)
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+    # negative indices would reach into the unused capacity slots
+    for op in [lambda: arr.insert(-1, 5), lambda: arr.insert_many(-1, [5]),
+               lambda: arr.delete(-1)]:
+        try:
+            op()
+            assert False, "Should have raised IndexError"
+        except IndexError:
+            pass
+    assert arr.size() == 0
+
+    # Growth policies
+    for growth in [grow_double, grow_one_and_half, grow_cpython, grow_fixed_chunk(10)]:
+        arr = DynamicArray(growth=growth)
+        for i in range(100):
+            arr.append(i)
+        assert arr.size() == 100
+        assert arr._capacity >= 100
+        assert len(arr._data) == arr._capacity
+        assert [arr.get(i) for i in range(100)] == list(range(100))
+    assert grow_fixed_chunk(10)(4, 5) == 10
+    assert grow_double(4, 5) == 8
+
+    # Shrink with hysteresis gives memory back after a drain
+    arr = DynamicArray('q', shrink=True)
+    for i in range(1000):
+        arr.append(i)
+    arr.delete_range(10, 1000)
+    assert arr._capacity == 32
+    assert len(arr._data) == arr._capacity
+    assert [arr.get(i) for i in range(10)] == list(range(10))
+    while arr.size():
+        arr.delete(arr.size() - 1)
+    assert arr._capacity == 4
+
+    arr = DynamicArray()
+    for i in range(1000):
+        arr.append(i)
+    arr.delete_range(0, 1000)
+    assert arr._capacity == 1024
+
+    # Bulk construction
+    arr = DynamicArray.from_iterable(range(100))
+    assert arr.size() == 100
+    assert arr._capacity == 100
+    assert arr._resize_count == 0
+    assert [arr.get(i) for i in range(100)] == list(range(100))
+
+    arr = DynamicArray.from_iterable(x * 2 for x in range(10))
+    assert [arr.get(i) for i in range(10)] == [x * 2 for x in range(10)]
+
+    arr = DynamicArray(capacity_hint=50)
+    assert arr._capacity == 50
+    arr.extend([1, 2, 3])
+    arr.extend(iter((4, 5)))
+    arr.extend([])
+    assert [arr.get(i) for i in range(arr.size())] == [1, 2, 3, 4, 5]
+    assert arr._resize_count == 0
+    arr.extend(range(100))
+    assert arr.size() == 105
+    assert arr.get(104) == 99
+
+    arr = DynamicArray.from_iterable([1.5, 2.5], typecode='d')
+    arr.extend(array('d', [3.5]))
+    assert [arr.get(i) for i in range(3)] == [1.5, 2.5, 3.5]
+
+    # Sequence protocol and views
+    arr = DynamicArray.from_iterable(range(10))
+    assert len(arr) == 10
+    assert list(arr) == list(range(10))
+    assert arr[0] == 0
+    assert arr[-1] == 9
+    try:
+        arr[10]
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+    try:
+        arr[-11]
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+    view = arr[2:8:2]
+    assert len(view) == 3
+    assert list(view) == [2, 4, 6]
+    assert view[-1] == 6
+    assert view[1:].to_list() == [4, 6]
+    assert list(arr[::-1]) == list(range(9, -1, -1))
+    assert list(arr[::-3][1:]) == [6, 3, 0]
+    assert list(arr[5:2]) == []
+
+    # views read through to the array, nothing was copied
+    arr.set(4, 40)
+    assert list(view) == [2, 40, 6]
+
+    typed = DynamicArray.from_iterable(range(10), typecode='q')
+    mv = memoryview(typed)
+    assert mv.format == 'q'
+    assert mv.tolist() == list(range(10))
+    mv.release()
+    assert memoryview(typed[1:6:2]).tolist() == [1, 3, 5]
+    assert memoryview(typed[::-1]).tolist() == list(range(9, -1, -1))
+    assert memoryview(typed[-20::-1]).tolist() == []
+    assert memoryview(typed[5:2]).tolist() == []
+    typed.insert(0, -1)  # no exports left, so resizing works again
+
+    try:
+        memoryview(arr)
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+    # Reductions
+    arr = DynamicArray.from_iterable([5, 3, 9, 1, 7], typecode='b')
+    assert arr.sum() == 25
+    assert arr.min() == 1
+    assert arr.max() == 9
+    assert list(arr.cumsum()) == [5, 8, 17, 18, 25]
+    assert arr.cumsum()._typecode == 'q'
+    assert list(arr.argsort()) == [3, 1, 0, 4, 2]
+    arr = DynamicArray.from_iterable([2**63 + 5, 1], typecode='Q')
+    assert list(arr.cumsum()) == [2**63 + 5, 2**63 + 6]
+    assert arr.cumsum()._typecode == 'Q'
+    arr = DynamicArray.from_iterable([2.5, 0.5])
+    assert arr.sum() == 3.0
+    assert list(arr.cumsum()) == [2.5, 3.0]
+    try:
+        DynamicArray().min()
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    # Typed storage keeps the same behaviour
+    arr = DynamicArray('q')
+    for i in range(10):
+        arr.append(i * 1000)
+    assert arr.size() == 10
+    assert arr.get(9) == 9000
+    arr.insert(0, -1)
+    arr.set(1, 42)
+    assert arr.get(0) == -1
+    assert arr.get(1) == 42
+    arr.delete(0)
+    assert arr.get(0) == 42
+    assert arr.size() == 10
+    arr.insert_many(1, range(3))
+    assert [arr.get(i) for i in range(5)] == [42, 0, 1, 2, 1000]
+    arr.delete_range(1, 4)
+    assert arr.get(1) == 1000
+    assert arr.size() == 10
+    assert arr._data.typecode == 'q'
+
+    farr = DynamicArray('d')
+    farr.append(1.5)
+    assert farr.get(0) == 1.5
+
+    try:
+        arr.append("not an int")
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
     print("All tests passed!")
 
 
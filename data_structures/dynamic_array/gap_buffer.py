@@ -0,0 +1,269 @@
+import operator
+from itertools import chain, islice
+
+from dynamic_array import DynamicArray, DynamicArrayView
+
+
+class GapBuffer:
+    def __init__(self, typecode=None, capacity=16):
+        # elements live in _data[:_gap_start] and _data[_gap_end:],
+        # the gap in between is free space parked at the edit cursor
+        self._typecode = typecode
+        self._data = self._alloc(max(capacity, 1))
+        self._fill = self._alloc(1)[0]
+        self._gap_start = 0
+        self._gap_end = len(self._data)
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode=None, **kwargs):
+        # presize from len() / __length_hint__ so extend never grows
+        buf = cls(typecode, capacity=max(operator.length_hint(iterable), 1), **kwargs)
+        buf.extend(iterable)
+        return buf
+
+    def append(self, item):
+        self.insert(self.size(), item)
+
+    def extend(self, iterable):
+        self.insert_many(self.size(), iterable)
+
+    def get(self, index):
+        if not 0 <= index < self.size():
+            raise IndexError
+        if index < self._gap_start:
+            return self._data[index]
+        return self._data[index + self._gap_end - self._gap_start]
+
+    def set(self, index, item):
+        if not 0 <= index < self.size():
+            raise IndexError
+        if index < self._gap_start:
+            self._data[index] = item
+        else:
+            self._data[index + self._gap_end - self._gap_start] = item
+
+    def insert(self, index, item):
+        self.move_cursor(index)
+        if self._gap_start == self._gap_end:
+            self._grow(1)
+        self._data[self._gap_start] = item
+        self._gap_start += 1
+
+    def insert_many(self, index, iterable):
+        items = self._coerce(iterable)
+        n = len(items)
+
+        self.move_cursor(index)
+        if self._gap_end - self._gap_start < n:
+            self._grow(n)
+        self._data[self._gap_start:self._gap_start + n] = items
+        self._gap_start += n
+
+    def delete(self, index):
+        if not 0 <= index < self.size():
+            raise IndexError
+        self.move_cursor(index)
+        # deleting just widens the gap over the element
+        self._data[self._gap_end] = self._fill
+        self._gap_end += 1
+
+    def delete_range(self, start, stop):
+        if not 0 <= start <= stop <= self.size():
+            raise IndexError
+        self.move_cursor(start)
+        n = stop - start
+        self._data[self._gap_end:self._gap_end + n] = self._alloc(n)
+        self._gap_end += n
+
+    def move_cursor(self, index):
+        if not 0 <= index <= self.size():
+            raise IndexError
+
+        # only the elements between the old and new cursor cross the gap,
+        # so edits clustered around one spot cost O(distance moved)
+        gap = self._gap_end - self._gap_start
+        if index < self._gap_start:
+            n = self._gap_start - index
+            self._data[self._gap_end - n:self._gap_end] = self._data[index:self._gap_start]
+            self._gap_start -= n
+            self._gap_end -= n
+            stale = self._gap_start
+        elif index > self._gap_start:
+            n = index - self._gap_start
+            self._data[self._gap_start:self._gap_start + n] = self._data[self._gap_end:self._gap_end + n]
+            self._gap_start += n
+            self._gap_end += n
+            stale = self._gap_end - min(n, gap)
+        else:
+            return
+
+        # the slots the elements moved out of are now gap; in list mode
+        # they would keep deleted elements alive, so clear them like delete does
+        if self._typecode is None:
+            k = min(n, gap)
+            self._data[stale:stale + k] = self._alloc(k)
+
+    def cursor(self):
+        return self._gap_start
+
+    def size(self):
+        return len(self._data) - (self._gap_end - self._gap_start)
+
+    def __len__(self):
+        return self.size()
+
+    def __iter__(self):
+        return chain(islice(self._data, self._gap_start), islice(self._data, self._gap_end, None))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return GapBufferView(self, range(self.size())[index])
+        if index < 0:
+            index += self.size()
+        return self.get(index)
+
+    # storage is allocated and coerced exactly as in DynamicArray
+    _alloc = DynamicArray._alloc
+    _coerce = DynamicArray._coerce
+
+    def _grow(self, needed):
+        # double, and rebuild with the extra space spliced into the gap
+        gap = self._gap_end - self._gap_start
+        extra = len(self._data)
+        while gap + extra < needed:
+            extra *= 2
+        self._data = self._data[:self._gap_start] + self._alloc(gap + extra) + self._data[self._gap_end:]
+        self._gap_end = self._gap_start + gap + extra
+
+
+class GapBufferView(DynamicArrayView):
+    """Slice of a GapBuffer; positions are logical, so reads step over the gap"""
+
+    def __iter__(self):
+        return map(self._arr.get, self._positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return GapBufferView(self._arr, self._positions[index])
+        return self._arr.get(self._positions[index])
+
+    def __buffer__(self, flags):
+        raise TypeError("a GapBuffer's storage isn't contiguous, it can't export a buffer")
+
+
+def test_gap_buffer():
+    # Basic append and get
+    buf = GapBuffer(capacity=2)
+    buf.append(1)
+    buf.append(2)
+    buf.append(3)  # grows
+    assert buf.size() == 3
+    assert [buf.get(i) for i in range(3)] == [1, 2, 3]
+
+    # Set on both sides of the gap
+    buf.move_cursor(1)
+    buf.set(0, 10)
+    buf.set(2, 30)
+    assert list(buf) == [10, 2, 30]
+
+    # Insert around the cursor
+    buf.insert(1, 15)
+    assert buf.cursor() == 2
+    buf.insert(2, 16)
+    assert list(buf) == [10, 15, 16, 2, 30]
+    buf.insert(0, 0)
+    buf.insert(buf.size(), 40)
+    assert list(buf) == [0, 10, 15, 16, 2, 30, 40]
+
+    # Delete
+    buf.delete(3)
+    assert list(buf) == [0, 10, 15, 2, 30, 40]
+    buf.delete(0)
+    buf.delete(buf.size() - 1)
+    assert list(buf) == [10, 15, 2, 30]
+    assert len(buf) == 4
+
+    # Bulk operations
+    buf.insert_many(2, range(100, 110))
+    assert list(buf) == [10, 15] + list(range(100, 110)) + [2, 30]
+    buf.delete_range(1, 12)
+    assert list(buf) == [10, 2, 30]
+
+    # Clustered edits like typing and backspacing
+    buf = GapBuffer()
+    for ch in "hello world":
+        buf.append(ch)
+    buf.move_cursor(5)
+    buf.insert(buf.cursor(), ",")
+    buf.delete(buf.cursor() - 1)
+    buf.delete(buf.cursor() - 1)
+    buf.insert(buf.cursor(), "O")
+    assert "".join(buf) == "hellO world"
+
+    # Typed storage
+    buf = GapBuffer('q')
+    for i in range(100):
+        buf.insert(i // 2, i)
+    assert buf.size() == 100
+    assert buf._data.typecode == 'q'
+    expected = []
+    for i in range(100):
+        expected.insert(i // 2, i)
+    assert list(buf) == expected
+
+    # Same bulk construction and sequence protocol as DynamicArray
+    buf = GapBuffer.from_iterable(range(10))
+    assert list(buf) == list(range(10))
+    assert len(buf._data) == 10
+    buf.extend(x for x in [10, 11])
+    buf.move_cursor(4)
+    assert buf[0] == 0 and buf[4] == 4 and buf[-1] == 11
+    try:
+        buf[12]
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+    view = buf[2:9:2]
+    assert list(view) == [2, 4, 6, 8] and len(view) == 4
+    assert view[-1] == 8 and view[1:].to_list() == [4, 6, 8]
+    assert list(buf[::-4]) == [11, 7, 3]
+    buf.insert(0, -1)  # views read through, positions are logical
+    assert list(view) == [1, 3, 5, 7]
+    typed = GapBuffer.from_iterable([1.5, 2.5], typecode='d')
+    assert typed._data.typecode == 'd' and list(typed) == [1.5, 2.5]
+
+    # Moving the cursor leaves no stale references in the gap
+    import weakref
+
+    class Item:
+        pass
+
+    items = [Item() for _ in range(6)]
+    tracked = GapBuffer(capacity=8)
+    for item in items:
+        tracked.append(item)
+    tracked.move_cursor(2)
+    tracked.move_cursor(5)
+    tracked.move_cursor(0)
+    assert list(tracked) == items
+    assert tracked._data[tracked._gap_start:tracked._gap_end] == [None] * (tracked._gap_end - tracked._gap_start)
+    ref = weakref.ref(items[3])
+    tracked.delete(3)
+    del items[3]
+    assert ref() is None
+
+    # Out of bounds
+    for op in [lambda: buf.get(100), lambda: buf.set(-1, 0), lambda: buf.delete(100),
+               lambda: buf.insert(101, 0), lambda: buf.move_cursor(-1),
+               lambda: buf.delete_range(5, 200)]:
+        try:
+            op()
+            assert False, "Should have raised IndexError"
+        except IndexError:
+            pass
+
+    print("All tests passed!")
+
+
+if __name__ == '__main__':
+    test_gap_buffer()
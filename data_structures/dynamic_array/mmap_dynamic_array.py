@@ -0,0 +1,250 @@
+import mmap
+import operator
+import os
+import struct
+from array import array
+
+from dynamic_array import DynamicArray, grow_double
+
+# file layout: magic, typecode, padding, element count, then the records
+HEADER = struct.Struct('<4sc3xQ')
+SIZE_OFFSET = 8
+MAGIC = b'DYNA'
+
+
+class MmapDynamicArray(DynamicArray):
+    def __init__(self, path, typecode='q', growth=grow_double, shrink=False, capacity_hint=0):
+        # fixed-width records live in an mmap'ed file, so reopening is O(1)
+        # and pages are loaded lazily from the page cache instead of
+        # re-appending everything at start-up
+        itemsize = array(typecode).itemsize
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+
+        if exists:
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                self._file.close()
+                raise ValueError(f"{path} is not a MmapDynamicArray file")
+            magic, stored_typecode, size = HEADER.unpack(header)
+            if magic != MAGIC:
+                self._file.close()
+                raise ValueError(f"{path} is not a MmapDynamicArray file")
+            if stored_typecode.decode() != typecode:
+                self._file.close()
+                raise ValueError(f"{path} holds typecode {stored_typecode.decode()!r}, not {typecode!r}")
+            record_bytes = os.path.getsize(path) - HEADER.size
+            capacity = record_bytes // itemsize
+            if record_bytes % itemsize or size > capacity:
+                self._file.close()
+                raise ValueError(f"{path} is truncated or its header size is wrong")
+        else:
+            size = 0
+            capacity = max(4, capacity_hint)
+            self._file.truncate(HEADER.size + capacity * itemsize)
+
+        # the storage is set up here rather than by DynamicArray.__init__,
+        # which would allocate an in-memory array first
+        self._typecode = typecode
+        self._itemsize = itemsize
+        self._growth = growth
+        self._shrink = shrink
+        self._capacity = capacity
+        self._resize_count = 0
+        self._map()
+        if not exists:
+            HEADER.pack_into(self._mm, 0, MAGIC, typecode.encode(), 0)
+        self._length = size
+
+    @classmethod
+    def from_iterable(cls, iterable, path, typecode='q', **kwargs):
+        # the inherited version would pass typecode as the path; an
+        # existing file keeps its records and the new ones go after them
+        arr = cls(path, typecode, capacity_hint=operator.length_hint(iterable), **kwargs)
+        arr.extend(iterable)
+        return arr
+
+    # every size change is written straight into the header
+
+    @property
+    def _size(self):
+        return self._length
+
+    @_size.setter
+    def _size(self, value):
+        self._length = value
+        struct.pack_into('<Q', self._mm, SIZE_OFFSET, value)
+
+    # a memoryview can't change length, so shifts are slice assignments,
+    # which memoryview performs correctly even when the slices overlap
+
+    def insert(self, index, item):
+        if not 0 <= index <= self._size:
+            raise IndexError
+
+        if self._size + 1 > self._capacity:
+            self._grow(self._size + 1)
+
+        self._data[index + 1:self._size + 1] = self._data[index:self._size]
+        self._data[index] = item
+        self._size += 1
+
+    def insert_many(self, index, iterable):
+        if not 0 <= index <= self._size:
+            raise IndexError
+
+        items = self._coerce(iterable)
+        n = len(items)
+
+        if self._size + n > self._capacity:
+            self._grow(self._size + n)
+
+        self._data[index + n:self._size + n] = self._data[index:self._size]
+        self._data[index:index + n] = items
+        self._size += n
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
+        self._size -= 1
+        self._maybe_shrink()
+
+    def delete_range(self, start, stop):
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError
+
+        n = stop - start
+        self._data[start:self._size - n] = self._data[stop:self._size]
+        self._size -= n
+        self._maybe_shrink()
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._unmap()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _map(self):
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._data = memoryview(self._mm)[HEADER.size:].cast(self._typecode)
+
+    def _unmap(self):
+        # fails with BufferError while memoryviews/as_numpy() results
+        # over the records are still alive
+        self._data.release()
+        self._mm.close()
+
+    def _resize(self, new_capacity):
+        assert new_capacity >= self._size
+        # remap around the new file length; growing the file is sparse,
+        # so the new tail costs nothing until it is written
+        self._unmap()
+        self._file.truncate(HEADER.size + new_capacity * self._itemsize)
+        self._map()
+        self._capacity = new_capacity
+        self._resize_count += 1
+
+
+def test_mmap_dynamic_array():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'samples.bin')
+
+        # Same behaviour as DynamicArray
+        with MmapDynamicArray(path) as arr:
+            for i in range(10):
+                arr.append(i * 1000)
+            assert arr.size() == 10
+            assert arr._capacity == 16
+            assert arr.get(9) == 9000
+            arr.insert(0, -1)
+            arr.set(1, 42)
+            assert list(arr)[:3] == [-1, 42, 1000]
+            arr.delete(0)
+            arr.insert_many(1, range(3))
+            assert list(arr)[:5] == [42, 0, 1, 2, 1000]
+            arr.delete_range(1, 4)
+            arr.extend([7, 8])
+            assert list(arr) == [42] + [i * 1000 for i in range(1, 10)] + [7, 8]
+            assert arr[-1] == 8
+            assert arr.sum() == 45057
+            assert os.path.getsize(path) == HEADER.size + 16 * 8
+
+            try:
+                arr.get(12)
+                assert False, "Should have raised IndexError"
+            except IndexError:
+                pass
+
+        # Reopening sees the same records without re-appending
+        with MmapDynamicArray(path) as arr:
+            assert arr.size() == 12
+            assert arr._capacity == 16
+            assert list(arr) == [42] + [i * 1000 for i in range(1, 10)] + [7, 8]
+            for i in range(100):
+                arr.append(i)
+            assert arr._capacity == 128
+
+        with MmapDynamicArray(path) as arr:
+            assert arr.size() == 112
+            assert arr.get(111) == 99
+
+        # Wrong typecode or foreign file
+        try:
+            MmapDynamicArray(path, typecode='d')
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        other = os.path.join(tmp, 'other.bin')
+        for junk in [b'x' * 64, b'DYNA', HEADER.pack(MAGIC, b'q', 0) + bytes(20),
+                     HEADER.pack(MAGIC, b'q', 99) + bytes(16)]:
+            with open(other, 'wb') as f:
+                f.write(junk)
+            try:
+                MmapDynamicArray(other)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+        # Bulk construction writes to the given path
+        path = os.path.join(tmp, 'bulk.bin')
+        with MmapDynamicArray.from_iterable(range(5), path) as arr:
+            assert list(arr) == list(range(5))
+            assert arr._capacity == 5
+            assert arr._resize_count == 0
+        with MmapDynamicArray(path) as arr:
+            assert list(arr) == list(range(5))
+        try:
+            MmapDynamicArray.from_iterable(range(5), typecode='q')
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+
+        # Floats and shrinking
+        path = os.path.join(tmp, 'floats.bin')
+        with MmapDynamicArray(path, typecode='d', shrink=True) as arr:
+            arr.extend(float(i) for i in range(1000))
+            arr.delete_range(10, 1000)
+            assert arr._capacity == 32
+            assert list(arr) == [float(i) for i in range(10)]
+        assert os.path.getsize(path) == HEADER.size + 32 * 8
+
+    print("All tests passed!")
+
+
+if __name__ == '__main__':
+    test_mmap_dynamic_array()
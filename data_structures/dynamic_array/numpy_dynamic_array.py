@@ -0,0 +1,258 @@
+from array import array
+
+from dynamic_array import DynamicArray, DynamicArrayView, grow_double
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpyDynamicArray(DynamicArray):
+    def __init__(self, typecode='d', growth=grow_double, shrink=False, capacity_hint=0):
+        # same amortised growth as DynamicArray, but the storage is an
+        # ndarray so reductions run vectorized over it
+        if np is None:
+            raise ImportError("NumpyDynamicArray requires NumPy, use DynamicArray(typecode) instead")
+        if typecode is None:
+            raise ValueError("NumpyDynamicArray needs a typecode, use DynamicArray() for objects")
+        super().__init__(typecode, growth=growth, shrink=shrink, capacity_hint=capacity_hint)
+        # ndarray item assignment silently truncates 1.7 to 1, so every
+        # element is first written into this one-slot array.array, which
+        # raises the same TypeError/OverflowError as the typed DynamicArray
+        self._check = array(typecode, bytes(array(typecode).itemsize))
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode='d', **kwargs):
+        # same as DynamicArray's, but with this class's default typecode
+        return super().from_iterable(iterable, typecode, **kwargs)
+
+    def append(self, item):
+        self._check[0] = item
+        super().append(item)
+
+    def get(self, index):
+        # .item() hands back a Python scalar, not a NumPy one
+        return super().get(index).item()
+
+    def set(self, index, item):
+        self._check[0] = item
+        super().set(index, item)
+
+    def __iter__(self):
+        return iter(self.as_numpy().tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NumpyDynamicArrayView(self, range(self._size)[index])
+        return super().__getitem__(index).item()
+
+    # ndarrays can't change length in place, so every shift is a slice
+    # assignment, which NumPy performs as a memmove even when overlapping
+
+    def insert(self, index, item):
+        if not 0 <= index <= self._size:
+            raise IndexError
+        self._check[0] = item
+
+        if self._size + 1 > self._capacity:
+            self._grow(self._size + 1)
+
+        self._data[index + 1:self._size + 1] = self._data[index:self._size]
+        self._data[index] = item
+        self._size += 1
+
+    def insert_many(self, index, iterable):
+        if not 0 <= index <= self._size:
+            raise IndexError
+
+        items = self._coerce(iterable)
+        n = len(items)
+
+        if self._size + n > self._capacity:
+            self._grow(self._size + n)
+
+        self._data[index + n:self._size + n] = self._data[index:self._size]
+        self._data[index:index + n] = items
+        self._size += n
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
+        self._size -= 1
+        self._maybe_shrink()
+
+    def delete_range(self, start, stop):
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError
+
+        n = stop - start
+        self._data[start:self._size - n] = self._data[stop:self._size]
+        self._size -= n
+        self._maybe_shrink()
+
+    def as_numpy(self):
+        # a view, not a copy; it keeps pointing at the old buffer
+        # once a resize moves the array somewhere else
+        return self._data[:self._size]
+
+    def sum(self):
+        return self.as_numpy().sum().item()
+
+    def min(self):
+        return self.as_numpy().min().item()
+
+    def max(self):
+        return self.as_numpy().max().item()
+
+    def cumsum(self):
+        return self._from_ndarray(np.cumsum(self.as_numpy()))
+
+    def argsort(self):
+        return self._from_ndarray(np.argsort(self.as_numpy(), kind='stable'))
+
+    @classmethod
+    def _from_ndarray(cls, values):
+        arr = cls(values.dtype.char, capacity_hint=len(values))
+        arr._data[:len(values)] = values
+        arr._size = len(values)
+        return arr
+
+    def _alloc(self, n):
+        return np.zeros(n, dtype=self._typecode)
+
+    def _coerce(self, iterable):
+        if isinstance(iterable, np.ndarray) and np.can_cast(iterable.dtype, self._typecode):
+            return iterable.astype(self._typecode, copy=False)
+        if isinstance(iterable, np.ndarray):
+            iterable = iterable.tolist()
+        # going through array.array applies the typed DynamicArray's checks
+        # (no floats into integer typecodes, no out of range values)
+        return np.frombuffer(array(self._typecode, iterable), dtype=self._typecode)
+
+    def _resize(self, new_capacity):
+        assert new_capacity >= self._size
+        # an ndarray that may have views handed out can't be resized in
+        # place, so copy the live prefix into a fresh buffer
+        data = self._alloc(new_capacity)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+        self._capacity = new_capacity
+        self._resize_count += 1
+
+
+class NumpyDynamicArrayView(DynamicArrayView):
+    """DynamicArrayView that hands back Python scalars, like the array it views"""
+
+    def __iter__(self):
+        return iter(memoryview(self).tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NumpyDynamicArrayView(self._arr, self._positions[index])
+        return self._arr._data[self._positions[index]].item()
+
+
+def test_numpy_dynamic_array():
+    if np is None:
+        print("NumPy not installed, skipping")
+        return
+
+    # Same behaviour as DynamicArray
+    arr = NumpyDynamicArray('q')
+    for i in range(10):
+        arr.append(i * 1000)
+    assert arr.size() == 10
+    assert arr.get(9) == 9000
+    arr.insert(0, -1)
+    arr.set(1, 42)
+    assert list(arr)[:3] == [-1, 42, 1000]
+    arr.delete(0)
+    assert arr.get(0) == 42
+    arr.insert_many(1, range(3))
+    assert list(arr)[:5] == [42, 0, 1, 2, 1000]
+    arr.delete_range(1, 4)
+    assert list(arr) == [42] + [i * 1000 for i in range(1, 10)]
+    arr.extend(x for x in [7, 8])
+    assert arr[-1] == 8
+    assert list(arr[::4]) == [42, 4000, 8000]
+
+    try:
+        arr.insert(100, 1)
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+    # Same scalar types and casting checks as the typed DynamicArray
+    assert type(arr.get(0)) is int and type(arr[-1]) is int
+    assert all(type(x) is int for x in arr)
+    assert type(arr[::2][0]) is int and all(type(x) is int for x in arr[::-3])
+    assert list(arr[::-3][1:]) == list(arr)[::-3][1:]
+    size = arr.size()
+    for op in [lambda: arr.extend([1.7, 2.2]), lambda: arr.append(1.5),
+               lambda: arr.set(0, 2.5), lambda: arr.insert(0, 0.5),
+               lambda: arr.insert_many(0, np.array([0.5]))]:
+        try:
+            op()
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+    try:
+        NumpyDynamicArray('b').append(300)
+        assert False, "Should have raised OverflowError"
+    except OverflowError:
+        pass
+    assert arr.size() == size
+    arr.extend(np.array([1, 2], dtype=np.int8))
+    assert list(arr)[-2:] == [1, 2]
+    farr = NumpyDynamicArray.from_iterable([1, 2.5])
+    assert list(farr) == [1.0, 2.5] and type(farr.get(0)) is float
+
+    # as_numpy is a zero-copy view
+    view = arr.as_numpy()
+    assert view.dtype == np.int64
+    assert len(view) == arr.size()
+    arr.set(0, 5)
+    assert view[0] == 5
+    assert memoryview(arr).tolist() == view.tolist()
+
+    # Vectorized reductions
+    arr = NumpyDynamicArray.from_iterable([5, 3, 9, 1, 7], typecode='d')
+    assert arr.sum() == 25.0
+    assert isinstance(arr.sum(), float)
+    assert arr.min() == 1.0
+    assert arr.max() == 9.0
+    assert list(arr.cumsum()) == [5, 8, 17, 18, 25]
+    assert list(arr.argsort()) == [3, 1, 0, 4, 2]
+
+    arr = NumpyDynamicArray.from_iterable(range(5))
+    assert arr._typecode == 'd'
+    assert memoryview(arr).tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    try:
+        NumpyDynamicArray(None)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    try:
+        NumpyDynamicArray().min()
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    # Growth and shrink keep the contents
+    arr = NumpyDynamicArray('q', shrink=True)
+    for i in range(1000):
+        arr.append(i)
+    assert arr.as_numpy().tolist() == list(range(1000))
+    arr.delete_range(10, 1000)
+    assert arr._capacity == 32
+    assert arr.as_numpy().tolist() == list(range(10))
+
+    print("All tests passed!")
+
+
+if __name__ == '__main__':
+    test_numpy_dynamic_array()
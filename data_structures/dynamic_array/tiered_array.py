@@ -0,0 +1,217 @@
+from itertools import chain
+
+
+class TieredArray:
+    def __init__(self, load=1000):
+        # elements are split across chunks of load..2*load items, so an
+        # insert only shifts inside one small chunk instead of the whole array
+        self._load = load
+        self._chunks = []
+        self._size = 0
+        self._build_index()
+
+    @classmethod
+    def from_iterable(cls, iterable, load=1000):
+        arr = cls(load)
+        arr.extend(iterable)
+        return arr
+
+    def append(self, item):
+        if not self._chunks:
+            self._chunks.append([item])
+            self._size += 1
+            self._build_index()
+            return
+
+        last = len(self._chunks) - 1
+        self._chunks[last].append(item)
+        self._size += 1
+        self._update_index(last, 1)
+        self._split(last)
+
+    def extend(self, iterable):
+        items = list(iterable)
+        if not items:
+            return
+
+        # top up the last chunk, then cut the rest into full chunks
+        i = 0
+        if self._chunks:
+            i = max(0, 2 * self._load - len(self._chunks[-1]))
+            self._chunks[-1].extend(items[:i])
+        for start in range(i, len(items), self._load):
+            self._chunks.append(items[start:start + self._load])
+        self._size += len(items)
+        self._build_index()
+
+    def get(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+        k, offset = self._locate(index)
+        return self._chunks[k][offset]
+
+    def set(self, index, item):
+        if not 0 <= index < self._size:
+            raise IndexError
+        k, offset = self._locate(index)
+        self._chunks[k][offset] = item
+
+    def insert(self, index, item):
+        if not 0 <= index <= self._size:
+            raise IndexError
+        if index == self._size:
+            self.append(item)
+            return
+
+        k, offset = self._locate(index)
+        self._chunks[k].insert(offset, item)
+        self._size += 1
+        self._update_index(k, 1)
+        self._split(k)
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        k, offset = self._locate(index)
+        chunk = self._chunks[k]
+        del chunk[offset]
+        self._size -= 1
+
+        if not chunk:
+            del self._chunks[k]
+            self._build_index()
+        elif len(chunk) < self._load // 2 and len(self._chunks) > 1:
+            # fold an underfull chunk into a neighbour so the chunk
+            # count, and with it the index, stays proportional to size
+            if k + 1 < len(self._chunks):
+                chunk.extend(self._chunks.pop(k + 1))
+            else:
+                k -= 1
+                self._chunks[k].extend(self._chunks.pop())
+            if not self._split(k):
+                self._build_index()
+        else:
+            self._update_index(k, -1)
+
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def _split(self, k):
+        # returns whether it split (and so already rebuilt the index)
+        chunk = self._chunks[k]
+        if len(chunk) <= 2 * self._load:
+            return False
+        self._chunks[k:k + 1] = [chunk[:self._load], chunk[self._load:]]
+        self._build_index()
+        return True
+
+    # The chunk lengths are kept in a Fenwick tree, so finding the chunk
+    # for a position and adjusting a length are both O(log chunks).
+    # Splits and merges change the chunk numbering and rebuild it in
+    # O(chunks), which happens at most once every ~load/2 edits.
+
+    def _build_index(self):
+        m = len(self._chunks)
+        tree = [0] * (m + 1)
+        for i, chunk in enumerate(self._chunks, 1):
+            tree[i] += len(chunk)
+            parent = i + (i & -i)
+            if parent <= m:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << (m.bit_length() - 1) if m else 0
+
+    def _update_index(self, k, delta):
+        tree = self._tree
+        i = k + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index):
+        # descend the tree to the last chunk whose prefix length is <= index
+        tree = self._tree
+        k = 0
+        bit = self._top
+        while bit:
+            nxt = k + bit
+            if nxt < len(tree) and tree[nxt] <= index:
+                k = nxt
+                index -= tree[nxt]
+            bit >>= 1
+        return k, index
+
+
+def test_tiered_array():
+    # Basic append and get across several chunks
+    arr = TieredArray(load=4)
+    for i in range(50):
+        arr.append(i)
+    assert arr.size() == 50
+    assert [arr.get(i) for i in range(50)] == list(range(50))
+    assert all(len(chunk) <= 8 for chunk in arr._chunks)
+
+    # Set
+    arr.set(17, 99)
+    assert arr.get(17) == 99
+
+    # Insert at beginning, middle and end
+    expected = list(range(50))
+    expected[17] = 99
+    for index, item in [(0, -1), (25, -2), (52, -3), (10, -4), (10, -5)]:
+        arr.insert(index, item)
+        expected.insert(index, item)
+    assert list(arr) == expected
+    assert len(arr) == len(expected)
+
+    # Delete until empty, merging chunks on the way
+    import random
+    rng = random.Random(7)
+    while expected:
+        index = rng.randrange(len(expected))
+        arr.delete(index)
+        del expected[index]
+        assert arr.size() == len(expected)
+        if expected:
+            assert arr.get(len(expected) // 2) == expected[len(expected) // 2]
+    assert list(arr) == []
+    assert arr._chunks == []
+
+    # Random inserts against a plain list
+    arr = TieredArray(load=8)
+    expected = []
+    for i in range(500):
+        index = rng.randint(0, len(expected))
+        arr.insert(index, i)
+        expected.insert(index, i)
+    assert list(arr) == expected
+    assert [arr.get(i) for i in range(500)] == expected
+
+    # Bulk construction
+    arr = TieredArray.from_iterable(range(100), load=8)
+    assert list(arr) == list(range(100))
+    arr.extend(range(100, 103))
+    assert arr.get(102) == 102
+    assert arr.size() == 103
+
+    # Out of bounds
+    for op in [lambda: arr.get(103), lambda: arr.get(-1), lambda: arr.set(103, 0),
+               lambda: arr.insert(104, 0), lambda: arr.delete(103)]:
+        try:
+            op()
+            assert False, "Should have raised IndexError"
+        except IndexError:
+            pass
+
+    print("All tests passed!")
+
+
+if __name__ == '__main__':
+    test_tiered_array()
@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+from collections import deque
+import matplotlib.pyplot as plt
+from queue_blocking import BlockingQueue
+from queue_linked import QueueLinked
+
+ITEMS = 100000
+BATCH = 100
+MAXSIZE = 1024
+STOP = None
+
+
+# Each implementation is a (producer, consumer) pair of functions. The
+# benchmark runs n of each; once every producer is done it queues one
+# STOP per consumer, so consumers finish when they see it.
+
+def blocking_pair(q):
+    def produce(items):
+        for item in items:
+            q.put(item)
+
+    def consume():
+        while q.get() is not STOP:
+            pass
+
+    return produce, consume, lambda: q.put(STOP)
+
+
+def blocking_batched_pair(q):
+    def produce(items):
+        for start in range(0, len(items), BATCH):
+            q.put_many(items[start:start + BATCH])
+
+    def consume():
+        while True:
+            batch = q.get_many(BATCH)
+            if STOP in batch:
+                # hand back any other consumers' STOPs
+                q.put_many(batch[batch.index(STOP) + 1:])
+                return
+
+    return produce, consume, lambda: q.put(STOP)
+
+
+def stdlib_queue_pair():
+    q = queue.Queue(maxsize=MAXSIZE)
+
+    def produce(items):
+        for item in items:
+            q.put(item)
+
+    def consume():
+        while q.get() is not STOP:
+            pass
+
+    return produce, consume, lambda: q.put(STOP)
+
+
+def deque_pair():
+    # deque's append/popleft are atomic but it can't block, so an idle
+    # consumer has to poll
+    d = deque()
+
+    def produce(items):
+        for item in items:
+            d.append(item)
+
+    def consume():
+        while True:
+            try:
+                if d.popleft() is STOP:
+                    return
+            except IndexError:
+                time.sleep(0)
+
+    return produce, consume, lambda: d.append(STOP)
+
+
+IMPLEMENTATIONS = [
+    ('BlockingQueue', lambda: blocking_pair(BlockingQueue(MAXSIZE))),
+    ('BlockingQueue (batched)', lambda: blocking_batched_pair(BlockingQueue(MAXSIZE))),
+    ('BlockingQueue (QueueLinked)', lambda: blocking_pair(BlockingQueue(MAXSIZE, QueueLinked))),
+    ('queue.Queue', stdlib_queue_pair),
+    ('collections.deque', deque_pair),
+]
+
+
+def run_pipeline(make_pair, n_threads):
+    produce, consume, stop = make_pair()
+    per_producer = ITEMS // n_threads
+    producers = [threading.Thread(target=produce, args=(list(range(p * per_producer, (p + 1) * per_producer)),))
+                 for p in range(n_threads)]
+    consumers = [threading.Thread(target=consume) for _ in range(n_threads)]
+
+    start = time.perf_counter()
+    for t in consumers + producers:
+        t.start()
+    for t in producers:
+        t.join()
+    for _ in consumers:
+        stop()
+    for t in consumers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return per_producer * n_threads / elapsed
+
+
+def benchmark_throughput():
+    print("Benchmarking producer/consumer throughput...")
+    thread_counts = [1, 2, 4, 8]
+    results = {}
+
+    for name, make_pair in IMPLEMENTATIONS:
+        throughputs = []
+        for n in thread_counts:
+            ops = run_pipeline(make_pair, n)
+            throughputs.append(ops / 1000)
+            print(f"  {name}, {n} producers/{n} consumers: {ops / 1000:.0f}K items/sec")
+        results[name] = throughputs
+
+    return thread_counts, results
+
+
+def plot_results():
+    fig, ax = plt.subplots(1, 1, figsize=(10, 6))
+
+    thread_counts, results = benchmark_throughput()
+    for name, throughputs in results.items():
+        ax.plot(thread_counts, throughputs, marker='o', label=name, linewidth=2)
+    ax.set_title(f'Producer/Consumer Throughput ({ITEMS:,} items, maxsize {MAXSIZE})')
+    ax.set_xlabel('Producers (= consumers)')
+    ax.set_ylabel('K items/sec')
+    ax.set_xticks(thread_counts)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig('concurrent_queue_benchmarks.png', dpi=150, bbox_inches='tight')
+    print("\nBenchmark plot saved as 'concurrent_queue_benchmarks.png'")
+
+
+if __name__ == "__main__":
+    plot_results()
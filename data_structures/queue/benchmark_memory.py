@@ -1,7 +1,9 @@
 import sys
 import gc
+import time
+import tracemalloc
 import matplotlib.pyplot as plt
-from queue_linked import QueueLinked
+from queue_linked import QueueLinked, QueueNode
 from queue_circular import QueueCircular
 from queue_dynamic_circular import QueueDynamicCircular
 from collections import deque
@@ -31,6 +33,9 @@ def get_size(obj):
         node_count = 0
         while current and node_count < 100000:  # Safety limit
             size += sys.getsizeof(current)
+            # nodes without __slots__ carry a per-instance dict as well
+            if hasattr(current, '__dict__'):
+                size += sys.getsizeof(current.__dict__)
             if hasattr(current, 'val') and current.val is not None:
                 size += sys.getsizeof(current.val)
             current = getattr(current, 'next', None)
@@ -237,6 +242,59 @@ def benchmark_memory_efficiency_patterns():
     return results
 
 
+class DictQueueNode:
+    """QueueNode as it was before __slots__, kept for the before/after comparison"""
+
+    def __init__(self, val=0):
+        self.val = val
+        self.next = None
+
+
+def traced_bytes_per_node(node_class, size):
+    """Bytes actually allocated per node while chaining size nodes"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    head = node = node_class()
+    for _ in range(size):
+        # share one value so only the node itself is measured
+        node.next = node_class(None)
+        node = node.next
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del head, node
+    return allocated / size
+
+
+def benchmark_node_layout():
+    print("\nBenchmarking node layout (bytes per element, node overhead only)...")
+    sizes = [10000, 100000, 500000]
+
+    for size in sizes:
+        before = traced_bytes_per_node(DictQueueNode, size)
+        after = traced_bytes_per_node(QueueNode, size)
+        print(f"  Size {size}: {before:.1f} bytes/element with __dict__, "
+              f"{after:.1f} bytes/element with __slots__ ({before / after:.2f}x)")
+
+    print("\nBenchmarking node pool under steady-state churn...")
+    ops = 200000
+    for pool_size in [0, 1024]:
+        q = QueueLinked(pool_size=pool_size)
+        for i in range(1000):
+            q.enqueue(i)
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        for i in range(ops):
+            q.enqueue(i)
+            q.dequeue()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  pool_size={pool_size}: {elapsed / ops * 1000000:.3f} μs per enqueue+dequeue, "
+              f"traced peak {peak} bytes")
+
+
 def plot_memory_results():
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
 
@@ -294,6 +352,8 @@ def plot_memory_results():
     ax4.legend()
     ax4.grid(True, alpha=0.3)
 
+    benchmark_node_layout()
+
     plt.tight_layout()
     plt.savefig('queue_memory_benchmarks.png', dpi=150, bbox_inches='tight')
     print(f"\nMemory benchmark plot saved as 'queue_memory_benchmarks.png'")
@@ -0,0 +1,93 @@
+import threading
+from queue_dynamic_circular import QueueDynamicCircular
+
+
+class BlockingQueue:
+    def __init__(self, maxsize=0, factory=QueueDynamicCircular):
+        # wraps any of the single-threaded queues (anything with enqueue/
+        # dequeue) behind one lock; maxsize <= 0 means unbounded
+        self._queue = factory()
+        self._maxsize = maxsize
+        # counted here, QueueLinked.size() walks the whole chain
+        self._count = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, val, block=True, timeout=None):
+        """Add item to back of queue, waiting for space if bounded. Raise exception on timeout."""
+        with self._lock:
+            self._wait(self._not_full, self._has_space, block, timeout)
+            self._queue.enqueue(val)
+            self._count += 1
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return item from front of queue, waiting for one. Raise exception on timeout."""
+        with self._lock:
+            self._wait(self._not_empty, self._has_items, block, timeout)
+            val = self._queue.dequeue()
+            self._count -= 1
+            # wake every producer, a batch waiting for room may need
+            # more than the one slot freed
+            self._not_full.notify_all()
+            return val
+
+    def put_many(self, iterable, block=True, timeout=None):
+        """Add every item, taking the lock once per batch. Raise exception on timeout."""
+        # all or nothing: waits until the whole batch fits, so on a timeout
+        # none of it was queued and the caller can simply retry
+        items = list(iterable)
+        if 0 < self._maxsize < len(items):
+            raise ValueError("batch larger than maxsize")
+        with self._lock:
+            self._wait(self._not_full, lambda: self._has_room(len(items)), block, timeout)
+            enqueue = self._queue.enqueue
+            for val in items:
+                enqueue(val)
+            self._count += len(items)
+            self._not_empty.notify(len(items))
+
+    def get_many(self, max_items, block=True, timeout=None):
+        """Remove and return up to max_items, front first, waiting for at least one. Raise exception on timeout."""
+        if max_items < 1:
+            raise ValueError("max_items must be positive")
+        with self._lock:
+            self._wait(self._not_empty, self._has_items, block, timeout)
+            n = min(max_items, self._count)
+            dequeue = self._queue.dequeue
+            items = [dequeue() for _ in range(n)]
+            self._count -= n
+            self._not_full.notify_all()
+            return items
+
+    def size(self):
+        """Return number of items in queue"""
+        return self._count
+
+    def is_empty(self):
+        """Return True if queue is empty"""
+        return self._count == 0
+
+    def __len__(self):
+        return self._count
+
+    def _has_items(self):
+        return self._count > 0
+
+    def _has_space(self):
+        return self._maxsize <= 0 or self._count < self._maxsize
+
+    def _has_room(self, n):
+        return self._maxsize <= 0 or self._count + n <= self._maxsize
+
+    def _wait(self, condition, ready, block, timeout):
+        # called with the lock held; waiting releases it
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be non-negative")
+        if block:
+            ready_now = condition.wait_for(ready, timeout)
+        else:
+            ready_now = ready()
+        if not ready_now:
+            raise IndexError
@@ -1,17 +1,24 @@
 class QueueNode:
+    __slots__ = ('val', 'next')
+
     def __init__(self, val=0):
         self.val = val
         self.next = None
 
 
 class QueueLinked:
-    def __init__(self):
+    def __init__(self, pool_size=0):
         self.dummy_head = QueueNode()
         self.tail = self.dummy_head
+        # optional free list of removed nodes (chained through .next)
+        # that later insertions reuse instead of allocating
+        self._pool = None
+        self._pool_count = 0
+        self._pool_size = pool_size
 
     def enqueue(self, val):
         """Add item to back of queue"""
-        new_node = QueueNode(val)
+        new_node = self._new_node(val)
         self.tail.next = new_node
         self.tail = new_node
 
@@ -24,8 +31,28 @@ class QueueLinked:
         self.dummy_head.next = head.next
         if self.dummy_head.next is None:
             self.tail = self.dummy_head
+        self._release_node(head)
         return val
 
+    def _new_node(self, val):
+        # reuse a pooled node if there is one
+        node = self._pool
+        if node is None:
+            return QueueNode(val)
+        self._pool = node.next
+        self._pool_count -= 1
+        node.val = val
+        node.next = None
+        return node
+
+    def _release_node(self, node):
+        # keep up to pool_size spare nodes, drop the value reference
+        if self._pool_count < self._pool_size:
+            node.val = None
+            node.next = self._pool
+            self._pool = node
+            self._pool_count += 1
+
     def front(self):
         """Return front item without removing. Raise exception if empty."""
         head = self.dummy_head.next
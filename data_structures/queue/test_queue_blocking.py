@@ -0,0 +1,154 @@
+import threading
+import time
+
+from queue_blocking import BlockingQueue
+from queue_circular import QueueCircular
+from queue_linked import QueueLinked
+
+
+def test_fifo_single_thread():
+    """Test put/get order and size for each wrapped queue"""
+    for factory in [None, QueueLinked, lambda: QueueCircular(16)]:
+        q = BlockingQueue() if factory is None else BlockingQueue(factory=factory)
+        assert q.is_empty() and q.size() == 0
+        for i in range(5):
+            q.put(i)
+        assert len(q) == 5
+        assert [q.get() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert q.is_empty()
+
+
+def test_non_blocking_and_timeouts():
+    """Test block=False and timeouts raise IndexError"""
+    q = BlockingQueue(maxsize=2)
+    for op in [lambda: q.get(block=False), lambda: q.get(timeout=0.01),
+               lambda: q.get_many(3, timeout=0.01)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+
+    q.put(1)
+    q.put(2)
+    start = time.monotonic()
+    for op in [lambda: q.put(3, block=False), lambda: q.put(3, timeout=0.05)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+    assert time.monotonic() - start >= 0.05
+    assert q.size() == 2
+
+    for op, error in [(lambda: q.get(timeout=-1), ValueError), (lambda: q.get_many(0), ValueError)]:
+        try:
+            op()
+            assert False, "Should raise " + error.__name__
+        except error:
+            pass
+
+
+def test_batches():
+    """Test put_many/get_many, including all-or-nothing batches on a bounded queue"""
+    q = BlockingQueue()
+    q.put_many(range(10))
+    assert q.get_many(4) == [0, 1, 2, 3]
+    assert q.get_many(100) == [4, 5, 6, 7, 8, 9]
+    q.put_many([])
+    assert q.is_empty()
+
+    # a bounded queue adds a batch whole or not at all
+    q = BlockingQueue(maxsize=3)
+    try:
+        q.put_many(range(4))
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    q.put(0)
+    q.put(1)
+    for op in [lambda: q.put_many([2, 3], timeout=0.01), lambda: q.put_many([2, 3], block=False)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+        assert q.size() == 2
+    q.put_many([2])
+    assert q.get_many(10) == [0, 1, 2]
+
+    # with a consumer running, batches wait for room and keep their order
+    got = []
+
+    def consume():
+        while len(got) < 99:
+            got.extend(q.get_many(2, timeout=5))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for start in range(0, 99, 3):
+        q.put_many(range(start, start + 3))
+    consumer.join(timeout=5)
+    assert got == list(range(99))
+
+
+def test_blocking_get_wakes_up():
+    """Test a blocked get returns once another thread puts"""
+    q = BlockingQueue()
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(q.get(timeout=5)))
+    consumer.start()
+    time.sleep(0.05)
+    q.put('x')
+    consumer.join(timeout=5)
+    assert result == ['x']
+
+
+def test_producers_and_consumers():
+    """Test every item arrives exactly once with several producers and consumers"""
+    for factory in [QueueLinked, None]:
+        q = BlockingQueue(maxsize=64) if factory is None else BlockingQueue(64, factory)
+        producers, consumers, per_producer = 4, 4, 2000
+        received = [[] for _ in range(consumers)]
+
+        def produce(p):
+            items = [p * per_producer + i for i in range(per_producer)]
+            for start in range(0, per_producer // 2, 50):
+                q.put_many(items[start:start + 50])
+            for item in items[per_producer // 2:]:
+                q.put(item)
+
+        def consume(c):
+            while True:
+                batch = q.get_many(16, timeout=10)
+                if None in batch:
+                    # hand back any other consumers' sentinels
+                    end = batch.index(None)
+                    received[c].extend(batch[:end])
+                    q.put_many(batch[end + 1:])
+                    return
+                received[c].extend(batch)
+
+        threads = [threading.Thread(target=consume, args=(c,)) for c in range(consumers)]
+        threads += [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+        for t in threads:
+            t.start()
+        for t in threads[consumers:]:
+            t.join(timeout=10)
+        # one sentinel per consumer, queued after every real item
+        for _ in range(consumers):
+            q.put(None)
+        for t in threads[:consumers]:
+            t.join(timeout=10)
+
+        all_items = sorted(item for items in received for item in items)
+        assert all_items == list(range(producers * per_producer))
+
+
+if __name__ == "__main__":
+    test_fifo_single_thread()
+    test_non_blocking_and_timeouts()
+    test_batches()
+    test_blocking_get_wakes_up()
+    test_producers_and_consumers()
+    print("All blocking queue tests passed!")
@@ -156,6 +156,28 @@ def test_alternating_operations():
     assert q.to_list() == [4, 5]
 
 
+def test_node_pool():
+    """Test dequeued nodes are pooled and reused by enqueue"""
+    q = QueueLinked(pool_size=4)
+    for i in range(3):
+        q.enqueue(i)
+    first = q.dummy_head.next
+    assert q.dequeue() == 0
+    assert q._pool is first
+    assert first.val is None  # pooled nodes don't keep values alive
+
+    q.enqueue(3)
+    assert q.tail is first
+    assert q.to_list() == [1, 2, 3]
+
+    # Draining to empty still resets the tail
+    while not q.is_empty():
+        q.dequeue()
+    assert q.tail is q.dummy_head
+    q.enqueue(4)
+    assert q.to_list() == [4]
+
+
 if __name__ == "__main__":
     test_empty_queue()
     test_single_element()
@@ -164,4 +186,5 @@ if __name__ == "__main__":
     test_front_without_modifying()
     test_large_queue()
     test_alternating_operations()
+    test_node_pool()
     print("All queue tests passed!")
\ No newline at end of file
@@ -0,0 +1,127 @@
+from array import array
+
+NULL = -1
+
+
+class ArrayLinkedList:
+    def __init__(self):
+        # nodes are slots in two parallel columns instead of heap objects:
+        # _values[i] holds a value, _next[i] the slot after it (NULL at the
+        # end). slot 0 is the dummy head, freed slots are chained through
+        # _next from _free and reused before the columns grow
+        self._values = [None]
+        self._next = array('l', [NULL])
+        self._free = NULL
+        self._tail = 0
+        self._size = 0
+
+    def append(self, val):
+        i = self._new_slot(val)
+        self._next[self._tail] = i
+        self._tail = i
+        self._size += 1
+
+    def prepend(self, val):
+        self.insert(0, val)
+
+    def insert(self, index, val):
+        if not 0 <= index <= self._size:
+            raise IndexError
+        if index == self._size:
+            self.append(val)
+            return
+
+        # get slot before index to insert at
+        nxt = self._next
+        prev = 0
+        for _ in range(index):
+            prev = nxt[prev]
+        i = self._new_slot(val)
+        nxt[i] = nxt[prev]
+        nxt[prev] = i
+        self._size += 1
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        # get slot before index to delete
+        nxt = self._next
+        prev = 0
+        for _ in range(index):
+            prev = nxt[prev]
+        removed = nxt[prev]
+        if removed == self._tail:
+            self._tail = prev
+        val = self._values[removed]
+        nxt[prev] = nxt[removed]
+        self._size -= 1
+        self._release_slot(removed)
+        return val
+
+    def get(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        nxt = self._next
+        i = nxt[0]
+        for _ in range(index):
+            i = nxt[i]
+        return self._values[i]
+
+    def find(self, val):
+        values = self._values
+        nxt = self._next
+        i = nxt[0]
+        pos = 0
+        while i != NULL:
+            if values[i] == val:
+                return pos
+            i = nxt[i]
+            pos += 1
+        return -1
+
+    def size(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def to_list(self):
+        l = []
+        values = self._values
+        nxt = self._next
+        i = nxt[0]
+        while i != NULL:
+            l.append(values[i])
+            i = nxt[i]
+        return l
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        values = self._values
+        nxt = self._next
+        i = nxt[0]
+        while i != NULL:
+            yield values[i]
+            i = nxt[i]
+
+    def _new_slot(self, val):
+        # reuse a freed slot if there is one, otherwise grow both columns
+        i = self._free
+        if i == NULL:
+            self._values.append(val)
+            self._next.append(NULL)
+            return len(self._values) - 1
+        self._free = self._next[i]
+        self._values[i] = val
+        self._next[i] = NULL
+        return i
+
+    def _release_slot(self, i):
+        # drop the value reference and push the slot on the free list
+        self._values[i] = None
+        self._next[i] = self._free
+        self._free = i
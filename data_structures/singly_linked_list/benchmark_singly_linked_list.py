@@ -1,6 +1,21 @@
+import random
 import time
+import tracemalloc
 import matplotlib.pyplot as plt
+import singly_linked_list_dummy
+from array_linked_list import ArrayLinkedList
+from doubly_linked_list import DoublyLinkedList
 from singly_linked_list import SinglyLinkedList
+from skip_list import SkipList
+from unrolled_linked_list import UnrolledLinkedList
+
+# (label, factory) for the side-by-side comparisons
+VARIANTS = [
+    ('SinglyLinkedList (dummy head)', SinglyLinkedList),
+    ('SinglyLinkedList (head only)', singly_linked_list_dummy.SinglyLinkedList),
+    ('UnrolledLinkedList', UnrolledLinkedList),
+    ('ArrayLinkedList', ArrayLinkedList),
+]
 
 
 def time_operation(func, *args):
@@ -32,7 +47,7 @@ def benchmark_prepend():
 
 def benchmark_append():
     print("\nBenchmarking append...")
-    sizes = [1000, 2000, 3000, 4000, 5000]
+    sizes = [1000, 2000, 4000, 8000, 16000, 32000]
     times = []
 
     for size in sizes:
@@ -50,6 +65,45 @@ def benchmark_append():
     return sizes, times
 
 
+def benchmark_build():
+    print("\nBenchmarking build by append (total time)...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    times = []
+
+    def build(size):
+        ll = SinglyLinkedList()
+        for i in range(size):
+            ll.append(i)
+        return ll
+
+    for size in sizes:
+        elapsed, _ = time_operation(build, size)
+        times.append(elapsed * 1000)
+        print(f"Size {size}: {elapsed * 1000:.2f} ms to build")
+
+    return sizes, times
+
+
+def benchmark_size():
+    print("\nBenchmarking size...")
+    sizes = [1000, 10000, 100000, 1000000]
+    times = []
+
+    for size in sizes:
+        ll = SinglyLinkedList()
+        for i in range(size):
+            ll.prepend(i)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            ll.size()
+        avg_time = (time.perf_counter() - start) / 1000
+        times.append(avg_time * 1000000)
+        print(f"Size {size}: {avg_time * 1000000:.3f} μs per size()")
+
+    return sizes, times
+
+
 def benchmark_get():
     print("\nBenchmarking get (worst case - last element)...")
     sizes = [1000, 2000, 4000, 8000, 16000]
@@ -125,8 +179,247 @@ def benchmark_find():
     return sizes, times
 
 
+def build_variant(factory, size):
+    ll = factory()
+    for i in range(size):
+        ll.append(i)
+    return ll
+
+
+def benchmark_variants_traversal():
+    print("\nBenchmarking traversal (to_list) across variants...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    results = {}
+
+    for name, factory in VARIANTS:
+        times = []
+        for size in sizes:
+            ll = build_variant(factory, size)
+            elapsed, _ = time_operation(ll.to_list)
+            times.append(elapsed * 1000)
+            print(f"  {name}, size {size}: {elapsed * 1000:.2f} ms")
+        results[name] = times
+
+    return sizes, results
+
+
+def benchmark_variants_get():
+    print("\nBenchmarking indexed get across variants...")
+    sizes = [1000, 2000, 4000, 8000, 16000]
+    results = {}
+
+    for name, factory in VARIANTS:
+        times = []
+        for size in sizes:
+            ll = build_variant(factory, size)
+            # average over positions spread across the whole list
+            indices = range(0, size, size // 100)
+            start = time.perf_counter()
+            for index in indices:
+                ll.get(index)
+            avg_time = (time.perf_counter() - start) / len(indices)
+            times.append(avg_time * 1000000)
+            print(f"  {name}, size {size}: {avg_time * 1000000:.2f} μs per get")
+        results[name] = times
+
+    return sizes, results
+
+
+def benchmark_variants_find():
+    print("\nBenchmarking find (last element) across variants...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    results = {}
+
+    for name, factory in VARIANTS:
+        times = []
+        for size in sizes:
+            ll = build_variant(factory, size)
+            elapsed, _ = time_operation(ll.find, size - 1)
+            times.append(elapsed * 1000)
+            print(f"  {name}, size {size}: {elapsed * 1000:.2f} ms to find last element")
+        results[name] = times
+
+    return sizes, results
+
+
+def benchmark_variants_memory():
+    print("\nBenchmarking memory per element across variants...")
+    size = 100000
+    results = {}
+
+    for name, factory in VARIANTS:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        ll = factory()
+        for _ in range(size):
+            # share one value so only the structure itself is measured
+            ll.append(None)
+        per_element = (tracemalloc.get_traced_memory()[0] - before) / size
+        tracemalloc.stop()
+        del ll
+        results[name] = per_element
+        print(f"  {name}: {per_element:.1f} bytes per element")
+
+    return results
+
+
+def benchmark_positional_large():
+    print("\nBenchmarking positional get/insert/delete at 10^5-10^6 elements...")
+    sizes = [100000, 200000, 500000, 1000000]
+    ops = 20
+    rng = random.Random(0)
+    results = {}
+
+    for name, factory in [('SinglyLinkedList', SinglyLinkedList), ('SkipList', SkipList)]:
+        get_times, update_times = [], []
+        # grow one list through every size instead of rebuilding each time
+        ll = factory()
+        for size in sizes:
+            while ll.size() < size:
+                ll.append(ll.size())
+            positions = [rng.randrange(size) for _ in range(ops)]
+
+            start = time.perf_counter()
+            for index in positions:
+                ll.get(index)
+            get_times.append((time.perf_counter() - start) / ops * 1000000)
+
+            # insert then delete at the same spot keeps the size fixed
+            start = time.perf_counter()
+            for index in positions:
+                ll.insert(index, -1)
+                ll.delete(index)
+            update_times.append((time.perf_counter() - start) / ops * 1000000)
+
+            print(f"  {name}, size {size}: {get_times[-1]:.2f} μs per get, "
+                  f"{update_times[-1]:.2f} μs per insert+delete")
+        results[name] = (get_times, update_times)
+
+    return sizes, results
+
+
+def benchmark_merge():
+    print("\nBenchmarking merging two lists (append loop vs extend vs concat)...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    results = {'append loop': [], 'extend': [], 'concat': []}
+
+    def append_loop(a, b):
+        for val in b:
+            a.append(val)
+
+    for size in sizes:
+        for name, merge in [('append loop', append_loop),
+                            ('extend', SinglyLinkedList.extend),
+                            ('concat', SinglyLinkedList.concat)]:
+            a = build_variant(SinglyLinkedList, size)
+            b = build_variant(SinglyLinkedList, size)
+            elapsed, _ = time_operation(merge, a, b)
+            results[name].append(elapsed * 1000)
+            print(f"  {name}, size {size}: {elapsed * 1000:.3f} ms")
+
+    return sizes, results
+
+
+def benchmark_split():
+    print("\nBenchmarking split_at (middle)...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    times = []
+
+    for size in sizes:
+        ll = build_variant(SinglyLinkedList, size)
+        elapsed, _ = time_operation(ll.split_at, size // 2)
+        times.append(elapsed * 1000)
+        print(f"Size {size}: {elapsed * 1000:.3f} ms to split at the middle")
+
+    return sizes, times
+
+
+def benchmark_sort():
+    print("\nBenchmarking sort (relink merge sort vs to_list/sorted/rebuild)...")
+    sizes = [10000, 20000, 40000, 80000, 160000]
+    rng = random.Random(0)
+
+    def rebuild_sort(ll):
+        values = sorted(ll.to_list())
+        rebuilt = SinglyLinkedList()
+        rebuilt.extend(values)
+        return rebuilt
+
+    def relink_sort(ll):
+        ll.sort()
+        return ll
+
+    results = {}
+    for name, sort in [('relink sort', relink_sort), ('to_list/sorted/rebuild', rebuild_sort)]:
+        times, peaks = [], []
+        for size in sizes:
+            ll = SinglyLinkedList()
+            ll.extend(rng.random() for _ in range(size))
+
+            # timed and traced on separate copies, tracing slows it down
+            copy = SinglyLinkedList()
+            copy.extend(ll)
+            elapsed, _ = time_operation(sort, copy)
+            del copy
+
+            tracemalloc.start()
+            sort(ll)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            times.append(elapsed * 1000)
+            peaks.append(peak / 1024)
+            print(f"  {name}, size {size}: {elapsed * 1000:.2f} ms, peak {peak / 1024:.1f} KB")
+        results[name] = (times, peaks)
+
+    return sizes, results
+
+
+def benchmark_handle_removal():
+    print("\nBenchmarking mid-list removal (DoublyLinkedList handle vs SinglyLinkedList.delete)...")
+    sizes = [1000, 2000, 4000, 8000, 16000]
+    ops = 100
+    results = {'SinglyLinkedList.delete(middle)': [], 'DoublyLinkedList.remove(handle)': [],
+               'SinglyLinkedList delete+prepend': [], 'DoublyLinkedList.move_to_front': []}
+
+    for size in sizes:
+        ll = build_variant(SinglyLinkedList, size)
+        dl = DoublyLinkedList()
+        handles = [dl.append(i) for i in range(size)]
+        middle = size // 2
+        targets = handles[middle - ops // 2:middle + ops // 2]
+
+        elapsed, _ = time_operation(lambda: [ll.delete(middle - ops // 2) for _ in range(ops)])
+        results['SinglyLinkedList.delete(middle)'].append(elapsed / ops * 1000000)
+        elapsed, _ = time_operation(lambda: [dl.remove(node) for node in targets])
+        results['DoublyLinkedList.remove(handle)'].append(elapsed / ops * 1000000)
+
+        # LRU-style touch: bring a mid-list element to the front
+        ll = build_variant(SinglyLinkedList, size)
+        dl = DoublyLinkedList()
+        handles = [dl.append(i) for i in range(size)]
+        elapsed, _ = time_operation(lambda: [ll.prepend(ll.delete(middle)) for _ in range(ops)])
+        results['SinglyLinkedList delete+prepend'].append(elapsed / ops * 1000000)
+        elapsed, _ = time_operation(lambda: [dl.move_to_front(handles[middle + i]) for i in range(ops)])
+        results['DoublyLinkedList.move_to_front'].append(elapsed / ops * 1000000)
+
+        print(f"  Size {size}: " + ", ".join(f"{name} {times[-1]:.2f} μs" for name, times in results.items()))
+
+    return sizes, results
+
+
+def plot_variants(ax, sizes, results, title, ylabel):
+    for name, times in results.items():
+        ax.plot(sizes, times, marker='o', label=name)
+    ax.set_title(title)
+    ax.set_xlabel('List Size')
+    ax.set_ylabel(ylabel)
+    ax.legend()
+    ax.grid(True)
+
+
 def plot_results():
-    fig, ((ax1, ax2), (ax3, ax4), (ax5, ax6)) = plt.subplots(3, 2, figsize=(14, 12))
+    fig, ((ax1, ax2), (ax3, ax4), (ax5, ax6), (ax7, ax8), (ax9, ax10), (ax11, ax12), (ax13, ax14), (ax15, ax16), (ax17, ax18), (ax19, ax20)) = plt.subplots(10, 2, figsize=(14, 40))
 
     # Prepend - should be O(1)
     sizes, times = benchmark_prepend()
@@ -136,10 +429,10 @@ def plot_results():
     ax1.set_ylabel('Time per prepend (μs)')
     ax1.grid(True)
 
-    # Append - should be O(n)
+    # Append - O(1) with a tail pointer
     sizes, times = benchmark_append()
     ax2.plot(sizes, times, 'r-o')
-    ax2.set_title('Append Performance (Should be O(n) per operation)')
+    ax2.set_title('Append Performance (Should be O(1) with tail pointer)')
     ax2.set_xlabel('List Size')
     ax2.set_ylabel('Time per append (μs)')
     ax2.grid(True)
@@ -176,6 +469,85 @@ def plot_results():
     ax6.set_ylabel('Time to find (μs)')
     ax6.grid(True)
 
+    # Build by append - linear total time
+    sizes, times = benchmark_build()
+    ax7.plot(sizes, times, 'b-s')
+    ax7.set_title('Build N Elements by Append (Should be O(n) total)')
+    ax7.set_xlabel('List Size')
+    ax7.set_ylabel('Total time (ms)')
+    ax7.grid(True)
+
+    # Size - O(1) with a cached length
+    sizes, times = benchmark_size()
+    ax8.plot(sizes, times, 'g-s')
+    ax8.set_title('Size Performance (Should be O(1) cached)')
+    ax8.set_xlabel('List Size')
+    ax8.set_ylabel('Time per size() (μs)')
+    ax8.set_xscale('log')
+    ax8.grid(True)
+
+    # Node layout comparisons - unrolled nodes chase one pointer per node
+    sizes, results = benchmark_variants_traversal()
+    plot_variants(ax9, sizes, results, 'Traversal (to_list) by Variant', 'Time (ms)')
+
+    sizes, results = benchmark_variants_get()
+    plot_variants(ax10, sizes, results, 'Indexed Get by Variant (avg over positions)', 'Time per get (μs)')
+
+    sizes, results = benchmark_variants_find()
+    plot_variants(ax11, sizes, results, 'Find Last Element by Variant', 'Time (ms)')
+
+    results = benchmark_variants_memory()
+    ax12.bar(range(len(results)), list(results.values()), color=['b', 'r', 'g', 'm'])
+    ax12.set_xticks(range(len(results)))
+    ax12.set_xticklabels([name.replace(' (', '\n(') for name in results], fontsize=8)
+    ax12.set_title('Memory per Element (tracemalloc)')
+    ax12.set_ylabel('Bytes per element')
+    ax12.grid(True, axis='y')
+
+    # Positional access - O(n) walk vs O(log n) skip list
+    sizes, results = benchmark_positional_large()
+    for ax, i, title in [(ax13, 0, 'Get at Random Position (O(n) vs O(log n))'),
+                         (ax14, 1, 'Insert+Delete at Random Position (O(n) vs O(log n))')]:
+        for name, times in results.items():
+            ax.plot(sizes, times[i], marker='o', label=name)
+        ax.set_title(title)
+        ax.set_xlabel('List Size')
+        ax.set_ylabel('Time per operation (μs)')
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.legend()
+        ax.grid(True)
+
+    # Merging - concat relinks in O(1), extend links one prebuilt chain
+    sizes, results = benchmark_merge()
+    plot_variants(ax15, sizes, results, 'Merge Two Lists of N Elements', 'Time (ms)')
+    ax15.set_yscale('log')
+
+    # Split - O(index) walk to the split point
+    sizes, times = benchmark_split()
+    ax16.plot(sizes, times, 'm-o')
+    ax16.set_title('Split at Middle (Should be O(n))')
+    ax16.set_xlabel('List Size')
+    ax16.set_ylabel('Time to split (ms)')
+    ax16.grid(True)
+
+    # Sort - relinking needs no second copy of the elements
+    sizes, results = benchmark_sort()
+    plot_variants(ax17, sizes, {name: r[0] for name, r in results.items()},
+                  'Sort Time (Should be O(n log n))', 'Time (ms)')
+    plot_variants(ax18, sizes, {name: r[1] for name, r in results.items()},
+                  'Sort Peak Extra Memory (tracemalloc)', 'Peak (KB)')
+
+    # Handles - O(1) unlink vs O(index) walk
+    sizes, results = benchmark_handle_removal()
+    names = list(results)
+    plot_variants(ax19, sizes, {name: results[name] for name in names[:2]},
+                  'Mid-list Removal (O(n) walk vs O(1) handle)', 'Time per removal (μs)')
+    plot_variants(ax20, sizes, {name: results[name] for name in names[2:]},
+                  'Move Mid-list Element to Front', 'Time per move (μs)')
+    ax19.set_yscale('log')
+    ax20.set_yscale('log')
+
     plt.tight_layout()
     plt.savefig('singly_linked_list_benchmarks.png', dpi=150, bbox_inches='tight')
     print("\nBenchmark plot saved as 'singly_linked_list_benchmarks.png'")
@@ -0,0 +1,135 @@
+class DListNode:
+    __slots__ = ('val', 'prev', 'next', 'owner')
+
+    def __init__(self, val=0):
+        self.val = val
+        self.prev = None
+        self.next = None
+        # the list this node is linked into, None for the sentinel and
+        # for removed nodes
+        self.owner = None
+
+
+class DoublyLinkedList:
+    def __init__(self):
+        # circular list around one sentinel: head.next is the first node,
+        # head.prev the last, so there are no None checks at either end
+        self.head = DListNode()
+        self.head.prev = self.head
+        self.head.next = self.head
+        self._size = 0
+
+    # insert operations return the new node, which works as a handle
+    # for O(1) remove/move_to_front later
+
+    def append(self, val):
+        return self._link_after(self.head.prev, DListNode(val))
+
+    def prepend(self, val):
+        return self._link_after(self.head, DListNode(val))
+
+    def insert(self, index, val):
+        if not 0 <= index <= self._size:
+            raise IndexError
+        if index == self._size:
+            return self.append(val)
+        return self._link_after(self._node_at(index).prev, DListNode(val))
+
+    def remove(self, node):
+        self._check_owner(node)
+        self._unlink(node)
+        self._size -= 1
+        # a removed handle can't be removed or moved again
+        node.prev = node.next = node.owner = None
+        return node.val
+
+    def move_to_front(self, node):
+        self._check_owner(node)
+        self._unlink(node)
+        self._link_after(self.head, node)
+        self._size -= 1
+
+    def pop_front(self):
+        if self._size == 0:
+            raise IndexError
+        return self.remove(self.head.next)
+
+    def pop_back(self):
+        if self._size == 0:
+            raise IndexError
+        return self.remove(self.head.prev)
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+        return self.remove(self._node_at(index))
+
+    def get(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+        return self._node_at(index).val
+
+    def find(self, val):
+        node = self.head.next
+        i = 0
+        while node is not self.head:
+            if node.val == val:
+                return i
+            node = node.next
+            i += 1
+        return -1
+
+    def size(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def to_list(self):
+        return list(self)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        node = self.head.next
+        while node is not self.head:
+            yield node.val
+            node = node.next
+
+    def __reversed__(self):
+        node = self.head.prev
+        while node is not self.head:
+            yield node.val
+            node = node.prev
+
+    def _node_at(self, index):
+        # walk from whichever end is closer
+        if index < self._size // 2:
+            node = self.head.next
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self.head.prev
+            for _ in range(self._size - 1 - index):
+                node = node.prev
+        return node
+
+    def _check_owner(self, node):
+        # handles from another list, removed handles and the sentinel
+        # would all corrupt the sizes if unlinked here
+        if node.owner is not self:
+            raise ValueError("node is not in this list")
+
+    def _link_after(self, prev, node):
+        node.owner = self
+        node.prev = prev
+        node.next = prev.next
+        prev.next.prev = node
+        prev.next = node
+        self._size += 1
+        return node
+
+    def _unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
@@ -1,38 +1,51 @@
 class ListNode:
+    __slots__ = ('val', 'next')
+
     def __init__(self, val=0):
         self.val = val
         self.next = None
 
 
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, pool_size=0):
         self.head = ListNode()
+        # tail is the dummy head while the list is empty
+        self.tail = self.head
+        self._size = 0
+        # optional free list of removed nodes (chained through .next)
+        # that later insertions reuse instead of allocating
+        self._pool = None
+        self._pool_count = 0
+        self._pool_size = pool_size
 
     def append(self, val):
-        new_node = ListNode(val)
-
-        node = self.head
-        while node:
-            if node.next is None:
-                break
-            node = node.next
-        node.next = new_node
+        new_node = self._new_node(val)
+        self.tail.next = new_node
+        self.tail = new_node
+        self._size += 1
 
     def prepend(self, val):
-        new_real_head = ListNode(val)
+        new_real_head = self._new_node(val)
         new_real_head.next = self.head.next
         self.head.next = new_real_head
+        if self.tail is self.head:
+            self.tail = new_real_head
+        self._size += 1
 
     def insert(self, index, val):
-        new_node = ListNode(val)
-        
+        if index == self._size:
+            self.append(val)
+            return
+
         prev = self.head
         i = 0
         while prev:
             # get node before index to insert at
             if i == index:
+                new_node = self._new_node(val)
                 new_node.next = prev.next
                 prev.next = new_node
+                self._size += 1
                 return
             prev = prev.next
             i += 1
@@ -47,14 +60,122 @@ class SinglyLinkedList:
             if i == index:
                 if not node.next:
                     raise IndexError
-                val = node.next.val
-                node.next = node.next.next
+                if node.next is self.tail:
+                    self.tail = node
+                removed = node.next
+                val = removed.val
+                node.next = removed.next
+                self._size -= 1
+                self._release_node(removed)
                 return val
             node = node.next
             i += 1
 
         raise IndexError
 
+    def extend(self, iterable):
+        # build the new nodes into a chain of their own and link it on in
+        # one step; a failing iterable, or extending a list with itself,
+        # can't leave the list half extended
+        first = last = None
+        count = 0
+        for val in iterable:
+            node = self._new_node(val)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        if first is None:
+            return
+        self.tail.next = first
+        self.tail = last
+        self._size += count
+
+    def concat(self, other):
+        # steal other's whole chain in O(1), leaving other empty
+        if other is self:
+            raise ValueError("can't concatenate a list onto itself")
+        if type(other) is not type(self):
+            raise TypeError("can only concatenate the same kind of list")
+        if other._size == 0:
+            return
+        self.tail.next = other.head.next
+        self.tail = other.tail
+        other.head.next = None
+        other.tail = other.head
+        self._size += other._size
+        other._size = 0
+
+    def split_at(self, index):
+        # self keeps [0, index), the returned list takes [index, size)
+        if not 0 <= index <= self._size:
+            raise IndexError
+        rest = type(self)(self._pool_size)
+        if index == self._size:
+            return rest
+        prev = self.head
+        for _ in range(index):
+            prev = prev.next
+        rest.head.next = prev.next
+        rest.tail = self.tail
+        prev.next = None
+        self.tail = prev
+        rest._size = self._size - index
+        self._size = index
+        return rest
+
+    def sort(self, key=None):
+        # bottom-up merge sort that relinks nodes, so nothing is copied
+        # out and the extra space is O(1)
+        if self._size < 2:
+            return
+        first = self.head.next
+        dummy = ListNode()
+        width = 1
+        while width < self._size:
+            tail = dummy
+            node = first
+            try:
+                while node is not None:
+                    left = node
+                    right = _cut(left, width)
+                    node = _cut(right, width)
+                    tail = _merge(left, right, key, tail)
+            except Exception:
+                # a comparison raised; _merge left its two runs linked
+                # after the merged prefix, so add the runs this pass
+                # hadn't reached and keep the list whole, like list.sort
+                last = _last(dummy)
+                last.next = node
+                self.head.next = dummy.next
+                self.tail = _last(last)
+                raise
+            first = dummy.next
+            width *= 2
+        self.head.next = first
+        self.tail = tail
+
+
+    def _new_node(self, val):
+        # reuse a pooled node if there is one
+        node = self._pool
+        if node is None:
+            return ListNode(val)
+        self._pool = node.next
+        self._pool_count -= 1
+        node.val = val
+        node.next = None
+        return node
+
+    def _release_node(self, node):
+        # keep up to pool_size spare nodes, drop the value reference
+        if self._pool_count < self._pool_size:
+            node.val = None
+            node.next = self._pool
+            self._pool = node
+            self._pool_count += 1
 
     def get(self, index):
         node = self.head.next
@@ -77,12 +198,7 @@ class SinglyLinkedList:
         return -1
 
     def size(self):
-        node = self.head.next
-        i = 0
-        while node:
-            node = node.next
-            i += 1
-        return i
+        return self._size
 
     def is_empty(self):
         return not self.head.next
@@ -94,3 +210,101 @@ class SinglyLinkedList:
             l.append(node.val)
             node = node.next
         return l
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        node = self.head.next
+        while node:
+            yield node.val
+            node = node.next
+
+    def __reversed__(self):
+        # singly linked, so walk forward once collecting the values
+        # and hand them back from the end
+        stack = list(self)
+        while stack:
+            yield stack.pop()
+
+    def iter_range(self, start, stop):
+        # checked here rather than in the generator so a bad range fails
+        # at the call, not on the first next()
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError
+        return self._iter_range(start, stop)
+
+    def _iter_range(self, start, stop):
+        node = self.head.next
+        for _ in range(start):
+            node = node.next
+        for _ in range(stop - start):
+            yield node.val
+            node = node.next
+
+
+def _cut(node, n):
+    # detach the chain after the first n nodes and return its start
+    for _ in range(n - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge(a, b, key, tail):
+    # stable merge of two sorted chains by relinking their nodes onto
+    # tail, returns the merged chain's last node. If a comparison raises,
+    # the nodes not merged yet are still linked on before re-raising
+    try:
+        while a is not None and b is not None:
+            if (b.val < a.val) if key is None else (key(b.val) < key(a.val)):
+                tail.next = tail = b
+                b = b.next
+            else:
+                tail.next = tail = a
+                a = a.next
+    except Exception:
+        tail.next = a
+        _last(tail).next = b
+        raise
+    tail.next = a if a is not None else b
+    return _last(tail)
+
+
+def _last(node):
+    while node.next is not None:
+        node = node.next
+    return node
+
+
+def merge_sorted(a, b, key=None):
+    # merges two sorted lists into a new one by relinking their nodes,
+    # so a and b are left empty, the same as after concat()
+    if a is b:
+        raise ValueError("can't merge a list with itself")
+    if type(a) is not type(b):
+        raise TypeError("can only merge the same kind of list")
+    merged = type(a)(a._pool_size)
+    try:
+        merged.tail = _merge(a.head.next, b.head.next, key, merged.head)
+    except Exception:
+        # every node is chained after merged.head by now, give them all
+        # to a so neither list is left pointing into the other
+        a.head.next = merged.head.next
+        a.tail = _last(a.head)
+        a._size += b._size
+        b.head.next = None
+        b.tail = b.head
+        b._size = 0
+        raise
+    merged._size = a._size + b._size
+    a.head.next = b.head.next = None
+    a.tail = a.head
+    b.tail = b.head
+    a._size = b._size = 0
+    return merged
@@ -0,0 +1,135 @@
+import random
+
+MAX_LEVEL = 32
+P = 0.5
+
+
+class SkipNode:
+    __slots__ = ('val', 'next', 'width')
+
+    def __init__(self, val, level):
+        self.val = val
+        # next[l] is the following node on level l, width[l] how many
+        # level 0 steps that link skips over
+        self.next = [None] * level
+        self.width = [0] * level
+
+
+class SkipList:
+    def __init__(self, seed=None):
+        # an indexable skip list: the level 0 chain is the list itself, and
+        # the width-annotated express lanes above it let get/insert/delete
+        # skip to a position in expected O(log n)
+        self.head = SkipNode(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed).random
+        self.head.width[0] = 1
+
+    def append(self, val):
+        self.insert(self._size, val)
+
+    def prepend(self, val):
+        self.insert(0, val)
+
+    def insert(self, index, val):
+        if not 0 <= index <= self._size:
+            raise IndexError
+
+        level = self._random_level()
+        if level > self._level:
+            # fresh lanes start as one link from the head past the end
+            for l in range(self._level, level):
+                self.head.next[l] = None
+                self.head.width[l] = self._size + 1
+            self._level = level
+
+        update, positions = self._find_predecessors(index)
+        new_node = SkipNode(val, level)
+        for l in range(self._level):
+            prev = update[l]
+            if l < level:
+                # split the link around the new node
+                new_node.next[l] = prev.next[l]
+                prev.next[l] = new_node
+                new_node.width[l] = positions[l] + prev.width[l] + 1 - index
+                prev.width[l] = index - positions[l]
+            else:
+                prev.width[l] += 1
+        self._size += 1
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        update, _ = self._find_predecessors(index)
+        node = update[0].next[0]
+        for l in range(self._level):
+            prev = update[l]
+            if prev.next[l] is node:
+                prev.next[l] = node.next[l]
+                prev.width[l] += node.width[l] - 1
+            else:
+                prev.width[l] -= 1
+        self._size -= 1
+
+        while self._level > 1 and self.head.next[self._level - 1] is None:
+            self._level -= 1
+        return node.val
+
+    def get(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        node = self.head
+        pos = -1
+        for l in range(self._level - 1, -1, -1):
+            while node.next[l] is not None and pos + node.width[l] <= index:
+                pos += node.width[l]
+                node = node.next[l]
+        return node.val
+
+    def find(self, val):
+        node = self.head.next[0]
+        i = 0
+        while node:
+            if node.val == val:
+                return i
+            node = node.next[0]
+            i += 1
+        return -1
+
+    def size(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def to_list(self):
+        l = []
+        node = self.head.next[0]
+        while node:
+            l.append(node.val)
+            node = node.next[0]
+        return l
+
+    def _find_predecessors(self, index):
+        # the last node before index on every level, with its position
+        # (the head sits at position -1)
+        update = [None] * self._level
+        positions = [0] * self._level
+        node = self.head
+        pos = -1
+        for l in range(self._level - 1, -1, -1):
+            while node.next[l] is not None and pos + node.width[l] < index:
+                pos += node.width[l]
+                node = node.next[l]
+            update[l] = node
+            positions[l] = pos
+        return update, positions
+
+    def _random_level(self):
+        level = 1
+        while level < MAX_LEVEL and self._random() < P:
+            level += 1
+        return level
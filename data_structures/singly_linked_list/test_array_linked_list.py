@@ -0,0 +1,106 @@
+import random
+
+from array_linked_list import ArrayLinkedList
+
+
+def test_empty_list():
+    """Test operations on empty list"""
+    ll = ArrayLinkedList()
+    assert ll.is_empty() == True
+    assert ll.size() == 0
+    assert ll.to_list() == []
+    assert list(ll) == []
+    assert ll.find(1) == -1
+
+    try:
+        ll.get(0)
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+    try:
+        ll.delete(0)
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+
+def test_basic_operations():
+    """Test append, prepend, insert, delete, get and find"""
+    ll = ArrayLinkedList()
+    ll.append(1)
+    ll.append(3)
+    ll.prepend(0)
+    ll.insert(2, 2)
+    ll.insert(4, 4)
+    assert ll.to_list() == [0, 1, 2, 3, 4]
+    assert [ll.get(i) for i in range(5)] == [0, 1, 2, 3, 4]
+    assert ll.find(3) == 3
+    assert ll.find(999) == -1
+    assert len(ll) == 5
+
+    assert ll.delete(2) == 2
+    assert ll.delete(0) == 0
+    assert ll.delete(2) == 4  # the tail
+    assert ll.to_list() == [1, 3]
+    ll.append(5)
+    assert ll.to_list() == [1, 3, 5]
+
+    for op in [lambda: ll.insert(4, 0), lambda: ll.insert(-1, 0),
+               lambda: ll.get(3), lambda: ll.get(-1), lambda: ll.delete(3)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+    assert ll.size() == 3
+
+
+def test_free_list_reuse():
+    """Test deleted slots are reused before the columns grow"""
+    ll = ArrayLinkedList()
+    for i in range(10):
+        ll.append(i)
+    assert len(ll._values) == 11
+
+    for _ in range(4):
+        ll.delete(0)
+    # deleted values are released
+    assert ll._values.count(None) == 5
+
+    for i in range(4):
+        ll.append(100 + i)
+    assert len(ll._values) == 11
+    assert ll.to_list() == list(range(4, 10)) + [100, 101, 102, 103]
+
+    # emptying the list resets the tail to the dummy head
+    while not ll.is_empty():
+        ll.delete(ll.size() - 1)
+    ll.append(7)
+    assert ll.to_list() == [7]
+    assert len(ll._values) == 11
+
+
+def test_random_operations():
+    """Test random inserts and deletes against a plain list"""
+    rng = random.Random(17)
+    ll = ArrayLinkedList()
+    expected = []
+    for i in range(2000):
+        if expected and rng.random() < 0.45:
+            index = rng.randrange(len(expected))
+            assert ll.delete(index) == expected.pop(index)
+        else:
+            index = rng.randint(0, len(expected))
+            ll.insert(index, i)
+            expected.insert(index, i)
+    assert ll.to_list() == expected
+    assert [ll.get(i) for i in range(len(expected))] == expected
+
+
+if __name__ == "__main__":
+    test_empty_list()
+    test_basic_operations()
+    test_free_list_reuse()
+    test_random_operations()
+    print("All tests passed!")
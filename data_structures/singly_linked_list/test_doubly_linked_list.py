@@ -0,0 +1,125 @@
+import random
+
+from doubly_linked_list import DoublyLinkedList
+
+
+def test_empty_list():
+    """Test operations on empty list"""
+    dl = DoublyLinkedList()
+    assert dl.is_empty() == True
+    assert dl.size() == 0
+    assert dl.to_list() == []
+    assert list(reversed(dl)) == []
+
+    for op in [lambda: dl.get(0), lambda: dl.delete(0), dl.pop_front, dl.pop_back]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+
+
+def test_basic_operations():
+    """Test append, prepend, insert, get, find and delete by index"""
+    dl = DoublyLinkedList()
+    dl.append(1)
+    dl.append(3)
+    dl.prepend(0)
+    dl.insert(2, 2)
+    dl.insert(4, 4)
+    assert dl.to_list() == [0, 1, 2, 3, 4]
+    assert list(reversed(dl)) == [4, 3, 2, 1, 0]
+    assert [dl.get(i) for i in range(5)] == [0, 1, 2, 3, 4]
+    assert dl.find(3) == 3
+    assert dl.find(999) == -1
+    assert len(dl) == 5
+
+    assert dl.delete(3) == 3
+    assert dl.delete(0) == 0
+    assert dl.to_list() == [1, 2, 4]
+
+    for op in [lambda: dl.insert(4, 0), lambda: dl.insert(-1, 0),
+               lambda: dl.get(3), lambda: dl.delete(-1)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+    assert dl.size() == 3
+
+
+def test_handles():
+    """Test O(1) remove and move_to_front through node handles"""
+    dl = DoublyLinkedList()
+    handles = [dl.append(i) for i in range(5)]
+    assert handles[2].val == 2
+
+    # Remove from the middle, the front and the back
+    assert dl.remove(handles[2]) == 2
+    assert dl.remove(handles[0]) == 0
+    assert dl.remove(handles[4]) == 4
+    assert dl.to_list() == [1, 3]
+    assert dl.size() == 2
+
+    # A removed handle, another list's handle or the sentinel is rejected
+    other = DoublyLinkedList()
+    foreign = other.append(7)
+    for op in [lambda: dl.remove(handles[2]), lambda: dl.move_to_front(handles[2]),
+               lambda: dl.remove(foreign), lambda: dl.move_to_front(foreign),
+               lambda: dl.remove(dl.head), lambda: dl.move_to_front(dl.head)]:
+        try:
+            op()
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+    assert dl.to_list() == [1, 3] and dl.size() == 2
+    assert other.to_list() == [7] and other.size() == 1
+
+    # Move to front, including the node already at the front
+    front = dl.prepend(0)
+    back = dl.append(9)
+    dl.move_to_front(back)
+    assert dl.to_list() == [9, 0, 1, 3]
+    dl.move_to_front(back)
+    assert dl.to_list() == [9, 0, 1, 3]
+    dl.move_to_front(handles[3])
+    assert dl.to_list() == [3, 9, 0, 1]
+    assert dl.size() == 4
+
+    # Pop from both ends
+    assert dl.pop_back() == 1
+    assert dl.pop_front() == 3
+    assert dl.to_list() == [9, 0]
+    assert dl.remove(front) == 0
+    assert dl.pop_front() == 9
+    assert dl.is_empty()
+
+
+def test_lru_pattern():
+    """Test an LRU-style access pattern against a plain list"""
+    rng = random.Random(23)
+    dl = DoublyLinkedList()
+    handles = {}
+    expected = []
+    for step in range(2000):
+        key = rng.randrange(50)
+        if key in handles:
+            dl.move_to_front(handles[key])
+            expected.remove(key)
+        else:
+            handles[key] = dl.prepend(key)
+        expected.insert(0, key)
+        if len(expected) > 20:
+            evicted = dl.pop_back()
+            del handles[evicted]
+            assert evicted == expected.pop()
+    assert dl.to_list() == expected
+    assert list(reversed(dl)) == expected[::-1]
+
+
+if __name__ == "__main__":
+    test_empty_list()
+    test_basic_operations()
+    test_handles()
+    test_lru_pattern()
+    print("All tests passed!")
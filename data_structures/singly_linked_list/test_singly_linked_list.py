@@ -1,5 +1,12 @@
+import random
+
+import singly_linked_list
+import singly_linked_list_dummy
 from singly_linked_list import SinglyLinkedList
 
+# both implementations share the API, some tests run against each
+IMPLEMENTATIONS = [SinglyLinkedList, singly_linked_list_dummy.SinglyLinkedList]
+
 
 def test_empty_list():
     """Test operations on empty list"""
@@ -209,6 +216,305 @@ def test_edge_cases():
     assert ll.is_empty() == True
 
 
+def test_tail_and_size_tracking():
+    """Test tail pointer and cached size stay correct through every operation"""
+    for cls in IMPLEMENTATIONS:
+        ll = cls()
+        assert ll.size() == 0
+
+        # Prepend into an empty list sets the tail
+        ll.prepend(1)
+        ll.append(2)
+        assert ll.to_list() == [1, 2]
+        assert ll.tail.val == 2
+
+        # Insert at the end moves the tail
+        ll.insert(2, 3)
+        assert ll.tail.val == 3
+        ll.insert(1, 9)
+        assert ll.to_list() == [1, 9, 2, 3]
+        assert ll.size() == 4
+
+        # Deleting the tail moves it back
+        assert ll.delete(3) == 3
+        assert ll.tail.val == 2
+        ll.append(4)
+        assert ll.to_list() == [1, 9, 2, 4]
+
+        # Emptying the list resets the tail
+        while not ll.is_empty():
+            ll.delete(0)
+        assert ll.size() == 0
+        ll.append(5)
+        assert ll.to_list() == [5]
+        assert ll.tail.val == 5
+        assert ll.size() == 1
+
+        # Failed operations leave the size alone
+        for op in [lambda: ll.insert(3, 0), lambda: ll.delete(1), lambda: ll.insert(-1, 0)]:
+            try:
+                op()
+                assert False, "Should raise IndexError"
+            except IndexError:
+                pass
+        assert ll.size() == 1
+        assert ll.to_list() == [5]
+
+
+def test_node_pool():
+    """Test deleted nodes are pooled and reused by insert"""
+    for cls in IMPLEMENTATIONS:
+        ll = cls(pool_size=8)
+        for i in range(5):
+            ll.append(i)
+        ll.delete(4)
+        ll.delete(0)
+        assert ll._pool_count == 2
+
+        ll.insert(1, 10)
+        ll.prepend(20)
+        ll.append(30)
+        assert ll._pool_count == 0
+        assert ll.to_list() == [20, 1, 10, 2, 3, 30]
+        assert ll.tail.val == 30
+        assert ll.size() == 6
+
+        # A failed insert doesn't take a node from the pool
+        ll.delete(0)
+        try:
+            ll.insert(100, 0)
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+        assert ll._pool_count == 1
+
+
+def test_iteration():
+    """Test __iter__, __len__, __reversed__ and iter_range"""
+    for cls in IMPLEMENTATIONS:
+        ll = cls()
+        assert list(ll) == []
+        assert list(reversed(ll)) == []
+        assert len(ll) == 0
+        assert list(ll.iter_range(0, 0)) == []
+
+        for i in range(6):
+            ll.append(i * 10)
+        assert list(ll) == [0, 10, 20, 30, 40, 50]
+        assert list(reversed(ll)) == [50, 40, 30, 20, 10, 0]
+        assert len(ll) == 6
+        assert sum(ll) == 150
+
+        assert list(ll.iter_range(0, 6)) == [0, 10, 20, 30, 40, 50]
+        assert list(ll.iter_range(2, 4)) == [20, 30]
+        assert list(ll.iter_range(5, 6)) == [50]
+        assert list(ll.iter_range(3, 3)) == []
+
+        # iter_range is lazy, only the nodes asked for are visited
+        it = ll.iter_range(1, 6)
+        assert next(it) == 10
+        assert next(it) == 20
+
+        # a bad range fails at the call
+        for start, stop in [(-1, 2), (2, 1), (0, 7)]:
+            try:
+                ll.iter_range(start, stop)
+                assert False, "Should raise IndexError"
+            except IndexError:
+                pass
+
+
+def test_extend_concat_split():
+    """Test extend, concat and split_at keep head, tail and size right"""
+    for cls in IMPLEMENTATIONS:
+        # Extend an empty list, then a non-empty one
+        ll = cls()
+        ll.extend([])
+        assert ll.to_list() == [] and ll.size() == 0
+        ll.extend(range(3))
+        ll.extend(x * 10 for x in range(3, 5))
+        assert ll.to_list() == [0, 1, 2, 30, 40]
+        assert ll.tail.val == 40
+        assert ll.size() == 5
+
+        # Extending with itself doubles it once
+        ll.extend(ll)
+        assert ll.to_list() == [0, 1, 2, 30, 40] * 2
+        assert ll.size() == 10
+
+        # A failing iterable leaves the list as it was
+        def failing():
+            yield 1
+            raise RuntimeError
+        try:
+            ll.extend(failing())
+            assert False, "Should raise RuntimeError"
+        except RuntimeError:
+            pass
+        assert ll.size() == 10
+
+        # Concat steals the other list's nodes
+        a, b = cls(), cls()
+        a.extend([1, 2])
+        b.extend([3, 4, 5])
+        a.concat(b)
+        assert a.to_list() == [1, 2, 3, 4, 5]
+        assert a.tail.val == 5
+        assert a.size() == 5
+        assert b.to_list() == [] and b.size() == 0 and b.is_empty()
+        b.append(6)
+        assert b.to_list() == [6]
+        assert a.to_list() == [1, 2, 3, 4, 5]
+
+        empty = cls()
+        empty.concat(a)
+        assert empty.to_list() == [1, 2, 3, 4, 5]
+        empty.concat(cls())
+        assert empty.size() == 5
+
+        try:
+            empty.concat(empty)
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+        # Split in the middle, at the start and at the end
+        ll = cls()
+        ll.extend(range(6))
+        rest = ll.split_at(4)
+        assert type(rest) is cls
+        assert ll.to_list() == [0, 1, 2, 3] and ll.size() == 4
+        assert rest.to_list() == [4, 5] and rest.size() == 2
+        assert ll.tail.val == 3 and rest.tail.val == 5
+        ll.append(9)
+        rest.append(10)
+        assert ll.to_list() == [0, 1, 2, 3, 9]
+        assert rest.to_list() == [4, 5, 10]
+
+        rest = ll.split_at(5)
+        assert rest.to_list() == [] and ll.size() == 5
+        rest = ll.split_at(0)
+        assert ll.to_list() == [] and ll.size() == 0
+        assert rest.to_list() == [0, 1, 2, 3, 9]
+        ll.append(1)
+        assert ll.to_list() == [1]
+
+        for index in [-1, 2]:
+            try:
+                ll.split_at(index)
+                assert False, "Should raise IndexError"
+            except IndexError:
+                pass
+
+    # The two variants can't be mixed
+    try:
+        SinglyLinkedList().concat(singly_linked_list_dummy.SinglyLinkedList())
+        assert False, "Should raise TypeError"
+    except TypeError:
+        pass
+
+
+def test_sort_and_merge():
+    """Test in-place merge sort and merge_sorted for both variants"""
+    rng = random.Random(11)
+    for module in [singly_linked_list, singly_linked_list_dummy]:
+        cls = module.SinglyLinkedList
+
+        # Empty and single element lists are left alone
+        ll = cls()
+        ll.sort()
+        assert ll.to_list() == []
+        ll.append(1)
+        ll.sort()
+        assert ll.to_list() == [1] and ll.tail.val == 1
+
+        # Random sizes, including non powers of two
+        for size in [2, 3, 7, 16, 100, 257]:
+            values = [rng.randrange(50) for _ in range(size)]
+            ll = cls()
+            ll.extend(values)
+            ll.sort()
+            assert ll.to_list() == sorted(values)
+            assert ll.tail.val == max(values)
+            assert ll.size() == size
+            ll.append(-1)
+            assert ll.to_list()[-1] == -1
+
+        # Key and stability
+        ll = cls()
+        ll.extend([(2, 'a'), (1, 'b'), (2, 'c'), (1, 'd')])
+        ll.sort(key=lambda pair: pair[0])
+        assert ll.to_list() == [(1, 'b'), (1, 'd'), (2, 'a'), (2, 'c')]
+
+        # Merge two sorted lists, emptying both
+        a, b = cls(), cls()
+        a.extend([1, 4, 4, 9])
+        b.extend([0, 4, 5])
+        merged = module.merge_sorted(a, b)
+        assert type(merged) is cls
+        assert merged.to_list() == [0, 1, 4, 4, 4, 5, 9]
+        assert merged.size() == 7 and merged.tail.val == 9
+        assert a.size() == 0 and b.size() == 0
+        assert a.to_list() == [] and b.to_list() == []
+        a.append(3)
+        assert a.to_list() == [3]
+
+        # Merging with an empty list
+        merged = module.merge_sorted(cls(), merged)
+        assert merged.to_list() == [0, 1, 4, 4, 4, 5, 9]
+        merged = module.merge_sorted(cls(), cls())
+        assert merged.to_list() == [] and merged.size() == 0
+        merged.append(1)
+        assert merged.to_list() == [1]
+
+        try:
+            module.merge_sorted(merged, merged)
+            assert False, "Should raise ValueError"
+        except ValueError:
+            pass
+
+
+def test_sort_failure_keeps_list_whole():
+    """Test a raising comparison or key leaves every element linked in"""
+    def bad_key(val):
+        if val == 5:
+            raise KeyError(val)
+        return val
+
+    for module in [singly_linked_list, singly_linked_list_dummy]:
+        cls = module.SinglyLinkedList
+        for values, key, error in [([3, 1, 'a', 2, 5, 4], None, TypeError),
+                                   ([3, 1, 7, 2, 5, 4, 6, 0, 9], bad_key, KeyError),
+                                   (list(range(20, 0, -1)) + ['a'], None, TypeError)]:
+            ll = cls()
+            ll.extend(values)
+            try:
+                ll.sort(key=key)
+                assert False, "Should raise " + error.__name__
+            except error:
+                pass
+            assert ll.size() == len(values)
+            assert sorted(ll.to_list(), key=str) == sorted(values, key=str)
+            assert ll.tail.next is None
+            ll.append(99)
+            assert ll.to_list()[-1] == 99 and ll.size() == len(values) + 1
+
+        # merge_sorted hands every node to a when it fails
+        a, b = cls(), cls()
+        a.extend([1, 3, 'x'])
+        b.extend([2, 4])
+        try:
+            module.merge_sorted(a, b)
+            assert False, "Should raise TypeError"
+        except TypeError:
+            pass
+        assert a.size() == 5 and sorted(a.to_list(), key=str) == [1, 2, 3, 4, 'x']
+        assert b.size() == 0 and b.to_list() == []
+        a.append(0)
+        b.append(0)
+        assert a.to_list()[-1] == 0 and b.to_list() == [0]
+
+
 if __name__ == "__main__":
     test_empty_list()
     test_append()
@@ -219,4 +525,10 @@ if __name__ == "__main__":
     test_find()
     test_mixed_operations()
     test_edge_cases()
+    test_tail_and_size_tracking()
+    test_node_pool()
+    test_iteration()
+    test_extend_concat_split()
+    test_sort_and_merge()
+    test_sort_failure_keeps_list_whole()
     print("All tests passed!")
\ No newline at end of file
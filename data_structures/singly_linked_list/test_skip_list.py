@@ -0,0 +1,119 @@
+import random
+
+from skip_list import SkipList
+
+
+def check_widths(sl):
+    """Every link's width must match the level 0 distance it skips"""
+    positions = {id(sl.head): -1}
+    node = sl.head.next[0]
+    i = 0
+    while node:
+        positions[id(node)] = i
+        node = node.next[0]
+        i += 1
+
+    node = sl.head
+    while node:
+        for l in range(min(len(node.next), sl._level)):
+            target = node.next[l]
+            end = positions[id(target)] if target is not None else sl.size()
+            assert node.width[l] == end - positions[id(node)]
+        node = node.next[0]
+
+
+def test_empty_list():
+    """Test operations on empty list"""
+    sl = SkipList()
+    assert sl.is_empty() == True
+    assert sl.size() == 0
+    assert sl.to_list() == []
+    assert sl.find(1) == -1
+
+    try:
+        sl.get(0)
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+    try:
+        sl.delete(0)
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+
+def test_positional_operations():
+    """Test append, prepend, insert, delete and get by position"""
+    sl = SkipList(seed=1)
+    sl.append(1)
+    sl.append(3)
+    sl.prepend(0)
+    sl.insert(2, 2)
+    sl.insert(4, 4)
+    assert sl.to_list() == [0, 1, 2, 3, 4]
+    assert [sl.get(i) for i in range(5)] == [0, 1, 2, 3, 4]
+    assert sl.size() == 5
+
+    assert sl.delete(2) == 2
+    assert sl.delete(0) == 0
+    assert sl.delete(2) == 4
+    assert sl.to_list() == [1, 3]
+    check_widths(sl)
+
+    for op in [lambda: sl.insert(3, 0), lambda: sl.insert(-1, 0),
+               lambda: sl.get(2), lambda: sl.get(-1), lambda: sl.delete(2)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+    assert sl.size() == 2
+
+
+def test_find():
+    """Test find returns the first occurrence"""
+    sl = SkipList(seed=2)
+    for val in [10, 20, 30, 20]:
+        sl.append(val)
+    assert sl.find(10) == 0
+    assert sl.find(20) == 1
+    assert sl.find(30) == 2
+    assert sl.find(999) == -1
+
+
+def test_random_operations():
+    """Test random inserts and deletes against a plain list"""
+    rng = random.Random(5)
+    sl = SkipList(seed=5)
+    expected = []
+    for i in range(2000):
+        if expected and rng.random() < 0.45:
+            index = rng.randrange(len(expected))
+            assert sl.delete(index) == expected.pop(index)
+        else:
+            index = rng.randint(0, len(expected))
+            sl.insert(index, i)
+            expected.insert(index, i)
+        if i % 250 == 0:
+            check_widths(sl)
+
+    assert sl.to_list() == expected
+    assert [sl.get(i) for i in range(len(expected))] == expected
+    check_widths(sl)
+
+    # Drain completely, the levels collapse back down
+    while not sl.is_empty():
+        sl.delete(rng.randrange(sl.size()))
+    assert sl._level == 1
+    sl.append(7)
+    assert sl.to_list() == [7]
+    check_widths(sl)
+
+
+if __name__ == "__main__":
+    test_empty_list()
+    test_positional_operations()
+    test_find()
+    test_random_operations()
+    print("All tests passed!")
@@ -0,0 +1,154 @@
+import random
+
+from unrolled_linked_list import UnrolledLinkedList
+
+
+def test_empty_list():
+    """Test operations on empty list"""
+    ll = UnrolledLinkedList()
+    assert ll.is_empty() == True
+    assert ll.size() == 0
+    assert ll.to_list() == []
+    assert ll.find(1) == -1
+
+    try:
+        ll.get(0)
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+    try:
+        ll.delete(0)
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+
+def test_append_and_prepend():
+    """Test append and prepend across several nodes"""
+    ll = UnrolledLinkedList(node_capacity=4)
+    for i in range(10):
+        ll.append(i)
+    assert ll.to_list() == list(range(10))
+    assert ll.size() == 10
+    # appends fill each node before starting the next
+    assert ll.head.values == [0, 1, 2, 3]
+    assert ll.tail.values == [8, 9]
+
+    ll.prepend(-1)
+    ll.prepend(-2)
+    assert ll.to_list() == [-2, -1] + list(range(10))
+    assert ll.get(0) == -2
+    assert ll.get(11) == 9
+
+
+def test_insert_splits_nodes():
+    """Test insert at various positions and node split on overflow"""
+    ll = UnrolledLinkedList(node_capacity=4)
+    for i in range(4):
+        ll.append(i)
+
+    ll.insert(2, 10)  # overflows the only node
+    assert ll.to_list() == [0, 1, 10, 2, 3]
+    assert ll.head.values == [0, 1]
+    assert ll.head.next.values == [10, 2, 3]
+    assert ll.tail is ll.head.next
+
+    ll.insert(5, 4)
+    ll.insert(0, -1)
+    assert ll.to_list() == [-1, 0, 1, 10, 2, 3, 4]
+
+    for index in [-1, 8]:
+        try:
+            ll.insert(index, 999)
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+    assert ll.size() == 7
+
+
+def test_delete_merges_nodes():
+    """Test delete and node merge/borrow on underflow"""
+    ll = UnrolledLinkedList(node_capacity=4)
+    for i in range(12):  # [0..3] [4..7] [8..11]
+        ll.append(i)
+
+    # underflow borrows from a full successor
+    assert ll.delete(0) == 0
+    assert ll.delete(0) == 1
+    assert ll.head.values == [2, 3]
+    assert ll.delete(0) == 2
+    assert ll.head.values == [3, 4]
+    assert ll.head.next.values == [5, 6, 7]
+
+    # underflow merges when both fit in one node
+    assert ll.delete(0) == 3
+    assert ll.head.values == [4, 5, 6, 7]
+    assert ll.head.next.values == [8, 9, 10, 11]
+
+    # emptying the last node moves the tail back
+    for expected in [11, 10, 9, 8]:
+        assert ll.delete(ll.size() - 1) == expected
+    assert ll.tail is ll.head
+    assert ll.to_list() == [4, 5, 6, 7]
+
+    while not ll.is_empty():
+        ll.delete(0)
+    assert ll.head is None and ll.tail is None
+    ll.append(1)
+    assert ll.to_list() == [1]
+
+
+def test_find():
+    """Test find returns the first occurrence across nodes"""
+    ll = UnrolledLinkedList(node_capacity=3)
+    for val in [10, 20, 30, 40, 20, 50]:
+        ll.append(val)
+    assert ll.find(10) == 0
+    assert ll.find(20) == 1
+    assert ll.find(40) == 3
+    assert ll.find(50) == 5
+    assert ll.find(999) == -1
+
+
+def test_random_operations():
+    """Test random inserts and deletes against a plain list"""
+    rng = random.Random(3)
+    for capacity in [2, 3, 8, 64]:
+        ll = UnrolledLinkedList(node_capacity=capacity)
+        expected = []
+        for i in range(1000):
+            if expected and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                assert ll.delete(index) == expected.pop(index)
+            else:
+                index = rng.randint(0, len(expected))
+                ll.insert(index, i)
+                expected.insert(index, i)
+        assert ll.to_list() == expected
+        assert ll.size() == len(expected)
+        assert [ll.get(i) for i in range(len(expected))] == expected
+
+        # no node is ever over capacity or empty
+        node = ll.head
+        while node:
+            assert 0 < len(node.values) <= capacity
+            if node.next is None:
+                assert ll.tail is node
+            node = node.next
+
+    try:
+        UnrolledLinkedList(node_capacity=1)
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_empty_list()
+    test_append_and_prepend()
+    test_insert_splits_nodes()
+    test_delete_merges_nodes()
+    test_find()
+    test_random_operations()
+    print("All tests passed!")
@@ -0,0 +1,136 @@
+class UnrolledNode:
+    __slots__ = ('values', 'next')
+
+    def __init__(self, values=None):
+        self.values = [] if values is None else values
+        self.next = None
+
+
+class UnrolledLinkedList:
+    def __init__(self, node_capacity=16):
+        # each node holds up to node_capacity values in a small list, so a
+        # walk follows one pointer per node instead of one per element
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.head = None
+        self.tail = None
+        self._size = 0
+        self._node_capacity = node_capacity
+
+    def append(self, val):
+        # appends fill the tail node completely before starting a new one
+        if self.tail is None or len(self.tail.values) >= self._node_capacity:
+            node = UnrolledNode()
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+        self.tail.values.append(val)
+        self._size += 1
+
+    def prepend(self, val):
+        self.insert(0, val)
+
+    def insert(self, index, val):
+        if not 0 <= index <= self._size:
+            raise IndexError
+        if index == self._size:
+            self.append(val)
+            return
+
+        node = self.head
+        while index > len(node.values):
+            index -= len(node.values)
+            node = node.next
+
+        node.values.insert(index, val)
+        self._size += 1
+        if len(node.values) > self._node_capacity:
+            self._split(node)
+
+    def delete(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        prev = None
+        node = self.head
+        while index >= len(node.values):
+            index -= len(node.values)
+            prev = node
+            node = node.next
+
+        val = node.values.pop(index)
+        self._size -= 1
+        if len(node.values) < self._node_capacity // 2:
+            self._rebalance(prev, node)
+        return val
+
+    def get(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError
+
+        node = self.head
+        while index >= len(node.values):
+            index -= len(node.values)
+            node = node.next
+        return node.values[index]
+
+    def find(self, val):
+        node = self.head
+        i = 0
+        while node:
+            # the scan inside a node runs in C
+            if val in node.values:
+                return i + node.values.index(val)
+            i += len(node.values)
+            node = node.next
+        return -1
+
+    def size(self):
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def to_list(self):
+        l = []
+        node = self.head
+        while node:
+            l.extend(node.values)
+            node = node.next
+        return l
+
+    def _split(self, node):
+        # move the upper half of an overfull node into a new node after it
+        half = len(node.values) // 2
+        new_node = UnrolledNode(node.values[half:])
+        del node.values[half:]
+        new_node.next = node.next
+        node.next = new_node
+        if self.tail is node:
+            self.tail = new_node
+
+    def _rebalance(self, prev, node):
+        # an underfull node merges with its successor when both fit in
+        # one node, otherwise borrows from it back up to half capacity
+        nxt = node.next
+        if nxt is not None:
+            if len(node.values) + len(nxt.values) <= self._node_capacity:
+                node.values.extend(nxt.values)
+                node.next = nxt.next
+                if self.tail is nxt:
+                    self.tail = node
+            else:
+                k = self._node_capacity // 2 - len(node.values)
+                node.values.extend(nxt.values[:k])
+                del nxt.values[:k]
+            return
+
+        # the last node only goes away once it's empty
+        if not node.values:
+            if prev is None:
+                self.head = None
+            else:
+                prev.next = None
+            self.tail = prev
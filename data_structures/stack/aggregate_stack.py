@@ -0,0 +1,89 @@
+from array import array
+from itertools import accumulate, islice
+
+
+class AggregateStack:
+    """Stack that keeps an associative aggregate (min, max, sum, gcd, ...) in O(1)"""
+
+    def __init__(self, op=min, typecode=None, aggregate_typecode=None):
+        # _aggregates[i] is op folded over _values[:i + 1], so popping
+        # just drops the last entry of both columns; with a typecode the
+        # columns are array.arrays and nothing is boxed per element.
+        # aggregate_typecode defaults to typecode, pass a wider one when
+        # op can outgrow the values (e.g. 'b' values summed into 'q')
+        self._op = op
+        self._typecode = typecode
+        if aggregate_typecode is None:
+            aggregate_typecode = typecode
+        self._values = [] if typecode is None else array(typecode)
+        self._aggregates = [] if aggregate_typecode is None else array(aggregate_typecode)
+
+    def push(self, val):
+        """Add element to top of stack"""
+        aggregates = self._aggregates
+        aggregate = self._op(aggregates[-1], val) if aggregates else val
+        self._values.append(val)
+        try:
+            aggregates.append(aggregate)
+        except Exception:
+            # keep the two columns the same length
+            self._values.pop()
+            raise
+
+    def pop(self):
+        """Remove and return top element. Raise exception if empty."""
+        if not self._values:
+            raise IndexError("pop from empty stack")
+        self._aggregates.pop()
+        return self._values.pop()
+
+    def peek(self):
+        """Return top element without removing. Raise exception if empty."""
+        if not self._values:
+            raise IndexError("peek from empty stack")
+        return self._values[-1]
+
+    def aggregate(self):
+        """Return op folded over every element. Raise exception if empty."""
+        if not self._aggregates:
+            raise IndexError("aggregate of empty stack")
+        return self._aggregates[-1]
+
+    def push_many(self, iterable):
+        """Add every element of iterable, the last one ends up on top"""
+        values = list(iterable)
+        if not values:
+            return
+        if self._aggregates:
+            # the running fold continues from the current aggregate
+            running = list(islice(accumulate(values, self._op, initial=self._aggregates[-1]), 1, None))
+        else:
+            running = list(accumulate(values, self._op))
+        # a typed extend can fail part way through, so trim both columns
+        # back to where they were
+        n = len(self._values)
+        try:
+            self._values.extend(values)
+            self._aggregates.extend(running)
+        except Exception:
+            del self._values[n:]
+            del self._aggregates[n:]
+            raise
+
+    def is_empty(self):
+        """Return True if stack is empty"""
+        return len(self._values) == 0
+
+    def size(self):
+        """Return number of elements in stack"""
+        return len(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __bool__(self):
+        return len(self._values) > 0
+
+    def to_list(self):
+        """Convert to Python list (top to bottom)"""
+        return list(reversed(self._values))
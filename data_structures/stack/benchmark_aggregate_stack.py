@@ -0,0 +1,112 @@
+import random
+import time
+import matplotlib.pyplot as plt
+from aggregate_stack import AggregateStack
+from stack_array import StackArray
+
+
+def time_operation(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    end = time.perf_counter()
+    return end - start, result
+
+
+def push_and_query_aggregate(values):
+    s = AggregateStack(min)
+    for val in values:
+        s.push(val)
+        s.aggregate()
+
+
+def push_and_query_typed(values):
+    s = AggregateStack(min, 'q')
+    for val in values:
+        s.push(val)
+        s.aggregate()
+
+
+def push_and_query_recompute(values):
+    s = StackArray()
+    for val in values:
+        s.push(val)
+        min(s._data)
+
+
+def benchmark_push_and_query():
+    print("Benchmarking push + min query per push...")
+    sizes = [1000, 2000, 4000, 8000, 16000]
+    rng = random.Random(0)
+    results = {'AggregateStack': [], 'AggregateStack (typed)': [], 'min(stack) per query': []}
+
+    for size in sizes:
+        values = [rng.randrange(1000000) for _ in range(size)]
+        for name, run in [('AggregateStack', push_and_query_aggregate),
+                          ('AggregateStack (typed)', push_and_query_typed),
+                          ('min(stack) per query', push_and_query_recompute)]:
+            elapsed, _ = time_operation(run, values)
+            results[name].append(elapsed * 1000)
+            print(f"  {name}, size {size}: {elapsed * 1000:.2f} ms")
+
+    return sizes, results
+
+
+def benchmark_query():
+    print("\nBenchmarking a single min query at depth...")
+    sizes = [1000, 10000, 100000, 1000000]
+    rng = random.Random(1)
+    aggregate_times = []
+    recompute_times = []
+
+    for size in sizes:
+        values = [rng.randrange(1000000) for _ in range(size)]
+        s = AggregateStack(min)
+        s.push_many(values)
+        plain = StackArray()
+        plain.push_many(values)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            s.aggregate()
+        aggregate_time = (time.perf_counter() - start) / 1000 * 1000000
+        aggregate_times.append(aggregate_time)
+
+        elapsed, _ = time_operation(min, plain._data)
+        recompute_times.append(elapsed * 1000000)
+        print(f"  Size {size}: aggregate() {aggregate_time:.3f} μs, min(stack) {elapsed * 1000000:.1f} μs")
+
+    return sizes, aggregate_times, recompute_times
+
+
+def plot_results():
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Push + query - O(n) total vs O(n^2) total
+    sizes, results = benchmark_push_and_query()
+    for (name, times), style in zip(results.items(), ['b-o', 'g-^', 'r-s']):
+        ax1.plot(sizes, times, style, label=name, linewidth=2)
+    ax1.set_title('Push N, Query Min After Each Push')
+    ax1.set_xlabel('N')
+    ax1.set_ylabel('Total time (ms)')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Single query - O(1) vs O(n)
+    sizes, aggregate_times, recompute_times = benchmark_query()
+    ax2.plot(sizes, aggregate_times, 'b-o', label='aggregate() - O(1)', linewidth=2)
+    ax2.plot(sizes, recompute_times, 'r-s', label='min(stack) - O(n)', linewidth=2)
+    ax2.set_title('Single Min Query at Stack Depth')
+    ax2.set_xlabel('Stack Size')
+    ax2.set_ylabel('Time per query (μs)')
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig('aggregate_stack_benchmarks.png', dpi=150, bbox_inches='tight')
+    print("\nBenchmark plot saved as 'aggregate_stack_benchmarks.png'")
+
+
+if __name__ == "__main__":
+    plot_results()
@@ -0,0 +1,116 @@
+import threading
+import time
+import matplotlib.pyplot as plt
+from stack_array import StackArray
+from stack_blocking import BlockingStack
+
+ITEMS = 50000
+BATCH = 100
+MAXSIZE = 1024
+
+
+def run_blocking(n_threads, batched):
+    s = BlockingStack(MAXSIZE)
+    per_producer = ITEMS // n_threads
+
+    def produce():
+        if batched:
+            for start in range(0, per_producer, BATCH):
+                s.push_many(range(start, min(start + BATCH, per_producer)))
+        else:
+            for i in range(per_producer):
+                s.push(i)
+
+    def consume():
+        # every consumer takes exactly as many as one producer pushes
+        remaining = per_producer
+        while remaining:
+            if batched:
+                remaining -= len(s.pop_many(min(BATCH, remaining)))
+            else:
+                s.pop()
+                remaining -= 1
+
+    run_threads(produce, consume, n_threads)
+    return per_producer * n_threads
+
+
+def run_coarse_lock(n_threads):
+    # the pattern BlockingStack replaces: a plain StackArray behind a
+    # lock, with consumers polling while it's empty
+    s = StackArray()
+    lock = threading.Lock()
+    per_producer = ITEMS // n_threads
+
+    def produce():
+        for i in range(per_producer):
+            with lock:
+                s.push(i)
+
+    def consume():
+        remaining = per_producer
+        while remaining:
+            with lock:
+                if s.is_empty():
+                    popped = False
+                else:
+                    s.pop()
+                    popped = True
+            if popped:
+                remaining -= 1
+            else:
+                time.sleep(0)
+
+    run_threads(produce, consume, n_threads)
+    return per_producer * n_threads
+
+
+def run_threads(produce, consume, n_threads):
+    threads = [threading.Thread(target=consume) for _ in range(n_threads)]
+    threads += [threading.Thread(target=produce) for _ in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def benchmark_throughput():
+    print("Benchmarking producer/consumer stack throughput...")
+    thread_counts = [1, 2, 4, 8]
+    results = {}
+
+    for name, run in [('BlockingStack', lambda n: run_blocking(n, False)),
+                      ('BlockingStack (batched)', lambda n: run_blocking(n, True)),
+                      ('StackArray + Lock (polling)', run_coarse_lock)]:
+        throughputs = []
+        for n in thread_counts:
+            start = time.perf_counter()
+            items = run(n)
+            ops = items / (time.perf_counter() - start)
+            throughputs.append(ops / 1000)
+            print(f"  {name}, {n} producers/{n} consumers: {ops / 1000:.0f}K items/sec")
+        results[name] = throughputs
+
+    return thread_counts, results
+
+
+def plot_results():
+    fig, ax = plt.subplots(1, 1, figsize=(10, 6))
+
+    thread_counts, results = benchmark_throughput()
+    for name, throughputs in results.items():
+        ax.plot(thread_counts, throughputs, marker='o', label=name, linewidth=2)
+    ax.set_title(f'Producer/Consumer Stack Throughput ({ITEMS:,} items)')
+    ax.set_xlabel('Producers (= consumers)')
+    ax.set_ylabel('K items/sec')
+    ax.set_xticks(thread_counts)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig('concurrent_stack_benchmarks.png', dpi=150, bbox_inches='tight')
+    print("\nBenchmark plot saved as 'concurrent_stack_benchmarks.png'")
+
+
+if __name__ == "__main__":
+    plot_results()
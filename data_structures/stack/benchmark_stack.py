@@ -89,10 +89,16 @@ def benchmark_size():
         for i in range(size):
             s.push(i)
 
-        # Measure size() operation
-        elapsed, _ = time_operation(s.size)
-        times.append(elapsed * 1000000)
-        print(f"Stack size {size}: {elapsed * 1000000:.2f} μs to get size")
+        # Measure size() operation, averaged over many calls
+        total_time = 0
+        num_calls = 1000
+        for i in range(num_calls):
+            elapsed, _ = time_operation(s.size)
+            total_time += elapsed
+
+        avg_time = total_time / num_calls
+        times.append(avg_time * 1000000)
+        print(f"Stack size {size}: {avg_time * 1000000:.2f} μs to get size")
 
     return sizes, times
 
@@ -154,10 +160,10 @@ def plot_results():
     ax3.set_ylabel('Time per peek (μs)')
     ax3.grid(True)
 
-    # Size - depends on implementation (O(1) or O(n))
+    # Size - O(1) with the cached counter
     sizes, times = benchmark_size()
     ax4.plot(sizes, times, 'm-o')
-    ax4.set_title('Size Performance (O(1) if cached, O(n) if counted)')
+    ax4.set_title('Size Performance (Should be O(1))')
     ax4.set_xlabel('Stack Size')
     ax4.set_ylabel('Time to get size (μs)')
     ax4.grid(True)
@@ -1,6 +1,7 @@
 import time
 import matplotlib.pyplot as plt
 from stack_array import StackArray
+from typed_stack import TypedStack
 
 
 def time_operation(func, *args):
@@ -94,6 +95,8 @@ def plot_comparison():
         print("\nLinked list stack not implemented yet. Showing only array results.")
         linked_results = None
 
+    typed_results = benchmark_implementation(TypedStack, "Typed array.array Stack")
+
     # Plot results
     fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
 
@@ -103,6 +106,8 @@ def plot_comparison():
     if linked_results:
         _, linked_push_times = linked_results['push']
         ax1.plot(sizes, linked_push_times, 'r-s', label='Linked List', linewidth=2)
+    _, typed_push_times = typed_results['push']
+    ax1.plot(sizes, typed_push_times, 'g-^', label='Typed (array.array)', linewidth=2)
     ax1.set_title('Push Performance Comparison')
     ax1.set_xlabel('Stack Size')
     ax1.set_ylabel('Time per push (μs)')
@@ -115,6 +120,8 @@ def plot_comparison():
     if linked_results:
         _, linked_pop_times = linked_results['pop']
         ax2.plot(sizes, linked_pop_times, 'r-s', label='Linked List', linewidth=2)
+    _, typed_pop_times = typed_results['pop']
+    ax2.plot(sizes, typed_pop_times, 'g-^', label='Typed (array.array)', linewidth=2)
     ax2.set_title('Pop Performance Comparison')
     ax2.set_xlabel('Stack Size')
     ax2.set_ylabel('Time per pop (μs)')
@@ -127,6 +134,8 @@ def plot_comparison():
     if linked_results:
         _, linked_peek_times = linked_results['peek']
         ax3.plot(sizes, linked_peek_times, 'r-s', label='Linked List', linewidth=2)
+    _, typed_peek_times = typed_results['peek']
+    ax3.plot(sizes, typed_peek_times, 'g-^', label='Typed (array.array)', linewidth=2)
     ax3.set_title('Peek Performance Comparison')
     ax3.set_xlabel('Stack Size')
     ax3.set_ylabel('Time per peek (μs)')
@@ -2,8 +2,11 @@ import time
 import matplotlib.pyplot as plt
 import psutil
 import os
+import gc
 from stack_array import StackArray
 from stack import Stack
+from segmented_stack import SegmentedStack
+from typed_stack import TypedStack
 
 
 def time_operation(func, *args):
@@ -74,7 +77,6 @@ def benchmark_memory_usage():
     del s_array
 
     # Wait for garbage collection
-    import gc
     gc.collect()
     time.sleep(0.1)
 
@@ -88,6 +90,37 @@ def benchmark_memory_usage():
     print(f"Memory efficiency (Array/Linked): {array_mem/linked_mem:.2f}x")
     del s_linked
 
+    gc.collect()
+    time.sleep(0.1)
+
+    # Typed array memory usage - unboxed 8-byte ints
+    start_mem = get_memory_usage()
+    s_typed = TypedStack('q')
+    for i in range(size):
+        s_typed.push(i)
+    typed_mem = get_memory_usage() - start_mem
+    print(f"Typed array memory usage: {typed_mem:.1f} MB")
+    if typed_mem > 0:
+        print(f"Memory efficiency (Array/Typed): {array_mem/typed_mem:.2f}x")
+    del s_typed
+
+
+def push_latencies(s, size):
+    """Time every push while filling s to size, in μs"""
+    latencies = [0.0] * size
+    clock = time.perf_counter
+    # collector passes would otherwise dominate the max, and they
+    # aren't what this measures
+    gc.disable()
+    try:
+        for i in range(size):
+            start = clock()
+            s.push(i)
+            latencies[i] = (clock() - start) * 1000000
+    finally:
+        gc.enable()
+    return latencies
+
 
 def benchmark_resize_stress():
     """Test worst-case scenarios that trigger array resizes"""
@@ -96,41 +129,25 @@ def benchmark_resize_stress():
     # Test push patterns that will trigger multiple resizes
     resize_triggers = [2**i for i in range(10, 21)]  # Powers of 2 from 1K to 1M
 
-    array_worst_times = []
-    linked_times = []
+    # a resize shows up as a rare slow push, so the tail of the latency
+    # distribution matters more than the mean
+    results = {name: {'mean': [], 'p99': [], 'max': []}
+               for name in ['Array', 'Linked', 'Segmented']}
 
     for size in resize_triggers:
         print(f"\nTesting resize stress at {size:,} elements")
 
-        # Array - measure time for operations that trigger resize
-        s_array = StackArray()
-        # Pre-fill to just before resize trigger
-        for i in range(size - 100):
-            s_array.push(i)
-
-        # Measure the last 100 pushes (some will trigger resize)
-        start = time.perf_counter()
-        for i in range(100):
-            s_array.push(size + i)
-        array_time = (time.perf_counter() - start) / 100 * 1000000
-        array_worst_times.append(array_time)
-        print(f"  Array (near resize): {array_time:.3f} μs per push")
-
-        # Linked list - same pattern
-        s_linked = Stack()
-        for i in range(size - 100):
-            s_linked.push(i)
-
-        start = time.perf_counter()
-        for i in range(100):
-            s_linked.push(size + i)
-        linked_time = (time.perf_counter() - start) / 100 * 1000000
-        linked_times.append(linked_time)
-        print(f"  Linked: {linked_time:.3f} μs per push")
-
-        del s_array, s_linked
+        for name, cls in [('Array', StackArray), ('Linked', Stack), ('Segmented', SegmentedStack)]:
+            latencies = sorted(push_latencies(cls(), size))
+            mean = sum(latencies) / size
+            p99 = latencies[int(0.99 * (size - 1))]
+            worst = latencies[-1]
+            results[name]['mean'].append(mean)
+            results[name]['p99'].append(p99)
+            results[name]['max'].append(worst)
+            print(f"  {name}: mean {mean:.3f} μs, p99 {p99:.3f} μs, max {worst:.1f} μs per push")
 
-    return resize_triggers, array_worst_times, linked_times
+    return resize_triggers, results
 
 
 def benchmark_burst_patterns():
@@ -173,6 +190,42 @@ def benchmark_burst_patterns():
     return burst_sizes, array_burst_times, linked_burst_times
 
 
+def benchmark_batched_bursts():
+    """Compare per-item push/pop against push_many/pop_many in bursts"""
+    print("\n=== Batched Burst Benchmark ===")
+
+    burst_sizes = [1000, 5000, 10000, 50000, 100000]
+    results = {'Array per-item': [], 'Array batched': [],
+               'Linked per-item': [], 'Linked batched': []}
+
+    def per_item(s, burst_size):
+        for i in range(burst_size):
+            s.push(i)
+        for i in range(burst_size):
+            s.pop()
+
+    def batched(s, burst_size):
+        s.push_many(range(burst_size))
+        s.pop_many(burst_size)
+
+    for burst_size in burst_sizes:
+        print(f"\nTesting burst pattern: {burst_size:,} elements per burst")
+
+        for name, cls, burst in [('Array per-item', StackArray, per_item),
+                                 ('Array batched', StackArray, batched),
+                                 ('Linked per-item', Stack, per_item),
+                                 ('Linked batched', Stack, batched)]:
+            s = cls()
+            start = time.perf_counter()
+            for cycle in range(10):  # 10 burst cycles
+                burst(s, burst_size)
+            elapsed = (time.perf_counter() - start) / (10 * 2 * burst_size) * 1000000
+            results[name].append(elapsed)
+            print(f"  {name}: {elapsed:.3f} μs per element")
+
+    return burst_sizes, results
+
+
 def benchmark_size_operation():
     """Compare size() operation performance"""
     print("\n=== Size Operation Benchmark ===")
@@ -199,10 +252,11 @@ def benchmark_size_operation():
         array_size_times.append(array_time)
         print(f"  Array size(): {array_time:.3f} μs")
 
-        # Test linked size() - O(n)
+        # Test linked size() - O(1) with the cached counter
         start = time.perf_counter()
-        s_linked.size()  # Only once since it's expensive
-        linked_time = (time.perf_counter() - start) * 1000000
+        for _ in range(1000):
+            s_linked.size()
+        linked_time = (time.perf_counter() - start) / 1000 * 1000000
         linked_size_times.append(linked_time)
         print(f"  Linked size(): {linked_time:.3f} μs")
 
@@ -212,7 +266,7 @@ def benchmark_size_operation():
 
 
 def plot_intensive_results():
-    fig, ((ax1, ax2), (ax3, ax4), (ax5, _)) = plt.subplots(3, 2, figsize=(16, 12))
+    fig, ((ax1, ax2), (ax3, ax4), (ax5, ax6)) = plt.subplots(3, 2, figsize=(16, 12))
 
     # Large size comparison
     sizes, array_times, linked_times = benchmark_large_sizes()
@@ -228,16 +282,19 @@ def plot_intensive_results():
     # Memory usage
     benchmark_memory_usage()
 
-    # Resize stress
-    sizes, array_worst, linked_times = benchmark_resize_stress()
-    ax2.plot(sizes, array_worst, 'b-o', label='Array (resize stress)', linewidth=2, markersize=6)
-    ax2.plot(sizes, linked_times, 'r-s', label='Linked List', linewidth=2, markersize=6)
-    ax2.set_title('Resize Stress Test')
+    # Resize stress - mean, p99 and max push latency
+    sizes, results = benchmark_resize_stress()
+    for (name, stats), color in zip(results.items(), ['b', 'r', 'g']):
+        ax2.plot(sizes, stats['mean'], color + '-o', label=f'{name} mean', linewidth=2, markersize=4)
+        ax2.plot(sizes, stats['p99'], color + '--s', label=f'{name} p99', linewidth=1, markersize=4)
+        ax2.plot(sizes, stats['max'], color + ':^', label=f'{name} max', linewidth=1, markersize=4)
+    ax2.set_title('Resize Stress Test (push latency)')
     ax2.set_xlabel('Stack Size (resize triggers)')
     ax2.set_ylabel('Time per push (μs)')
-    ax2.legend()
+    ax2.legend(fontsize=7, ncol=3)
     ax2.grid(True, alpha=0.3)
     ax2.set_xscale('log')
+    ax2.set_yscale('log')
 
     # Burst patterns
     sizes, array_burst, linked_burst = benchmark_burst_patterns()
@@ -252,13 +309,13 @@ def plot_intensive_results():
     # Size operation
     sizes, array_size, linked_size = benchmark_size_operation()
     ax4.plot(sizes, array_size, 'b-o', label='Array size() - O(1)', linewidth=2, markersize=6)
-    ax4.plot(sizes, linked_size, 'r-s', label='Linked size() - O(n)', linewidth=2, markersize=6)
-    ax4.set_title('Size Operation Performance')
+    ax4.plot(sizes, linked_size, 'r-s', label='Linked size() - O(1)', linewidth=2, markersize=6)
+    ax4.set_title('Size Operation Performance (Should be flat)')
     ax4.set_xlabel('Stack Size')
     ax4.set_ylabel('Time (μs)')
     ax4.legend()
     ax4.grid(True, alpha=0.3)
-    ax4.set_yscale('log')
+    ax4.set_xscale('log')
 
     # Performance ratio over size
     ratio_sizes, ratio_array, ratio_linked = benchmark_large_sizes()
@@ -272,6 +329,17 @@ def plot_intensive_results():
     ax5.grid(True, alpha=0.3)
     ax5.set_xscale('log')
 
+    # Batched bursts
+    sizes, results = benchmark_batched_bursts()
+    for (name, times), style in zip(results.items(), ['b-o', 'b--o', 'r-s', 'r--s']):
+        ax6.plot(sizes, times, style, label=name, linewidth=2, markersize=6)
+    ax6.set_title('Burst Performance: Per-item vs Batched')
+    ax6.set_xlabel('Burst Size')
+    ax6.set_ylabel('Time per element (μs)')
+    ax6.legend()
+    ax6.grid(True, alpha=0.3)
+    ax6.set_xscale('log')
+
     plt.tight_layout()
     plt.savefig('intensive_stack_comparison.png', dpi=150, bbox_inches='tight')
     print(f"\n\nIntensive comparison plot saved as 'intensive_stack_comparison.png'")
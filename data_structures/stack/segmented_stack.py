@@ -0,0 +1,107 @@
+class StackChunk:
+    __slots__ = ('data', 'prev')
+
+    def __init__(self, size, prev=None):
+        self.data = [None] * size
+        self.prev = prev
+
+
+class SegmentedStack:
+    """Stack implementation using linked fixed-size chunks"""
+
+    def __init__(self, chunk_size=1024):
+        # growing links in one new chunk instead of reallocating and
+        # copying everything, so no single push pays for the whole stack
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._chunk_size = chunk_size
+        self._chunk = StackChunk(chunk_size)
+        # slots used in the top chunk
+        self._top = 0
+        # the last emptied chunk, kept so pushing and popping across a
+        # chunk boundary doesn't allocate a chunk every time
+        self._spare = None
+        self._size = 0
+
+    def push(self, val):
+        """Add element to top of stack"""
+        if self._top == self._chunk_size:
+            chunk = self._spare
+            if chunk is None:
+                chunk = StackChunk(self._chunk_size, self._chunk)
+            else:
+                self._spare = None
+                chunk.prev = self._chunk
+            self._chunk = chunk
+            self._top = 0
+        self._chunk.data[self._top] = val
+        self._top += 1
+        self._size += 1
+
+    def pop(self):
+        """Remove and return top element. Raise exception if empty."""
+        if self._size == 0:
+            raise IndexError("pop from empty stack")
+        if self._top == 0:
+            # step down into the full chunk below, caching the empty one
+            empty = self._chunk
+            self._chunk = empty.prev
+            empty.prev = None
+            self._spare = empty
+            self._top = self._chunk_size
+        self._top -= 1
+        data = self._chunk.data
+        val = data[self._top]
+        data[self._top] = None
+        self._size -= 1
+        return val
+
+    def peek(self):
+        """Return top element without removing. Raise exception if empty."""
+        if self._size == 0:
+            raise IndexError("peek from empty stack")
+        if self._top == 0:
+            return self._chunk.prev.data[-1]
+        return self._chunk.data[self._top - 1]
+
+    def push_many(self, iterable):
+        """Add every element of iterable, the last one ends up on top"""
+        # materialize first, so a failing iterable leaves the stack as it was
+        for val in list(iterable):
+            self.push(val)
+
+    def pop_many(self, k):
+        """Remove and return the top k elements, top first. Raise exception if fewer than k."""
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if k > self._size:
+            raise IndexError("pop_many from stack with fewer than k elements")
+        return [self.pop() for _ in range(k)]
+
+    def drain(self):
+        """Lazily remove and yield every element, top first"""
+        while self._size:
+            yield self.pop()
+
+    def is_empty(self):
+        """Return True if stack is empty"""
+        return self._size == 0
+
+    def size(self):
+        """Return number of elements in stack"""
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def to_list(self):
+        """Convert to Python list (top to bottom)"""
+        l = self._chunk.data[self._top - 1::-1] if self._top else []
+        chunk = self._chunk.prev
+        while chunk:
+            l.extend(reversed(chunk.data))
+            chunk = chunk.prev
+        return l
@@ -1,28 +1,110 @@
 class StackNode:
+    __slots__ = ('val', 'next')
+
     def __init__(self, val=0):
         self.val = val
         self.next = None
 
 
 class Stack:
-    def __init__(self):
+    def __init__(self, pool_size=0):
         # dummy head
         self.head = StackNode()
+        self._size = 0
+        # optional free list of removed nodes (chained through .next)
+        # that later insertions reuse instead of allocating
+        self._pool = None
+        self._pool_count = 0
+        self._pool_size = pool_size
 
     def push(self, val):
         """Add element to top of stack"""
-        new_head = StackNode(val)
+        new_head = self._new_node(val)
         new_head.next = self.head.next
         self.head.next = new_head
+        self._size += 1
 
     def pop(self):
         """Remove and return top element. Raise exception if empty."""
         if self.head.next is None:
             raise IndexError
-        val = self.head.next.val
-        self.head.next = self.head.next.next
+        top = self.head.next
+        val = top.val
+        self.head.next = top.next
+        self._size -= 1
+        self._release_node(top)
         return val
 
+    def push_many(self, iterable):
+        """Add every element of iterable, the last one ends up on top"""
+        # build the run of new nodes on top of the current one off to the
+        # side and link it in with one assignment, so a failing iterable
+        # leaves the stack as it was
+        top = self.head.next
+        count = 0
+        try:
+            for val in iterable:
+                node = self._new_node(val)
+                node.next = top
+                top = node
+                count += 1
+        except Exception:
+            # give the nodes of the unfinished run back to the pool
+            for _ in range(count):
+                nxt = top.next
+                self._release_node(top)
+                top = nxt
+            raise
+        self.head.next = top
+        self._size += count
+
+    def pop_many(self, k):
+        """Remove and return the top k elements, top first. Raise exception if fewer than k."""
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if k > self._size:
+            raise IndexError
+        popped = []
+        node = self.head.next
+        for _ in range(k):
+            popped.append(node.val)
+            nxt = node.next
+            self._release_node(node)
+            node = nxt
+        self.head.next = node
+        self._size -= k
+        return popped
+
+    def drain(self):
+        """Lazily remove and yield every element, top first"""
+        head = self.head
+        while head.next is not None:
+            top = head.next
+            head.next = top.next
+            self._size -= 1
+            val = top.val
+            self._release_node(top)
+            yield val
+
+    def _new_node(self, val):
+        # reuse a pooled node if there is one
+        node = self._pool
+        if node is None:
+            return StackNode(val)
+        self._pool = node.next
+        self._pool_count -= 1
+        node.val = val
+        node.next = None
+        return node
+
+    def _release_node(self, node):
+        # keep up to pool_size spare nodes, drop the value reference
+        if self._pool_count < self._pool_size:
+            node.val = None
+            node.next = self._pool
+            self._pool = node
+            self._pool_count += 1
+
     def peek(self):
         """Return top element without removing. Raise exception if empty."""
         if self.head.next is None:
@@ -35,12 +117,13 @@ class Stack:
 
     def size(self):
         """Return number of elements in stack"""
-        i = 0
-        node = self.head.next
-        while node:
-            i += 1
-            node = node.next
-        return i
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
 
     def to_list(self):
         """Convert to Python list (top to bottom)"""
@@ -14,6 +14,32 @@ class StackArray:
             raise IndexError("pop from empty stack")
         return self._data.pop()
 
+    def push_many(self, iterable):
+        """Add every element of iterable, the last one ends up on top"""
+        # materialize first, so a failing iterable leaves the stack as it
+        # was (list.extend would keep whatever it had already added)
+        if not isinstance(iterable, (list, tuple)):
+            iterable = list(iterable)
+        self._data.extend(iterable)
+
+    def pop_many(self, k):
+        """Remove and return the top k elements, top first. Raise exception if fewer than k."""
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if k > len(self._data):
+            raise IndexError("pop_many from stack with fewer than k elements")
+        if k == 0:
+            return []
+        popped = self._data[:-k - 1:-1]
+        del self._data[-k:]
+        return popped
+
+    def drain(self):
+        """Lazily remove and yield every element, top first"""
+        data = self._data
+        while data:
+            yield data.pop()
+
     def peek(self):
         """Return top element without removing. Raise exception if empty."""
         if self.is_empty():
@@ -28,6 +54,12 @@ class StackArray:
         """Return number of elements in stack"""
         return len(self._data)
 
+    def __len__(self):
+        return len(self._data)
+
+    def __bool__(self):
+        return len(self._data) > 0
+
     def to_list(self):
         """Convert to Python list (top to bottom)"""
         return self._data[::-1]  # Reverse to show top-to-bottom
\ No newline at end of file
@@ -0,0 +1,91 @@
+import threading
+from stack_array import StackArray
+
+
+class BlockingStack:
+    """Thread-safe stack wrapping one of the single-threaded stacks"""
+
+    def __init__(self, maxsize=0, factory=StackArray):
+        # any stack with push/pop/push_many/pop_many works (StackArray,
+        # Stack, SegmentedStack, TypedStack); maxsize <= 0 means unbounded
+        self._stack = factory()
+        self._maxsize = maxsize
+        self._count = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def push(self, val, block=True, timeout=None):
+        """Add element to top of stack, waiting for space if bounded. Raise exception on timeout."""
+        with self._lock:
+            self._wait(self._not_full, self._has_space, block, timeout)
+            self._stack.push(val)
+            self._count += 1
+            self._not_empty.notify()
+
+    def pop(self, block=True, timeout=None):
+        """Remove and return top element, waiting for one. Raise exception on timeout."""
+        with self._lock:
+            self._wait(self._not_empty, self._has_items, block, timeout)
+            val = self._stack.pop()
+            self._count -= 1
+            # wake every producer, a batch waiting for room may need
+            # more than the one slot freed
+            self._not_full.notify_all()
+            return val
+
+    def push_many(self, iterable, block=True, timeout=None):
+        """Add every element, taking the lock once per batch. Raise exception on timeout."""
+        # all or nothing: waits until the whole batch fits, so on a timeout
+        # none of it was pushed and the caller can simply retry
+        items = list(iterable)
+        if 0 < self._maxsize < len(items):
+            raise ValueError("batch larger than maxsize")
+        with self._lock:
+            self._wait(self._not_full, lambda: self._has_room(len(items)), block, timeout)
+            self._stack.push_many(items)
+            self._count += len(items)
+            self._not_empty.notify(len(items))
+
+    def pop_many(self, max_items, block=True, timeout=None):
+        """Remove and return up to max_items, top first, waiting for at least one. Raise exception on timeout."""
+        if max_items < 1:
+            raise ValueError("max_items must be positive")
+        with self._lock:
+            self._wait(self._not_empty, self._has_items, block, timeout)
+            n = min(max_items, self._count)
+            items = self._stack.pop_many(n)
+            self._count -= n
+            self._not_full.notify_all()
+            return items
+
+    def is_empty(self):
+        """Return True if stack is empty"""
+        return self._count == 0
+
+    def size(self):
+        """Return number of elements in stack"""
+        return self._count
+
+    def __len__(self):
+        return self._count
+
+    def _has_items(self):
+        return self._count > 0
+
+    def _has_space(self):
+        return self._maxsize <= 0 or self._count < self._maxsize
+
+    def _has_room(self, n):
+        return self._maxsize <= 0 or self._count + n <= self._maxsize
+
+    def _wait(self, condition, ready, block, timeout):
+        # called with the lock held; waiting releases it
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be non-negative")
+        if block:
+            ready_now = condition.wait_for(ready, timeout)
+        else:
+            ready_now = ready()
+        if not ready_now:
+            raise IndexError
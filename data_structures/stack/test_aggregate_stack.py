@@ -0,0 +1,154 @@
+import math
+import operator
+import random
+
+from aggregate_stack import AggregateStack
+
+
+def test_empty_stack():
+    """Test operations on empty stack"""
+    s = AggregateStack()
+    assert s.is_empty() == True
+    assert s.size() == 0
+    assert s.to_list() == []
+    assert not s
+
+    for op in [s.pop, s.peek, s.aggregate]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+
+
+def test_min_stack():
+    """Test the default min aggregate through pushes and pops"""
+    s = AggregateStack()
+    s.push(5)
+    assert s.aggregate() == 5
+    s.push(3)
+    s.push(7)
+    s.push(3)
+    assert s.aggregate() == 3
+    assert s.peek() == 3
+    assert s.to_list() == [3, 7, 3, 5]
+
+    assert s.pop() == 3
+    assert s.aggregate() == 3  # the earlier 3 is still there
+    assert s.pop() == 7
+    assert s.pop() == 3
+    assert s.aggregate() == 5
+    assert s.size() == 1 and len(s) == 1
+
+
+def test_other_aggregates():
+    """Test max, sum and gcd, with and without a typecode"""
+    for typecode in [None, 'q']:
+        for op, values in [(max, [3, 9, 2, 9, 1]),
+                           (operator.add, [1, 2, 3, 4, 5]),
+                           (math.gcd, [48, 36, 10, 7])]:
+            s = AggregateStack(op, typecode)
+            for i, val in enumerate(values):
+                s.push(val)
+                assert s.aggregate() == _fold(op, values[:i + 1])
+            for i in range(len(values) - 1, 0, -1):
+                s.pop()
+                assert s.aggregate() == _fold(op, values[:i])
+
+    s = AggregateStack(operator.add, 'd')
+    s.push(0.5)
+    s.push(0.25)
+    assert s.aggregate() == 0.75
+    assert s._values.typecode == 'd'
+
+
+def test_push_many():
+    """Test push_many continues the running aggregate"""
+    s = AggregateStack(min)
+    s.push_many([])
+    assert s.is_empty()
+    s.push_many([5, 7, 6])
+    assert s.aggregate() == 5
+    s.push_many(x for x in [9, 2, 8])
+    assert s.aggregate() == 2
+    assert s.to_list() == [8, 2, 9, 6, 7, 5]
+    for expected in [2, 5, 5, 5, 5]:
+        s.pop()
+        assert s.aggregate() == expected
+
+    s = AggregateStack(operator.add, 'q')
+    s.push(10)
+    s.push_many(range(5))
+    assert s.aggregate() == 20
+    assert list(s._aggregates) == [10, 10, 11, 13, 16, 20]
+
+
+def test_failed_push_leaves_stack_unchanged():
+    """Test a push whose op or typed append fails keeps both columns in step"""
+    s = AggregateStack(operator.add, 'b')
+    s.push(100)
+    try:
+        s.push(100)
+        assert False, "Should raise OverflowError"
+    except OverflowError:
+        pass
+    assert s.size() == 1 and s.aggregate() == 100
+
+    try:
+        s.push_many([1, 2, 100])
+        assert False, "Should raise OverflowError"
+    except OverflowError:
+        pass
+    assert s.size() == 1 and s.aggregate() == 100
+
+    s = AggregateStack(math.gcd)
+    s.push(4)
+    for op in [lambda: s.push(2.0), lambda: s.push_many([6, 2.0])]:
+        try:
+            op()
+            assert False, "Should raise TypeError"
+        except TypeError:
+            pass
+        assert s.size() == 1 and s.aggregate() == 4
+
+    # a wider aggregate column holds sums the values column can't
+    s = AggregateStack(operator.add, 'b', 'q')
+    s.push_many([100, 100, 100])
+    s.push(100)
+    assert s.aggregate() == 400
+    assert s._values.typecode == 'b'
+    assert s._aggregates.typecode == 'q'
+
+
+def test_random_against_recompute():
+    """Test random pushes and pops against folding the whole stack"""
+    rng = random.Random(31)
+    for op in [min, max, operator.add, math.gcd]:
+        s = AggregateStack(op)
+        expected = []
+        for _ in range(1000):
+            if expected and rng.random() < 0.4:
+                assert s.pop() == expected.pop()
+            else:
+                val = rng.randrange(1, 1000)
+                s.push(val)
+                expected.append(val)
+            if expected:
+                assert s.aggregate() == _fold(op, expected)
+
+
+def _fold(op, values):
+    result = values[0]
+    for val in values[1:]:
+        result = op(result, val)
+    return result
+
+
+if __name__ == "__main__":
+    test_empty_stack()
+    test_min_stack()
+    test_other_aggregates()
+    test_push_many()
+    test_failed_push_leaves_stack_unchanged()
+    test_random_against_recompute()
+    print("All aggregate stack tests passed!")
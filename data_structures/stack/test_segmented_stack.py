@@ -0,0 +1,120 @@
+from segmented_stack import SegmentedStack
+
+
+def test_empty_stack():
+    """Test operations on empty stack"""
+    s = SegmentedStack()
+    assert s.is_empty() == True
+    assert s.size() == 0
+    assert s.to_list() == []
+    assert not s
+
+    try:
+        s.pop()
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+    try:
+        s.peek()
+        assert False, "Should raise IndexError"
+    except IndexError:
+        pass
+
+
+def test_push_pop_across_chunks():
+    """Test LIFO order across several chunks"""
+    s = SegmentedStack(chunk_size=4)
+    for i in range(10):
+        s.push(i)
+        assert s.peek() == i
+    assert s.size() == 10
+    assert len(s) == 10
+    assert s.to_list() == list(range(9, -1, -1))
+
+    for i in range(9, -1, -1):
+        assert s.peek() == i
+        assert s.pop() == i
+    assert s.is_empty()
+    assert s.to_list() == []
+
+    # Refill after emptying
+    s.push(1)
+    assert s.to_list() == [1]
+
+
+def test_peek_at_chunk_boundary():
+    """Test peek and to_list right after stepping into a new chunk"""
+    s = SegmentedStack(chunk_size=3)
+    for i in range(4):
+        s.push(i)
+    s.pop()  # top chunk is now empty but still current
+    assert s._top == 0
+    assert s.peek() == 2
+    assert s.to_list() == [2, 1, 0]
+    assert s.pop() == 2
+
+
+def test_spare_chunk_reuse():
+    """Test pushing and popping around a boundary reuses the spare chunk"""
+    s = SegmentedStack(chunk_size=4)
+    for i in range(4):
+        s.push(i)
+
+    s.push(4)
+    second = s._chunk
+    s.pop()
+    s.pop()  # steps down, second chunk becomes the spare
+    assert s._spare is second
+    s.push(3)
+    s.push(4)
+    assert s._chunk is second
+    assert s._spare is None
+
+    # popped slots don't keep values alive
+    s.pop()
+    assert second.data == [None] * 4
+    assert s.to_list() == [3, 2, 1, 0]
+
+
+def test_batch_operations():
+    """Test push_many, pop_many and drain"""
+    s = SegmentedStack(chunk_size=4)
+    s.push_many(range(10))
+    assert s.pop_many(0) == []
+    assert s.pop_many(6) == [9, 8, 7, 6, 5, 4]
+    assert list(s.drain()) == [3, 2, 1, 0]
+    assert s.is_empty()
+
+    # A failing iterable leaves the stack as it was
+    def failing():
+        yield from range(6)
+        raise RuntimeError
+    try:
+        s.push_many(failing())
+        assert False, "Should raise RuntimeError"
+    except RuntimeError:
+        pass
+    assert s.is_empty()
+
+    for k, error in [(1, IndexError), (-1, ValueError)]:
+        try:
+            s.pop_many(k)
+            assert False, "Should raise " + error.__name__
+        except error:
+            pass
+
+    try:
+        SegmentedStack(chunk_size=0)
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_empty_stack()
+    test_push_pop_across_chunks()
+    test_peek_at_chunk_boundary()
+    test_spare_chunk_reuse()
+    test_batch_operations()
+    print("All segmented stack tests passed!")
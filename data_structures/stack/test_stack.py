@@ -1,4 +1,5 @@
 from stack import Stack
+from stack_array import StackArray
 
 
 def test_empty_stack():
@@ -156,6 +157,131 @@ def test_size_tracking():
         assert s.size() == 4 - i
 
 
+def test_len_and_bool():
+    """Test __len__ and __bool__ on both implementations"""
+    for cls in [Stack, StackArray]:
+        s = cls()
+        assert len(s) == 0
+        assert not s
+
+        s.push(0)  # a falsy value still makes the stack truthy
+        s.push(1)
+        assert len(s) == 2
+        assert s
+
+        # A failed pop leaves the size alone
+        s.pop()
+        s.pop()
+        try:
+            s.pop()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+        assert len(s) == 0 and s.size() == 0
+        assert not s
+
+
+def test_batch_operations():
+    """Test push_many, pop_many and drain on both implementations"""
+    for cls in [Stack, StackArray]:
+        s = cls()
+        s.push_many([])
+        assert s.size() == 0
+
+        s.push(0)
+        s.push_many(range(1, 6))
+        s.push_many(x * 10 for x in range(6, 8))
+        assert s.to_list() == [70, 60, 5, 4, 3, 2, 1, 0]
+        assert len(s) == 8
+        assert s.peek() == 70
+
+        # pop_many returns the top k, top first
+        assert s.pop_many(0) == []
+        assert s.pop_many(3) == [70, 60, 5]
+        assert s.size() == 5
+        assert s.pop_many(5) == [4, 3, 2, 1, 0]
+        assert s.is_empty()
+
+        for k, error in [(1, IndexError), (-1, ValueError)]:
+            try:
+                s.pop_many(k)
+                assert False, "Should raise " + error.__name__
+            except error:
+                pass
+
+        # drain is lazy, stopping early leaves the rest on the stack
+        s.push_many(range(5))
+        it = s.drain()
+        assert next(it) == 4
+        assert next(it) == 3
+        assert s.size() == 3
+        assert list(it) == [2, 1, 0]
+        assert s.is_empty() and len(s) == 0
+        s.push(9)
+        assert s.to_list() == [9]
+
+        # A failing iterable leaves the stack as it was
+        def failing():
+            yield 100
+            raise RuntimeError
+        try:
+            s.push_many(failing())
+            assert False, "Should raise RuntimeError"
+        except RuntimeError:
+            pass
+        assert s.to_list() == [9] and s.size() == 1
+
+
+def test_batch_operations_linked():
+    """Test the linked batch operations keep pooling and failures consistent"""
+    s = Stack(pool_size=4)
+    s.push_many(range(6))
+    assert s.pop_many(3) == [5, 4, 3]
+    assert s._pool_count == 3
+    list(s.drain())
+    assert s._pool_count == 4
+
+    s.push_many(range(3))
+    assert s._pool_count == 1
+
+    # A failing iterable leaves the stack as it was
+    def failing():
+        yield 100
+        raise RuntimeError
+    try:
+        s.push_many(failing())
+        assert False, "Should raise RuntimeError"
+    except RuntimeError:
+        pass
+    assert s.to_list() == [2, 1, 0]
+    assert s.size() == 3
+    assert s._pool_count == 1  # the node taken for 100 went back
+
+
+def test_node_pool():
+    """Test popped nodes are pooled and reused by push"""
+    s = Stack(pool_size=2)
+    for i in range(4):
+        s.push(i)
+    popped_nodes = [s.head.next, s.head.next.next]
+    assert s.pop() == 3
+    assert s.pop() == 2
+    assert s.pop() == 1  # pool already full, this node is dropped
+    assert s._pool_count == 2
+
+    s.push(10)
+    s.push(11)
+    assert s._pool_count == 0
+    assert s.head.next in popped_nodes
+    assert s.to_list() == [11, 10, 0]
+
+    # Without a pool nothing is kept
+    s = Stack()
+    s.push(1)
+    s.pop()
+    assert s._pool is None
+
+
 if __name__ == "__main__":
     test_empty_stack()
     test_push_single()
@@ -166,4 +292,8 @@ if __name__ == "__main__":
     test_lifo_behavior()
     test_edge_cases()
     test_size_tracking()
+    test_len_and_bool()
+    test_batch_operations()
+    test_batch_operations_linked()
+    test_node_pool()
     print("All stack tests passed!")
\ No newline at end of file
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from segmented_stack import SegmentedStack
+from stack import Stack
+from stack_blocking import BlockingStack
+from typed_stack import TypedStack
+
+
+def test_lifo_single_thread():
+    """Test push/pop order for each wrapped stack"""
+    for factory in [None, Stack, SegmentedStack, TypedStack]:
+        s = BlockingStack() if factory is None else BlockingStack(factory=factory)
+        assert s.is_empty() and s.size() == 0
+        for i in range(5):
+            s.push(i)
+        assert len(s) == 5
+        assert [s.pop() for _ in range(5)] == [4, 3, 2, 1, 0]
+
+        s.push_many(range(6))
+        assert s.pop_many(4) == [5, 4, 3, 2]
+        assert s.pop_many(10) == [1, 0]
+        assert s.is_empty()
+
+
+def test_non_blocking_and_timeouts():
+    """Test block=False and timeouts raise IndexError"""
+    s = BlockingStack(maxsize=2)
+    for op in [lambda: s.pop(block=False), lambda: s.pop(timeout=0.01),
+               lambda: s.pop_many(2, timeout=0.01)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+
+    s.push_many([1, 2])
+    for op in [lambda: s.push(3, block=False), lambda: s.push(3, timeout=0.01),
+               lambda: s.push_many([3], timeout=0.01)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+    assert s.size() == 2
+
+    # a batch is pushed whole or not at all
+    s.pop()
+    for op in [lambda: s.push_many([3, 4], timeout=0.01), lambda: s.push_many([3, 4], block=False)]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+        assert s.size() == 1
+
+    for op, error in [(lambda: s.pop_many(0), ValueError), (lambda: s.push_many(range(3)), ValueError),
+                      (lambda: s.pop(timeout=-1), ValueError)]:
+        try:
+            op()
+            assert False, "Should raise " + error.__name__
+        except error:
+            pass
+
+
+def test_producers_and_consumers():
+    """Test every element arrives exactly once across threads"""
+    s = BlockingStack(maxsize=32)
+    producers, per_producer = 4, 1000
+    total = producers * per_producer
+    received = []
+    received_lock = threading.Lock()
+
+    def produce(p):
+        items = range(p * per_producer, (p + 1) * per_producer)
+        for start in range(0, per_producer, 20):
+            s.push_many(items[start:start + 20])
+
+    def consume():
+        while True:
+            with received_lock:
+                if len(received) >= total:
+                    return
+            try:
+                batch = s.pop_many(8, timeout=0.05)
+            except IndexError:
+                continue
+            with received_lock:
+                received.extend(batch)
+
+    threads = [threading.Thread(target=consume) for _ in range(3)]
+    threads += [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    assert time.monotonic() - start < 10
+    assert sorted(received) == list(range(total))
+
+
+if __name__ == "__main__":
+    test_lifo_single_thread()
+    test_non_blocking_and_timeouts()
+    test_producers_and_consumers()
+    print("All blocking stack tests passed!")
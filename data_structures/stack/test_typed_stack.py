@@ -0,0 +1,97 @@
+from array import array
+
+from typed_stack import TypedStack
+
+
+def test_empty_stack():
+    """Test operations on empty stack"""
+    s = TypedStack()
+    assert s.is_empty() == True
+    assert s.size() == 0
+    assert s.to_list() == []
+    assert not s
+
+    for op in [s.pop, s.peek]:
+        try:
+            op()
+            assert False, "Should raise IndexError"
+        except IndexError:
+            pass
+
+
+def test_push_pop_peek():
+    """Test LIFO behaviour with unboxed storage"""
+    s = TypedStack('q')
+    for i in range(5):
+        s.push(i * 1000000)
+    assert s.peek() == 4000000
+    assert s.size() == 5 and len(s) == 5
+    assert s.to_list() == [4000000, 3000000, 2000000, 1000000, 0]
+    assert type(s.to_list()) is list
+    assert s._data.typecode == 'q'
+
+    assert s.pop() == 4000000
+    assert s.pop() == 3000000
+    assert s.size() == 3
+
+
+def test_typecodes():
+    """Test floats and values the typecode can't hold"""
+    s = TypedStack('d')
+    s.push(1.5)
+    s.push(2)
+    assert s.to_list() == [2.0, 1.5]
+
+    s = TypedStack('b')
+    s.push(127)
+    for bad in [128, 'x', 1.5]:
+        try:
+            s.push(bad)
+            assert False, "Should raise OverflowError or TypeError"
+        except (OverflowError, TypeError):
+            pass
+    assert s.to_list() == [127]
+
+
+def test_batch_operations():
+    """Test push_many, pop_many and drain"""
+    s = TypedStack('i')
+    s.push_many(range(10))
+    assert s.pop_many(0) == []
+    assert s.pop_many(4) == [9, 8, 7, 6]
+    assert s.size() == 6
+    it = s.drain()
+    assert next(it) == 5
+    assert s.size() == 5
+    assert list(it) == [4, 3, 2, 1, 0]
+    assert s.is_empty()
+
+    for k, error in [(1, IndexError), (-1, ValueError)]:
+        try:
+            s.pop_many(k)
+            assert False, "Should raise " + error.__name__
+        except error:
+            pass
+
+    # A failing iterable or a bad value leaves the stack as it was
+    def failing():
+        yield 100
+        raise RuntimeError
+    s.push(1)
+    for values, error in [(failing(), RuntimeError), ([2, 2.5], TypeError), ([2, 2**40], OverflowError)]:
+        try:
+            s.push_many(values)
+            assert False, "Should raise " + error.__name__
+        except error:
+            pass
+        assert s.to_list() == [1]
+    s.push_many(array('i', [2, 3]))
+    assert s.to_list() == [3, 2, 1]
+
+
+if __name__ == "__main__":
+    test_empty_stack()
+    test_push_pop_peek()
+    test_typecodes()
+    test_batch_operations()
+    print("All typed stack tests passed!")
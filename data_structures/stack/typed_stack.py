@@ -0,0 +1,71 @@
+from array import array
+
+
+class TypedStack:
+    """Stack implementation using array.array, for numbers of one C type"""
+
+    def __init__(self, typecode='q'):
+        # values are stored unboxed, e.g. 8 bytes per 'q' int instead of
+        # a pointer to a separate int object
+        self._data = array(typecode)
+
+    def push(self, val):
+        """Add element to top of stack"""
+        self._data.append(val)
+
+    def pop(self):
+        """Remove and return top element. Raise exception if empty."""
+        if not self._data:
+            raise IndexError("pop from empty stack")
+        return self._data.pop()
+
+    def peek(self):
+        """Return top element without removing. Raise exception if empty."""
+        if not self._data:
+            raise IndexError("peek from empty stack")
+        return self._data[-1]
+
+    def push_many(self, iterable):
+        """Add every element of iterable, the last one ends up on top"""
+        # build the whole batch as an array first, so a failing iterable
+        # or a value of the wrong type leaves the stack as it was
+        data = self._data
+        if not (isinstance(iterable, array) and iterable.typecode == data.typecode):
+            iterable = array(data.typecode, iterable)
+        data.extend(iterable)
+
+    def pop_many(self, k):
+        """Remove and return the top k elements, top first. Raise exception if fewer than k."""
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if k > len(self._data):
+            raise IndexError("pop_many from stack with fewer than k elements")
+        if k == 0:
+            return []
+        popped = self._data[:-k - 1:-1].tolist()
+        del self._data[-k:]
+        return popped
+
+    def drain(self):
+        """Lazily remove and yield every element, top first"""
+        data = self._data
+        while data:
+            yield data.pop()
+
+    def is_empty(self):
+        """Return True if stack is empty"""
+        return len(self._data) == 0
+
+    def size(self):
+        """Return number of elements in stack"""
+        return len(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __bool__(self):
+        return len(self._data) > 0
+
+    def to_list(self):
+        """Convert to Python list (top to bottom)"""
+        return self._data[::-1].tolist()